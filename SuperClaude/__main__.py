@@ -13,10 +13,8 @@ Usage:
 
 import sys
 import argparse
-import subprocess
-import difflib
 from pathlib import Path
-from typing import Dict, Callable
+from typing import Dict, Callable, List, Optional
 
 # Add the 'setup' directory to the Python import path (with deprecation-safe logic)
 
@@ -41,6 +39,7 @@ try:
         display_warning, Colors
     )
     from setup.utils.logger import setup_logging, get_logger, LogLevel
+    from setup.utils.profiling import enable_profiling, disable_profiling, span
     from setup import DEFAULT_INSTALL_DIR
 except ImportError:
     # Provide minimal fallback functions and constants if imports fail
@@ -54,6 +53,11 @@ except ImportError:
     def display_header(title, subtitle): print(f"{title} - {subtitle}")
     def get_logger(): return None
     def setup_logging(*args, **kwargs): pass
+    def enable_profiling(*args, **kwargs): return None
+    def disable_profiling(): return None
+    def span(*args, **kwargs):
+        from contextlib import nullcontext
+        return nullcontext({})
     class LogLevel:
         ERROR = 40
         INFO = 20
@@ -76,6 +80,19 @@ def create_global_parser() -> argparse.ArgumentParser:
                                help="Force execution, skipping checks")
     global_parser.add_argument("--yes", "-y", action="store_true",
                                help="Automatically answer yes to all prompts")
+    global_parser.add_argument("--no-progress", action="store_true",
+                               help="Disable the progress bar")
+    global_parser.add_argument("--progress", choices=["bar", "jsonl", "none"], default="bar",
+                               help="Progress output: bar, jsonl (one JSON event per line on stderr, for CI) or none")
+    global_parser.add_argument("--progress-file", type=Path, metavar="FILE",
+                               help="With --progress jsonl, write the events to FILE instead of stderr")
+    global_parser.add_argument("--profile-out", type=Path, metavar="FILE",
+                               help="Write timing spans for this run to FILE")
+    global_parser.add_argument("--profile-format", choices=["chrome", "json"], default="chrome",
+                               help="Profile format: chrome (trace events for chrome://tracing or Perfetto) "
+                                    "or json (spans plus per-span summary)")
+    global_parser.add_argument("--profile-cprofile", action="store_true",
+                               help="With --profile-out, also capture cProfile stats (FILE with a .prof suffix)")
 
     return global_parser
 
@@ -150,10 +167,49 @@ def load_operation_module(name: str):
         return None
 
 
-def register_operation_parsers(subparsers, global_parser) -> Dict[str, Callable]:
-    """Register subcommand parsers and map operation names to their run functions"""
+class _ProbeParser(argparse.ArgumentParser):
+    """Argument parser that raises instead of printing usage and exiting"""
+
+    def error(self, message):
+        raise ValueError(message)
+
+
+def detect_operation(argv: List[str], global_parser: argparse.ArgumentParser) -> Optional[str]:
+    """
+    Find the requested operation without importing any operation module
+
+    argv is parsed against lightweight subparsers that only know the global
+    options, so argparse itself handles option values and abbreviations;
+    the operation's own options are left unparsed. Returns None if there is
+    no operation or argv doesn't parse (the real parser reports the error).
+    """
+    probe = _ProbeParser(add_help=False, parents=[global_parser])
+    subparsers = probe.add_subparsers(dest="operation")
+    for name in get_operation_modules():
+        subparsers.add_parser(name, add_help=False, parents=[global_parser])
+
+    try:
+        args, _ = probe.parse_known_args(argv)
+    except ValueError:
+        return None
+    return args.operation
+
+
+def register_operation_parsers(subparsers, global_parser, selected: Optional[str] = None) -> Dict[str, Callable]:
+    """
+    Register subcommand parsers and map operation names to their run functions
+
+    Only the selected operation's module is imported; the others get a
+    lightweight parser from the static operation table so they still show up
+    in --help.
+    """
     operations = {}
     for name, desc in get_operation_modules().items():
+        if name != selected:
+            subparsers.add_parser(name, help=desc, parents=[global_parser])
+            operations[name] = None
+            continue
+
         module = load_operation_module(name)
         if module and hasattr(module, 'register_parser') and hasattr(module, 'run'):
             module.register_parser(subparsers, global_parser)
@@ -176,6 +232,8 @@ def handle_legacy_fallback(op: str, args: argparse.Namespace) -> int:
 
     display_warning(f"Falling back to legacy script for '{op}'...")
 
+    import subprocess
+
     cmd = [sys.executable, str(script_path)]
 
     # Convert args into CLI flags
@@ -197,9 +255,11 @@ def handle_legacy_fallback(op: str, args: argparse.Namespace) -> int:
 
 def main() -> int:
     """Main entry point"""
+    args = None
     try:
         parser, subparsers, global_parser = create_parser()
-        operations = register_operation_parsers(subparsers, global_parser)
+        selected = detect_operation(sys.argv[1:], global_parser)
+        operations = register_operation_parsers(subparsers, global_parser, selected)
         args = parser.parse_args()
 
         # No operation provided? Show help manually unless in quiet mode
@@ -213,11 +273,16 @@ def main() -> int:
 
         # Handle unknown operations and suggest corrections
         if args.operation not in operations:
+            import difflib
             close = difflib.get_close_matches(args.operation, operations.keys(), n=1)
             suggestion = f"Did you mean: {close[0]}?" if close else ""
             display_error(f"Unknown operation: '{args.operation}'. {suggestion}")
             return 1
 
+        # Spans are only collected when a profile was requested
+        if args.profile_out:
+            enable_profiling(args.profile_cprofile)
+
         # Setup global context (logging, install path, etc.)
         setup_global_environment(args)
         logger = get_logger()
@@ -227,7 +292,8 @@ def main() -> int:
         if run_func:
             if logger:
                 logger.info(f"Executing operation: {args.operation}")
-            return run_func(args)
+            with span(f"cli.{args.operation}", "cli"):
+                return run_func(args)
         else:
             # Fallback to legacy script
             if logger:
@@ -245,6 +311,22 @@ def main() -> int:
         except:
             print(f"{Colors.RED}[ERROR] {e}{Colors.RESET}")
         return 1
+    finally:
+        if args is not None:
+            write_profile(args)
+
+
+def write_profile(args: argparse.Namespace) -> None:
+    """Write the profile requested with --profile-out, if profiling was enabled"""
+    profiler = disable_profiling()
+    if profiler is None:
+        return
+
+    try:
+        written = profiler.write(args.profile_out, args.profile_format)
+        display_info(f"Profile written to {', '.join(str(path) for path in written)}")
+    except OSError as e:
+        display_warning(f"Could not write profile to {args.profile_out}: {e}")
 
 
 # Entrypoint guard
@@ -23,6 +23,7 @@ import json
 import shutil
 import hashlib
 import argparse
+import importlib.util
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 from datetime import datetime
@@ -44,6 +45,9 @@ class TrinitasPatcherV21:
     REQUIRED_SUPERCLAUDE_VERSION = "3.0.0"
     PATCHER_VERSION = "2.1.0"
     
+    # 拡張ディレクトリのコピー時に除外するパターン（gitignore形式、拡張側の.trinitasignoreで追加可能）
+    EXTENSION_IGNORE_PATTERNS = [".git/", "node_modules/", "__pycache__/", "*.pyc", ".pytest_cache/", ".DS_Store"]
+    
     def __init__(self, superclaude_root: str):
         self.root = Path(superclaude_root).resolve()
         
@@ -325,7 +329,7 @@ class TrinitasPatcherV21:
                 shutil.rmtree(target_dir)
             
             # コピー実行
-            shutil.copytree(source_dir, target_dir)
+            shutil.copytree(source_dir, target_dir, ignore=self._extension_ignore(source_dir))
             logger.info(f"Trinitas拡張をコピーしました: {target_dir}")
             
             # Modesディレクトリのコピー
@@ -343,6 +347,43 @@ class TrinitasPatcherV21:
             logger.error(f"Trinitas拡張コピーエラー: {e}")
             return False
     
+    def _extension_ignore(self, source_dir: Path):
+        """拡張コピー用のignoreコールバックを作成（除外ディレクトリの中身は走査しない）"""
+        ignore_file = source_dir / ".trinitasignore"
+        ignore_matcher = self._load_ignore_matcher()
+        if ignore_matcher is not None:
+            matcher = ignore_matcher.from_file(ignore_file, self.EXTENSION_IGNORE_PATTERNS)
+            return matcher.copytree_ignore(source_dir)
+        
+        # フォールバック: 名前のみで判定（パス指定・否定パターンは使えないので警告）
+        patterns = list(self.EXTENSION_IGNORE_PATTERNS)
+        if ignore_file.is_file():
+            for line in ignore_file.read_text(encoding='utf-8').splitlines():
+                line = line.strip()
+                if not line or line.startswith("#"):
+                    continue
+                if line.startswith("!") or "/" in line.strip("/"):
+                    logger.warning(f".trinitasignoreのパターンを無視します（名前のみで判定中）: {line}")
+                    continue
+                patterns.append(line)
+        
+        return shutil.ignore_patterns(*(pattern.strip("/") for pattern in patterns))
+    
+    def _load_ignore_matcher(self):
+        """インストーラー（setup/utils/ignore.py）のgitignore互換マッチャーを読み込む（sys.pathは変更しない）"""
+        ignore_module = self.trinitas_root.parent / "setup" / "utils" / "ignore.py"
+        if not ignore_module.is_file():
+            return None
+        
+        try:
+            spec = importlib.util.spec_from_file_location("superclaude_setup_ignore", ignore_module)
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+            return module.IgnoreMatcher
+        except Exception as e:
+            logger.warning(f"ignoreマッチャーを読み込めません: {e}")
+            return None
+    
     def patch_core_files(self) -> bool:
         """コアファイルにTrinitas統合を適用"""
         try:
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+SuperClaude Logger per-call overhead benchmark
+
+Times the debug calls made for every copied file (see Component._copy_files)
+in the styles the Logger accepts, with DEBUG filtered out (console and file
+at INFO, as on a normal install) and with DEBUG going to the log file.
+
+Usage:
+    python benchmarks/logger_overhead.py
+    python benchmarks/logger_overhead.py --number 200000 --json logger.json
+"""
+
+import argparse
+import json
+import sys
+import tempfile
+import timeit
+from pathlib import Path
+from typing import Dict, Any
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from setup.utils.logger import Logger, LogLevel  # noqa: E402
+
+# Statements timed per call (name and target are set up like the copy loop's)
+CASES = {
+    "f-string": 'logger.debug(f"Copying {name} to {target}")',
+    "%-args": 'logger.debug("Copying %s to %s", name, target)',
+    "callable": 'logger.debug(lambda: f"Copying {name} to {target}")',
+    "is_enabled guard": 'if logger.is_enabled(DEBUG): logger.debug(f"Copying {name} to {target}")',
+    "empty loop": 'pass',
+}
+
+# (console level, file level) per configuration
+CONFIGS = {
+    "debug filtered": (LogLevel.INFO, LogLevel.INFO),
+    "debug to file": (LogLevel.INFO, LogLevel.DEBUG),
+}
+
+
+def benchmark(number: int, repeat: int) -> Dict[str, Any]:
+    """Time every case under every configuration, keeping the best of `repeat` runs"""
+    results = {}
+
+    with tempfile.TemporaryDirectory() as log_dir:
+        for config_name, (console_level, file_level) in CONFIGS.items():
+            logger = Logger(f"bench_{config_name.replace(' ', '_')}", Path(log_dir),
+                            console_level=console_level, file_level=file_level)
+            namespace = {
+                "logger": logger,
+                "DEBUG": LogLevel.DEBUG,
+                "name": "analyze.md",
+                "target": Path(log_dir) / "commands" / "sc" / "analyze.md",
+            }
+
+            results[config_name] = {}
+            for case_name, statement in CASES.items():
+                best = min(timeit.repeat(statement, globals=namespace, number=number, repeat=repeat))
+                results[config_name][case_name] = round(best / number * 1e9, 1)
+
+            logger.shutdown()
+
+    return results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Measure SuperClaude Logger per-call overhead")
+    parser.add_argument("--number", type=int, default=100000, help="Calls per timing run (default: 100000)")
+    parser.add_argument("--repeat", type=int, default=5, help="Timing runs per case (default: 5)")
+    parser.add_argument("--json", type=Path, help="Write results as JSON to this file")
+    args = parser.parse_args()
+
+    results = benchmark(args.number, args.repeat)
+
+    configs = list(results)
+    print(f"{'ns per call':<20}" + "".join(f"{name:>16}" for name in configs))
+    print("-" * (20 + 16 * len(configs)))
+    for case_name in CASES:
+        print(f"{case_name:<20}" + "".join(f"{results[name][case_name]:>16.1f}" for name in configs))
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump({
+                "python": sys.version.split()[0],
+                "number": args.number,
+                "repeat": args.repeat,
+                "results_ns": results
+            }, f, indent=2)
+        print(f"\nResults written to {args.json}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
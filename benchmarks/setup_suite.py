@@ -0,0 +1,360 @@
+#!/usr/bin/env python3
+"""
+SuperClaude setup package benchmark suite
+
+Generates a synthetic component (configurable file count and size) plus
+existing backups, then times the installer's main operations against it:
+install, update, uninstall, backup create/list/restore, validation,
+component discovery and security validation of the file list. Everything
+runs in a temporary HOME below --work-dir, so the real ~/.claude is never
+touched.
+
+Results can be written as JSON and compared against an earlier run to catch
+regressions between commits.
+
+Usage:
+    python benchmarks/setup_suite.py
+    python benchmarks/setup_suite.py --files 2000 --file-size 8192 --backups 20
+    python benchmarks/setup_suite.py --json after.json --compare before.json
+    python benchmarks/setup_suite.py --only install update
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from setup.base.component import Component  # noqa: E402
+from setup.base.installer import Installer  # noqa: E402
+from setup.core.registry import ComponentRegistry  # noqa: E402
+from setup.managers.backup_manager import BackupManager  # noqa: E402
+from setup.utils.logger import LogLevel, setup_logging  # noqa: E402
+from setup.utils.security import SecurityValidator  # noqa: E402
+
+
+class SyntheticComponent(Component):
+    """Component installing generated .md files into <install_dir>/synthetic"""
+
+    # Set by the suite before components are created
+    source_dir: Optional[Path] = None
+
+    def __init__(self, install_dir: Optional[Path] = None):
+        super().__init__(install_dir, Path("synthetic"))
+
+    def get_metadata(self) -> Dict[str, str]:
+        return {
+            "name": "synthetic",
+            "version": "1.0.0",
+            "description": "Generated benchmark files",
+            "category": "benchmark"
+        }
+
+    def _install(self, config: Dict[str, Any]) -> bool:
+        return super()._install(config)
+
+    def _post_install(self) -> bool:
+        self.settings_manager.add_component_registration("synthetic", {
+            "version": "1.0.0",
+            "category": "benchmark",
+            "files_count": len(self.component_files)
+        })
+        return True
+
+    def uninstall(self) -> bool:
+        for _, target in self.get_files_to_install():
+            self.file_manager.remove_file(target)
+        self.manifest_manager.remove_component("synthetic")
+        self.settings_manager.remove_component_registration("synthetic")
+        return True
+
+    def get_dependencies(self) -> List[str]:
+        return []
+
+    def _get_source_dir(self) -> Optional[Path]:
+        return self.source_dir
+
+
+class Suite:
+    """Synthetic trees and the timed operations that run against them"""
+
+    def __init__(self, work_dir: Path, files: int, file_size: int, backups: int, changed: float):
+        """
+        Initialize suite
+
+        Args:
+            work_dir: Temporary directory used as HOME
+            files: Files in the synthetic component
+            file_size: Bytes per file
+            backups: Existing backups to create before the backup benchmarks
+            changed: Fraction of source files modified before each update run
+        """
+        self.work_dir = work_dir
+        self.files = files
+        self.file_size = file_size
+        self.backups = backups
+        self.changed = changed
+        self.source_dir = work_dir / "source"
+        self._runs = 0
+        self._revision = 0
+
+    def generate_source(self) -> None:
+        """Write the synthetic component's source files"""
+        self.source_dir.mkdir(parents=True, exist_ok=True)
+        line = b"Synthetic SuperClaude benchmark content line.\n"
+        body = (line * (self.file_size // len(line) + 1))[:self.file_size]
+
+        for i in range(self.files):
+            (self.source_dir / f"FILE_{i:06d}.md").write_bytes(body)
+
+        SyntheticComponent.source_dir = self.source_dir
+
+    def modify_sources(self) -> None:
+        """Rewrite the configured fraction of source files so an update has work to do"""
+        self._revision += 1
+        count = max(1, int(self.files * self.changed)) if self.changed > 0 else 0
+        for i in range(count):
+            path = self.source_dir / f"FILE_{i:06d}.md"
+            content = path.read_bytes()
+            path.write_bytes(f"rev {self._revision:08d}\n".encode() + content[13:])
+
+    def new_install_dir(self) -> Path:
+        """Get a fresh installation directory (not created; its parent is, like a home directory)"""
+        self._runs += 1
+        home = self.work_dir / f"install_{self._runs:04d}"
+        home.mkdir()
+        return home / ".claude"
+
+    def install(self, install_dir: Path, operation: str = "install") -> Installer:
+        """Install the synthetic component the way `SuperClaude install` does"""
+        installer = Installer(install_dir)
+        installer.register_components([SyntheticComponent(install_dir)])
+        config = {
+            "force": False,
+            "backup": False,
+            "dry_run": False,
+            "incremental": True,
+            "link": False,
+            "operation": operation
+        }
+        if not installer.install_components(["synthetic"], config):
+            raise RuntimeError(f"Synthetic {operation} failed in {install_dir}")
+        return installer
+
+    def installed_dir(self) -> Path:
+        """Get a fresh installation directory with the synthetic component installed"""
+        install_dir = self.new_install_dir()
+        self.install(install_dir)
+        return install_dir
+
+    def with_backups(self) -> Tuple[Path, BackupManager]:
+        """Get an installation with the configured number of existing backups"""
+        install_dir = self.installed_dir()
+        manager = BackupManager(install_dir)
+        for i in range(self.backups):
+            manager.create_backup(name=f"bench_{i:04d}")
+        return install_dir, manager
+
+    def cases(self) -> Dict[str, Tuple[Callable[[], Any], Callable[[Any], Any]]]:
+        """
+        Get benchmark cases
+
+        Returns:
+            Dict of case name -> (setup, timed function taking setup's result)
+        """
+        def fresh_restore_target() -> Tuple[BackupManager, Path]:
+            install_dir, manager = self.with_backups()
+            backup = manager.create_backup(name="restore_source")["path"]
+            shutil.rmtree(install_dir / "synthetic")
+            return manager, backup
+
+        def updated_tree() -> Path:
+            install_dir = self.installed_dir()
+            self.modify_sources()
+            return install_dir
+
+        def installed_component() -> Component:
+            return SyntheticComponent(self.installed_dir())
+
+        def file_list() -> Tuple[List[Tuple[Path, Path]], Path, Path]:
+            component = SyntheticComponent(self.new_install_dir())
+            return component.get_files_to_install(), self.source_dir, component.install_component_subdir
+
+        return {
+            "install": (self.new_install_dir, lambda install_dir: self.install(install_dir)),
+            "update (unchanged)": (self.installed_dir, lambda install_dir: self.install(install_dir, "update")),
+            "update (changed)": (updated_tree, lambda install_dir: self.install(install_dir, "update")),
+            "uninstall": (installed_component, lambda component: component.uninstall()),
+            "backup create": (lambda: BackupManager(self.installed_dir()),
+                              lambda manager: manager.create_backup()),
+            "backup create incremental": (lambda: BackupManager(self.installed_dir()),
+                                          lambda manager: manager.create_incremental_backup()),
+            "backup list": (lambda: self.with_backups()[1], lambda manager: manager.list_backups()),
+            "backup restore": (fresh_restore_target,
+                               lambda target: target[0].restore_backup(target[1], overwrite=True)),
+            "validate_installation": (installed_component, lambda component: component.validate_installation()),
+            "validate_installation_fast": (installed_component,
+                                           lambda component: component.validate_installation_fast()),
+            "discover_components": (lambda: ComponentRegistry(PROJECT_ROOT / "setup" / "components"),
+                                    lambda registry: registry.discover_components(force_reload=True)),
+            "validate_component_files": (file_list,
+                                         lambda args: SecurityValidator.validate_component_files(*args)),
+        }
+
+
+def time_case(setup: Callable[[], Any], func: Callable[[Any], Any], repeat: int) -> List[float]:
+    """Run setup then func `repeat` times, timing only func"""
+    timings = []
+    for _ in range(repeat):
+        # The installer and components report progress with print()
+        with contextlib.redirect_stdout(io.StringIO()):
+            state = setup()
+            start = time.perf_counter()
+            func(state)
+            timings.append(time.perf_counter() - start)
+    return timings
+
+
+def git_revision() -> Optional[str]:
+    """Get the current commit, if the tree is a git checkout"""
+    try:
+        result = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=PROJECT_ROOT,
+                                capture_output=True, text=True, timeout=10)
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+    return result.stdout.strip() or None
+
+
+def benchmark(args: argparse.Namespace) -> Dict[str, Any]:
+    """Generate the synthetic trees and run every selected case"""
+    results = {}
+
+    # The security validator rejects installs under system directories such as /tmp
+    args.work_dir.mkdir(parents=True, exist_ok=True)
+
+    with tempfile.TemporaryDirectory(prefix="superclaude_bench_", dir=args.work_dir) as home:
+        # Installs must target a directory under the user's home
+        previous_home = os.environ.get("HOME")
+        os.environ["HOME"] = home
+        try:
+            setup_logging("superclaude", log_dir=Path(home) / "logs",
+                          console_level=LogLevel.CRITICAL, file_level=LogLevel.WARNING)
+
+            suite = Suite(Path(home), args.files, args.file_size, args.backups, args.changed)
+            suite.generate_source()
+
+            for name, (setup, func) in suite.cases().items():
+                if args.only and name.split(" ")[0] not in args.only and name not in args.only:
+                    continue
+
+                timings = time_case(setup, func, args.repeat)
+                results[name] = {
+                    "min_ms": round(min(timings) * 1000, 3),
+                    "median_ms": round(statistics.median(timings) * 1000, 3),
+                    "mean_ms": round(statistics.mean(timings) * 1000, 3),
+                    "runs": len(timings)
+                }
+        finally:
+            if previous_home is None:
+                os.environ.pop("HOME", None)
+            else:
+                os.environ["HOME"] = previous_home
+
+    return results
+
+
+def compare(results: Dict[str, Any], baseline_file: Path, threshold: float) -> int:
+    """
+    Print the change against a previous run
+
+    Returns:
+        Number of cases slower than baseline by more than threshold
+    """
+    with open(baseline_file, 'r') as f:
+        baseline = json.load(f)
+
+    print(f"\nCompared with {baseline_file} ({baseline.get('git_revision') or 'unknown revision'}):")
+    if baseline.get("parameters") != results["parameters"]:
+        print(f"  Note: parameters differ ({baseline.get('parameters')})")
+
+    regressions = 0
+    for name, result in results["results"].items():
+        before = baseline.get("results", {}).get(name)
+        if not before or not before["median_ms"]:
+            print(f"  {name:<28} (no baseline)")
+            continue
+
+        ratio = result["median_ms"] / before["median_ms"]
+        flag = ""
+        if ratio > threshold:
+            flag = "  REGRESSION"
+            regressions += 1
+        print(f"  {name:<28} {before['median_ms']:>10.2f} -> {result['median_ms']:>10.2f} ms  x{ratio:.2f}{flag}")
+
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the SuperClaude setup package")
+    parser.add_argument("--files", type=int, default=500, help="Files in the synthetic component (default: 500)")
+    parser.add_argument("--file-size", type=int, default=4096, help="Bytes per file (default: 4096)")
+    parser.add_argument("--backups", type=int, default=5, help="Existing backups for the backup cases (default: 5)")
+    parser.add_argument("--changed", type=float, default=0.1,
+                        help="Fraction of files modified before 'update (changed)' (default: 0.1)")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per case (default: 5)")
+    parser.add_argument("--only", nargs="+", metavar="CASE",
+                        help="Only run these cases (a first word such as 'backup' selects a group)")
+    parser.add_argument("--work-dir", type=Path, default=Path.home() / ".cache" / "superclaude-bench",
+                        help="Where the temporary trees are created (default: ~/.cache/superclaude-bench)")
+    parser.add_argument("--json", type=Path, help="Write results as JSON to this file")
+    parser.add_argument("--compare", type=Path, metavar="BASELINE",
+                        help="Compare with a previous --json output")
+    parser.add_argument("--threshold", type=float, default=1.25,
+                        help="Slowdown ratio reported as a regression with --compare (default: 1.25)")
+    args = parser.parse_args()
+
+    results = {
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "git_revision": git_revision(),
+        "parameters": {
+            "files": args.files,
+            "file_size": args.file_size,
+            "backups": args.backups,
+            "changed": args.changed,
+            "repeat": args.repeat
+        },
+        "results": benchmark(args)
+    }
+
+    print(f"{args.files} files x {args.file_size} bytes, {args.backups} backups, {args.repeat} runs\n")
+    print(f"{'Case':<28} {'Min ms':>10} {'Median ms':>10} {'Mean ms':>10}")
+    print("-" * 61)
+    for name, result in results["results"].items():
+        print(f"{name:<28} {result['min_ms']:>10.2f} {result['median_ms']:>10.2f} {result['mean_ms']:>10.2f}")
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(results, f, indent=2)
+        print(f"\nResults written to {args.json}")
+
+    if args.compare:
+        return 1 if compare(results, args.compare, args.threshold) else 0
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
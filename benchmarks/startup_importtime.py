@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+SuperClaude CLI startup benchmark
+
+Runs each subcommand under `python -X importtime` and reports wall time,
+total import time and the most expensive imports.
+
+Usage:
+    python benchmarks/startup_importtime.py
+    python benchmarks/startup_importtime.py --repeat 10 --json startup.json
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Any
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+# Subcommand invocations to measure ({install_dir} is replaced at runtime)
+CASES = {
+    "--version": ["--version"],
+    "--help": ["--help"],
+    "install --help": ["install", "--help"],
+    "update --help": ["update", "--help"],
+    "uninstall --help": ["uninstall", "--help"],
+    "backup --help": ["backup", "--help"],
+    "backup --list": ["backup", "--list", "--quiet", "--install-dir", "{install_dir}"],
+}
+
+
+def parse_importtime(stderr: str) -> List[Dict[str, Any]]:
+    """Parse `-X importtime` output into a list of {module, self_us, cumulative_us}"""
+    imports = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) != 3:
+            continue
+        imports.append({
+            "module": fields[2].strip(),
+            "self_us": int(fields[0]),
+            "cumulative_us": int(fields[1])
+        })
+    return imports
+
+
+def run_case(args: List[str], env: Dict[str, str]) -> Dict[str, Any]:
+    """Run one CLI invocation under -X importtime"""
+    command = [sys.executable, "-X", "importtime", "-m", "SuperClaude"] + args
+
+    start = time.perf_counter()
+    result = subprocess.run(command, cwd=PROJECT_ROOT, env=env,
+                            stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+    wall_ms = (time.perf_counter() - start) * 1000
+
+    imports = parse_importtime(result.stderr)
+    return {
+        "returncode": result.returncode,
+        "wall_ms": wall_ms,
+        "import_ms": sum(i["self_us"] for i in imports) / 1000,
+        "modules": len(imports),
+        "imports": imports
+    }
+
+
+def benchmark(repeat: int, top: int) -> Dict[str, Any]:
+    """Run every case `repeat` times and keep the median run"""
+    results = {}
+
+    with tempfile.TemporaryDirectory() as home:
+        # Operations require the install dir to live under the user's home
+        env = dict(os.environ, HOME=home, USERPROFILE=home)
+        install_dir = str(Path(home) / ".claude")
+
+        for name, case_args in CASES.items():
+            case_args = [arg.format(install_dir=install_dir) for arg in case_args]
+            runs = [run_case(case_args, env) for _ in range(repeat)]
+            runs.sort(key=lambda r: r["import_ms"])
+            median = runs[len(runs) // 2]
+
+            project_imports = [i for i in median["imports"]
+                               if i["module"].split(".")[0] in ("setup", "SuperClaude")]
+            slowest = sorted(median["imports"], key=lambda i: i["self_us"], reverse=True)[:top]
+
+            results[name] = {
+                "returncode": median["returncode"],
+                "wall_ms": round(statistics.median(r["wall_ms"] for r in runs), 2),
+                "import_ms": round(median["import_ms"], 2),
+                "modules": median["modules"],
+                "project_modules": len(project_imports),
+                "slowest": [(i["module"], i["self_us"]) for i in slowest]
+            }
+
+    return results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Measure SuperClaude CLI startup import time")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per subcommand (default: 5)")
+    parser.add_argument("--top", type=int, default=5, help="Slowest imports to show (default: 5)")
+    parser.add_argument("--json", type=Path, help="Write results as JSON to this file")
+    args = parser.parse_args()
+
+    results = benchmark(args.repeat, args.top)
+
+    print(f"{'Command':<20} {'Wall ms':>9} {'Import ms':>10} {'Modules':>8} {'Project':>8}")
+    print("-" * 59)
+    for name, result in results.items():
+        print(f"{name:<20} {result['wall_ms']:>9.1f} {result['import_ms']:>10.1f} "
+              f"{result['modules']:>8} {result['project_modules']:>8}")
+
+    print("\nSlowest imports (self time):")
+    for name, result in results.items():
+        slowest = ", ".join(f"{module} {us / 1000:.1f}ms" for module, us in result["slowest"])
+        print(f"  {name:<20} {slowest}")
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump({
+                "python": sys.version.split()[0],
+                "repeat": args.repeat,
+                "results": results
+            }, f, indent=2)
+        print(f"\nResults written to {args.json}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -6,6 +6,7 @@ Pure Python installation system for SuperClaude framework
 __version__ = "3.0.0"
 __author__ = "SuperClaude Team"
 
+import os
 from pathlib import Path
 
 # Core paths
@@ -15,4 +16,7 @@ CONFIG_DIR = PROJECT_ROOT / "config"
 PROFILES_DIR = PROJECT_ROOT / "profiles"
 
 # Installation target
-DEFAULT_INSTALL_DIR = Path.home() / ".claude"
\ No newline at end of file
+DEFAULT_INSTALL_DIR = Path.home() / ".claude"
+
+# Per-user cache directory (tool probe results, component discovery)
+CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "superclaude"
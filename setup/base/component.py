@@ -8,8 +8,11 @@ from pathlib import Path
 import json
 from ..managers.file_manager import FileManager
 from ..managers.settings_manager import SettingsManager
+from ..managers.manifest_manager import ManifestManager
+from ..managers.journal_manager import JournalManager
 from ..utils.logger import get_logger
 from ..utils.security import SecurityValidator
+from ..utils.walker import walk
 
 
 class Component(ABC):
@@ -25,6 +28,7 @@ class Component(ABC):
         from .. import DEFAULT_INSTALL_DIR
         self.install_dir = install_dir or DEFAULT_INSTALL_DIR
         self.settings_manager = SettingsManager(self.install_dir)
+        self.manifest_manager = ManifestManager(self.install_dir)
         self.logger = get_logger()
         self.component_files = self._discover_component_files()
         self.file_manager = FileManager()
@@ -127,11 +131,37 @@ class Component(ABC):
     
     def install(self, config: Dict[str, Any]) -> bool:
         try:
-            return self._install(config)
+            success = self._install(config)
         except Exception as e:
             self.logger.exception(f"Unexpected error during {repr(self)} installation: {e}")
             return False
 
+        if success and not config.get("dry_run", False):
+            self._record_manifest()
+
+        return success
+
+    def get_installed_files(self) -> List[Path]:
+        """
+        Return files this component has placed in the installation directory
+        
+        Returns:
+            List of installed file paths (used for the install manifest)
+        """
+        return [target for _, target in self.get_files_to_install() if target.is_file()]
+
+    def _record_manifest(self) -> None:
+        """Record installed files in the install manifest"""
+        metadata = self.get_metadata()
+        try:
+            self.manifest_manager.record_component(
+                metadata["name"], metadata["version"], self.get_installed_files(),
+                self.file_manager.install_methods
+            )
+        except Exception as e:
+            # The manifest only speeds up validation, never fail an install over it
+            self.logger.warning(f"Could not update install manifest: {e}")
+
     @abstractmethod
     def _install(self, config: Dict[str, Any]) -> bool:
         """
@@ -153,25 +183,64 @@ class Component(ABC):
         # Get files to install
         files_to_install = self.get_files_to_install()
 
-        # Copy framework files
-        success_count = 0
-        for source, target in files_to_install:
-            self.logger.debug(f"Copying {source.name} to {target}")
-
-            if self.file_manager.copy_file(source, target):
-                success_count += 1
-                self.logger.debug(f"Successfully copied {source.name}")
-            else:
-                self.logger.error(f"Failed to copy {source.name}")
+        # Copy framework files (unchanged files are skipped in incremental mode)
+        success_count = self._copy_files(files_to_install, config)
 
         if success_count != len(files_to_install):
             self.logger.error(f"Only {success_count}/{len(files_to_install)} files copied successfully")
             return False
 
-        self.logger.success(f"{repr(self)} component installed successfully ({success_count} files)")
+        skipped_count = len(self.file_manager.skipped_files)
+        if skipped_count:
+            self.logger.success(f"{repr(self)} component installed successfully ({success_count} files, {skipped_count} unchanged)")
+        else:
+            self.logger.success(f"{repr(self)} component installed successfully ({success_count} files)")
 
         return self._post_install()
 
+    def _copy_files(self, files_to_install: List[Tuple[Path, Path]], config: Dict[str, Any]) -> int:
+        """
+        Copy (or, with config["link"], reflink/hard link) component files to their targets
+        
+        Args:
+            files_to_install: List of (source, target) tuples
+            config: Installation configuration ("incremental" defaults to True)
+            
+        Returns:
+            Number of files that are up to date afterwards
+        """
+        incremental = config.get("incremental", True)
+        link = config.get("link", False)
+        previous_methods = self._get_install_methods() if link else {}
+        success_count = 0
+
+        for source, target in files_to_install:
+            self.logger.debug("Copying %s to %s", source.name, target)
+
+            if link:
+                copied = self.file_manager.link_file(source, target, previous_methods.get(target))
+            elif incremental:
+                copied = self.file_manager.sync_file(source, target)
+            else:
+                copied = self.file_manager.copy_file(source, target)
+
+            if copied:
+                success_count += 1
+                self.logger.debug("Successfully copied %s", source.name)
+            else:
+                self.logger.error(f"Failed to copy {source.name}")
+
+        return success_count
+
+    def _get_install_methods(self) -> Dict[Path, str]:
+        """
+        Get how each installed file was placed, as recorded in the install manifest
+        
+        Returns:
+            Dict of installed file path -> "copy", "hardlink" or "reflink"
+        """
+        entries = self.manifest_manager.get_component_files(self.get_metadata()["name"])
+        return {self.install_dir / rel_path: entry.get("method", "copy") for rel_path, entry in entries.items()}
     
     @abstractmethod
     def _post_install(self) -> bool:
@@ -218,6 +287,40 @@ class Component(ABC):
             return self.install(config)
         return False
     
+    def _journaled_install(self, config: Dict[str, Any]) -> bool:
+        """
+        Install under the active journal (or a journal of its own), undoing
+        this component's changes if the installation fails
+        
+        Args:
+            config: Installation configuration
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        name = self.get_metadata()["name"]
+        journal = JournalManager.get_active(self.install_dir)
+        owned = journal is None
+
+        if owned:
+            journal = JournalManager(self.install_dir)
+            if journal.has_pending():
+                self.logger.warning("Rolling back an interrupted operation...")
+                journal.recover()
+            journal.begin("update", [name])
+
+        success = False
+        try:
+            with journal.component(name):
+                success = self.install(config)
+        finally:
+            if not success:
+                journal.rollback(name)
+            if owned:
+                journal.commit()
+
+        return success
+    
     def get_installed_version(self) -> Optional[str]:
         """
         Get currently installed version of component
@@ -267,6 +370,53 @@ class Component(ABC):
             errors.append("Component not registered in settings.json")
         
         return len(errors) == 0, errors
+
+    def validate_installation_fast(self) -> Tuple[bool, List[str]]:
+        """
+        Validate installation against the install manifest
+        
+        Only stats recorded files and hashes those whose mtime changed, then
+        runs the metadata checks of validate_registration(). Falls back to
+        validate_installation() if the component isn't in the manifest or
+        recorded no files (e.g. MCP, whose checks aren't about files).
+        
+        Returns:
+            Tuple of (success: bool, error_messages: List[str])
+        """
+        metadata = self.get_metadata()
+        manifest = self.manifest_manager.load_manifest()
+
+        has_files = any(entry.get("component") == metadata["name"] for entry in manifest["files"].values())
+        if metadata["name"] not in manifest["components"] or not has_files:
+            return self.validate_installation()
+
+        _, errors = self.manifest_manager.verify_component(
+            metadata["name"], metadata["version"], manifest
+        )
+        errors.extend(error for error in self.validate_registration() if error not in errors)
+        return len(errors) == 0, errors
+
+    def validate_registration(self) -> List[str]:
+        """
+        Check the component's metadata registration and version
+        
+        Components whose validate_installation() checks more metadata than
+        this override it, so validate_installation_fast() checks it too.
+        
+        Returns:
+            List of error messages (empty if valid)
+        """
+        errors = []
+        metadata = self.get_metadata()
+
+        if not self.settings_manager.is_component_installed(metadata["name"]):
+            errors.append(f"{metadata['name'].capitalize()} component not registered in metadata")
+        else:
+            installed_version = self.settings_manager.get_component_version(metadata["name"])
+            if installed_version != metadata["version"]:
+                errors.append(f"Version mismatch: installed {installed_version}, expected {metadata['version']}")
+
+        return errors
     
     def get_size_estimate(self) -> int:
         """
@@ -275,15 +425,33 @@ class Component(ABC):
         Returns:
             Estimated size in bytes
         """
-        total_size = 0
+        # Group sources by parent so each directory is scanned once;
+        # directory sources are counted with everything below them
+        by_directory: Dict[Path, set] = {}
         for source, _ in self.get_files_to_install():
-            if source.exists():
-                if source.is_file():
-                    total_size += source.stat().st_size
-                elif source.is_dir():
-                    total_size += sum(f.stat().st_size for f in source.rglob('*') if f.is_file())
+            by_directory.setdefault(source.parent, set()).add(source.name)
+
+        total_size = 0
+        for directory, names in by_directory.items():
+            selected = walk(directory, ignore=lambda rel_path, is_dir: rel_path.split("/", 1)[0] not in names,
+                            collect=False)
+            total_size += selected.total_size
         return total_size
 
+    def _get_files_size(self, directory: Path, filenames: List[str]) -> int:
+        """
+        Get total size of files in a directory with a single scan
+        
+        Args:
+            directory: Directory containing the files
+            filenames: Names of files to count (missing files count as 0)
+            
+        Returns:
+            Total size in bytes
+        """
+        wanted = set(filenames)
+        return walk(directory, ignore=lambda rel_path, is_dir: is_dir or rel_path not in wanted, collect=False).total_size
+
     def _discover_component_files(self) -> List[str]:
         """
         Dynamically discover framework .md files in the Core directory
@@ -338,9 +506,9 @@ class Component(ABC):
             # Sort for consistent ordering
             files.sort()
 
-            self.logger.debug(f"Discovered {len(files)} {extension} files in {directory}")
+            self.logger.debug("Discovered %d %s files in %s", len(files), extension, directory)
             if files:
-                self.logger.debug(f"Files found: {files}")
+                self.logger.debug("Files found: %s", files)
 
             return files
 
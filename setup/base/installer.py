@@ -2,37 +2,62 @@
 Base installer logic for SuperClaude installation system fixed some issues
 """
 
-from typing import List, Dict, Optional, Set, Tuple, Any
+from typing import List, Dict, Optional, Set, Tuple, Any, Iterator
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 import shutil
-import tempfile
-from datetime import datetime
+import threading
+import time
 from .component import Component
+from ..core.dependency_graph import DependencyGraph
+from ..managers.backup_manager import BackupManager
+from ..managers.journal_manager import JournalManager
+from ..utils.profiling import span, timed
+from ..utils.progress import ProgressCallback, make_event
 
 
 class Installer:
     """Main installer orchestrator"""
 
+    # Progress event wording per operation
+    PROGRESS_ACTIONS = {"install": "installing", "update": "updating"}
+    PROGRESS_STATUSES = {"install": "installed", "update": "updated"}
+
     def __init__(self,
                  install_dir: Optional[Path] = None,
-                 dry_run: bool = False):
+                 dry_run: bool = False,
+                 parallel: bool = False,
+                 max_workers: Optional[int] = None,
+                 progress_callback: Optional[ProgressCallback] = None):
         """
         Initialize installer
         
         Args:
             install_dir: Target installation directory
             dry_run: If True, only simulate installation
+            parallel: If True, install each dependency level on a thread pool
+            max_workers: Maximum worker threads per level (defaults to level size)
+            progress_callback: Called with progress events (see setup.utils.progress);
+                may be called from worker threads when parallel
         """
         from .. import DEFAULT_INSTALL_DIR
         self.install_dir = install_dir or DEFAULT_INSTALL_DIR
         self.dry_run = dry_run
+        self.parallel = parallel
+        self.max_workers = max_workers
         self.components: Dict[str, Component] = {}
+        self.dependency_graph = DependencyGraph()
         self.installed_components: Set[str] = set()
         self.updated_components: Set[str] = set()
 
         self.failed_components: Set[str] = set()
         self.skipped_components: Set[str] = set()
         self.backup_path: Optional[Path] = None
+        self.journal: Optional[JournalManager] = None
+        self.rolled_back_components: Set[str] = set()
+        self.progress_callback = progress_callback
+        self._state_lock = threading.Lock()
 
     def register_component(self, component: Component) -> None:
         """
@@ -43,6 +68,7 @@ class Installer:
         """
         metadata = component.get_metadata()
         self.components[metadata['name']] = component
+        self.dependency_graph.add_node(metadata['name'], component.get_dependencies())
 
     def register_components(self, components: List[Component]) -> None:
         """
@@ -67,34 +93,20 @@ class Installer:
         Raises:
             ValueError: If circular dependencies detected or unknown component
         """
-        resolved = []
-        resolving = set()
-
-        def resolve(name: str):
-            if name in resolved:
-                return
-
-            if name in resolving:
-                raise ValueError(
-                    f"Circular dependency detected involving {name}")
-
-            if name not in self.components:
-                raise ValueError(f"Unknown component: {name}")
-
-            resolving.add(name)
-
-            # Resolve dependencies first
-            for dep in self.components[name].get_dependencies():
-                resolve(dep)
-
-            resolving.remove(name)
-            resolved.append(name)
-
-        # Resolve each requested component
-        for name in component_names:
-            resolve(name)
+        return self.dependency_graph.resolve(component_names)
 
-        return resolved
+    def get_installation_levels(self, ordered_names: List[str]) -> List[List[str]]:
+        """
+        Group resolved components into dependency levels
+        
+        Args:
+            ordered_names: Component names in dependency order
+            
+        Returns:
+            List of levels; components within a level have no dependencies
+            on each other and can be installed in parallel
+        """
+        return self.dependency_graph.levels(ordered_names)
 
     def validate_system_requirements(self) -> Tuple[bool, List[str]]:
         """
@@ -127,12 +139,13 @@ class Installer:
 
         return len(errors) == 0, errors
 
+    @timed("installer.backup", "backup")
     def create_backup(self) -> Optional[Path]:
         """
         Create backup of existing installation
         
         Returns:
-            Path to backup archive or None if no existing installation
+            Path to backup manifest or None if no existing installation
         """
         if not self.install_dir.exists():
             return None
@@ -140,44 +153,16 @@ class Installer:
         if self.dry_run:
             return self.install_dir / "backup_dryrun.tar.gz"
 
-        # Create backup directory
-        backup_dir = self.install_dir / "backups"
-        backup_dir.mkdir(exist_ok=True)
-
-        # Create timestamped backup
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        backup_name = f"superclaude_backup_{timestamp}"
-        backup_path = backup_dir / f"{backup_name}.tar.gz"
-
-        # Create temporary directory for backup
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_backup = Path(temp_dir) / backup_name
-
-            # Ensure temp backup directory exists
-            temp_backup.mkdir(parents=True, exist_ok=True)
-
-            # Copy all files except backups directory
-            for item in self.install_dir.iterdir():
-                if item.name != "backups":
-                    try:
-                        if item.is_file():
-                            shutil.copy2(item, temp_backup / item.name)
-                        elif item.is_dir():
-                            shutil.copytree(item, temp_backup / item.name)
-                    except Exception as e:
-                        # Log warning but continue backup process
-                        print(f"Warning: Could not backup {item.name}: {e}")
-
-            # Create archive only if there are files to backup
-            if any(temp_backup.iterdir()):
-                shutil.make_archive(backup_path.with_suffix(''), 'gztar',
-                                    temp_dir, backup_name)
-            else:
-                # Create empty backup file to indicate backup was attempted
-                backup_path.touch()
-                print(
-                    f"Warning: No files to backup, created empty backup marker: {backup_path.name}"
-                )
+        # Incremental: only content not already in backups/objects is stored
+        backup_manager = BackupManager(self.install_dir)
+        result = backup_manager.create_incremental_backup()
+        backup_path = result["path"]
+
+        for skipped in result["skipped"]:
+            print(f"Warning: Could not backup {skipped}")
+
+        if result["files"] == 0:
+            print(f"Warning: No files to backup, created empty backup: {backup_path.name}")
 
         self.backup_path = backup_path
         return backup_path
@@ -203,36 +188,70 @@ class Installer:
         if component_name in self.installed_components:
             return True
 
-        # Check prerequisites
-        success, errors = component.validate_prerequisites()
-        if not success:
-            print(f"Prerequisites failed for {component_name}:")
-            for error in errors:
-                print(f"  - {error}")
-            self.failed_components.add(component_name)
-            return False
-
-        # Perform installation
+        operation = config.get("operation", "install")
+        self._emit("component_start", component=component_name, action=self.PROGRESS_ACTIONS.get(operation, operation))
+        started = time.time()
+        file_manager = component.file_manager
+        copied_before = len(file_manager.copied_files)
+        skipped_before = len(file_manager.skipped_files)
+        bytes_before = file_manager.bytes_written
+
+        # Prerequisite checks may create directories, so they run under the journal too
+        success = False
+        errors: List[str] = []
         try:
-            if self.dry_run:
-                print(f"[DRY RUN] Would install {component_name}")
-                success = True
-            else:
-                success = component.install(config)
-
-            if success:
-                self.installed_components.add(component_name)
-                self.updated_components.add(component_name)
-            else:
-                self.failed_components.add(component_name)
+            with self._journal_scope(component_name), \
+                    span(f"component.{operation}", "component", component=component_name) as span_args:
+                # Check prerequisites
+                with span("component.prerequisites", "component", component=component_name):
+                    prerequisites_ok, errors = component.validate_prerequisites()
+                if not prerequisites_ok:
+                    print(f"Prerequisites failed for {component_name}:")
+                    for error in errors:
+                        print(f"  - {error}")
+                    with self._state_lock:
+                        self.failed_components.add(component_name)
+                    return False
+
+                # Perform installation
+                if self.dry_run:
+                    print(f"[DRY RUN] Would install {component_name}")
+                    success = True
+                else:
+                    success = component.install(config)
+                span_args["success"] = success
+
+            with self._state_lock:
+                if success:
+                    self.installed_components.add(component_name)
+                    self.updated_components.add(component_name)
+                else:
+                    self.failed_components.add(component_name)
 
             return success
 
         except Exception as e:
             print(f"Error installing {component_name}: {e}")
-            self.failed_components.add(component_name)
+            errors = [str(e)]
+            with self._state_lock:
+                self.failed_components.add(component_name)
             return False
 
+        finally:
+            if not success:
+                self._roll_back_component(component_name)
+
+            self._emit(
+                "component_end",
+                component=component_name,
+                status=self.PROGRESS_STATUSES.get(operation, "done") if success else "failed",
+                files_copied=len(file_manager.copied_files) - copied_before,
+                files_skipped=len(file_manager.skipped_files) - skipped_before,
+                bytes_written=file_manager.bytes_written - bytes_before,
+                duration=time.time() - started,
+                errors=[] if success else list(errors)
+            )
+
     def install_components(self,
                            component_names: List[str],
                            config: Optional[Dict[str, Any]] = None) -> bool:
@@ -263,24 +282,141 @@ class Installer:
                 print(f"  - {error}")
             return False
 
-        # Create backup if updating
-        if self.install_dir.exists() and not self.dry_run:
+        started = time.time()
+        self._emit("operation_start", operation=config.get("operation", "install"),
+                   components=ordered_names, total=len(ordered_names))
+
+        # A full backup is only made on request; every change is journaled instead
+        if config.get("backup") and self.install_dir.exists() and not self.dry_run:
             print("Creating backup of existing installation...")
             self.create_backup()
 
+        if not self.dry_run:
+            self._open_journal(config.get("operation", "install"), ordered_names, config.get("resume", False))
+
         # Install each component
         all_success = True
-        for name in ordered_names:
-            print(f"\nInstalling {name}...")
-            if not self.install_component(name, config):
-                all_success = False
-                # Continue installing other components even if one fails
+        try:
+            if self.parallel:
+                for level in self.get_installation_levels(ordered_names):
+                    if not self._install_level(level, config):
+                        all_success = False
+            else:
+                for name in ordered_names:
+                    print(f"\nInstalling {name}...")
+                    if not self.install_component(name, config):
+                        all_success = False
+                        # Continue installing other components even if one fails
+        except BaseException:
+            # Interrupted in-process (e.g. Ctrl+C): undo everything before exiting
+            if self.journal is not None:
+                print("\nInstallation interrupted, rolling back changes...")
+                self.journal.rollback()
+                self.journal.commit()
+                self.journal = None
+            self._emit("operation_end", success=False, duration=time.time() - started)
+            raise
+
+        if self.journal is not None:
+            self.journal.commit()
+            self.journal = None
 
         if not self.dry_run:
             self._run_post_install_validation()
 
+        self._emit("operation_end", success=all_success, duration=time.time() - started)
         return all_success
 
+    def _emit(self, event: str, **data: Any) -> None:
+        """
+        Send a progress event to the progress callback, if any
+        
+        Args:
+            event: Event type
+            **data: Event fields
+        """
+        if self.progress_callback is not None:
+            self.progress_callback(make_event(event, **data))
+
+    def _open_journal(self, operation: str, component_names: List[str], resume: bool = False) -> None:
+        """
+        Start the write-ahead journal, first dealing with one left by an interrupted run
+        
+        Args:
+            operation: Operation name recorded in the journal
+            component_names: Components this run installs
+            resume: Continue an interrupted journal instead of rolling it back
+        """
+        journal = JournalManager(self.install_dir)
+
+        if journal.has_pending():
+            info = journal.pending_info() or {}
+            if resume:
+                print(f"Resuming interrupted {info.get('operation')} started at {info.get('started_at')}...")
+                journal.resume()
+                self.journal = journal
+                return
+
+            print(f"Rolling back interrupted {info.get('operation')} started at {info.get('started_at')}...")
+            journal.recover()
+
+        journal.begin(operation, component_names)
+        self.journal = journal
+
+    @contextmanager
+    def _journal_scope(self, component_name: str) -> Iterator[None]:
+        """
+        Attribute journaled changes made inside the block to a component
+        
+        Args:
+            component_name: Name of component
+        """
+        if self.journal is None:
+            yield
+        else:
+            with self.journal.component(component_name):
+                yield
+
+    def _roll_back_component(self, component_name: str) -> None:
+        """
+        Undo the journaled changes of a component that failed to install
+        
+        Args:
+            component_name: Name of component
+        """
+        if self.journal is None:
+            return
+
+        undone = self.journal.rollback(component_name)
+        if undone:
+            print(f"Rolled back {undone} changes made by {component_name}")
+            with self._state_lock:
+                self.rolled_back_components.add(component_name)
+
+    def _install_level(self, level: List[str], config: Dict[str, Any]) -> bool:
+        """
+        Install one dependency level on a thread pool
+        
+        Args:
+            level: Component names with no dependencies on each other
+            config: Installation configuration
+            
+        Returns:
+            True if all components in the level installed successfully
+        """
+        if len(level) == 1:
+            print(f"\nInstalling {level[0]}...")
+            return self.install_component(level[0], config)
+
+        print(f"\nInstalling {', '.join(level)} in parallel...")
+        workers = min(self.max_workers or len(level), len(level))
+
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="installer") as executor:
+            results = list(executor.map(lambda name: self.install_component(name, config), level))
+
+        # Continue with the next level even if a component failed
+        return all(results)
+
     def _run_post_install_validation(self) -> None:
         """Run post-installation validation for all installed components"""
         print("\nRunning post-installation validation...")
@@ -288,7 +424,8 @@ class Installer:
         all_valid = True
         for name in self.installed_components:
             component = self.components[name]
-            success, errors = component.validate_installation()
+            with span("component.validate", "component", component=name):
+                success, errors = component.validate_installation_fast()
 
             if success:
                 print(f"  ✓ {name}: Valid")
@@ -318,6 +455,7 @@ class Installer:
             'installed': list(self.installed_components),
             'failed': list(self.failed_components),
             'skipped': list(self.skipped_components),
+            'rolled_back': list(self.rolled_back_components),
             'backup_path': str(self.backup_path) if self.backup_path else None,
             'install_dir': str(self.install_dir),
             'dry_run': self.dry_run
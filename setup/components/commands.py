@@ -52,16 +52,17 @@ class CommandsComponent(Component):
     def _post_install(self):
         # Update metadata
         try:
-            metadata_mods = self.get_metadata_modifications()
-            self.settings_manager.update_metadata(metadata_mods)
-            self.logger.info("Updated metadata with commands configuration")
+            with self.settings_manager.batch():
+                metadata_mods = self.get_metadata_modifications()
+                self.settings_manager.update_metadata(metadata_mods)
+                self.logger.info("Updated metadata with commands configuration")
 
-            # Add component registration to metadata
-            self.settings_manager.add_component_registration("commands", {
-                "version": "3.0.0",
-                "category": "commands",
-                "files_count": len(self.component_files)
-            })
+                # Add component registration to metadata
+                self.settings_manager.add_component_registration("commands", {
+                    "version": "3.0.0",
+                    "category": "commands",
+                    "files_count": len(self.component_files)
+                })
             self.logger.info("Updated metadata with commands component registration")
         except Exception as e:
             self.logger.error(f"Failed to update metadata: {e}")
@@ -82,7 +83,7 @@ class CommandsComponent(Component):
                 file_path = commands_dir / filename
                 if self.file_manager.remove_file(file_path):
                     removed_count += 1
-                    self.logger.debug(f"Removed {filename}")
+                    self.logger.debug("Removed %s", filename)
                 else:
                     self.logger.warning(f"Could not remove {filename}")
             
@@ -95,7 +96,7 @@ class CommandsComponent(Component):
                 if old_file_path.exists() and old_file_path.is_file():
                     if self.file_manager.remove_file(old_file_path):
                         old_removed_count += 1
-                        self.logger.debug(f"Removed old {filename}")
+                        self.logger.debug("Removed old %s", filename)
                     else:
                         self.logger.warning(f"Could not remove old {filename}")
             
@@ -124,14 +125,16 @@ class CommandsComponent(Component):
             
             # Update metadata to remove commands component
             try:
-                if self.settings_manager.is_component_installed("commands"):
-                    self.settings_manager.remove_component_registration("commands")
-                    # Also remove commands configuration from metadata
-                    metadata = self.settings_manager.load_metadata()
-                    if "commands" in metadata:
-                        del metadata["commands"]
-                        self.settings_manager.save_metadata(metadata)
-                    self.logger.info("Removed commands component from metadata")
+                self.manifest_manager.remove_component("commands")
+                with self.settings_manager.batch():
+                    if self.settings_manager.is_component_installed("commands"):
+                        self.settings_manager.remove_component_registration("commands")
+                        # Also remove commands configuration from metadata
+                        metadata = self.settings_manager.load_metadata()
+                        if "commands" in metadata:
+                            del metadata["commands"]
+                            self.settings_manager.save_metadata(metadata)
+                        self.logger.info("Removed commands component from metadata")
             except Exception as e:
                 self.logger.warning(f"Could not update metadata: {e}")
             
@@ -161,41 +164,13 @@ class CommandsComponent(Component):
             
             self.logger.info(f"Updating commands component from {current_version} to {target_version}")
             
-            # Create backup of existing command files
-            commands_dir = self.install_dir / "commands" / "sc"
-            backup_files = []
-            
-            if commands_dir.exists():
-                for filename in self.component_files:
-                    file_path = commands_dir / filename
-                    if file_path.exists():
-                        backup_path = self.file_manager.backup_file(file_path)
-                        if backup_path:
-                            backup_files.append(backup_path)
-                            self.logger.debug(f"Backed up {filename}")
-            
-            # Perform installation (overwrites existing files)
-            success = self.install(config)
+            # Perform installation; journaled changes are rolled back if it fails
+            success = self._journaled_install(config)
             
             if success:
-                # Remove backup files on successful update
-                for backup_path in backup_files:
-                    try:
-                        backup_path.unlink()
-                    except Exception:
-                        pass  # Ignore cleanup errors
-                
                 self.logger.success(f"Commands component updated to version {target_version}")
             else:
-                # Restore from backup on failure
-                self.logger.warning("Update failed, restoring from backup...")
-                for backup_path in backup_files:
-                    try:
-                        original_path = backup_path.with_suffix('')
-                        backup_path.rename(original_path)
-                        self.logger.debug(f"Restored {original_path.name}")
-                    except Exception as e:
-                        self.logger.error(f"Could not restore {backup_path}: {e}")
+                self.logger.warning("Update failed, changes were rolled back")
             
             return success
             
@@ -242,13 +217,7 @@ class CommandsComponent(Component):
     
     def get_size_estimate(self) -> int:
         """Get estimated installation size"""
-        total_size = 0
-        source_dir = self._get_source_dir()
-        
-        for filename in self.component_files:
-            file_path = source_dir / filename
-            if file_path.exists():
-                total_size += file_path.stat().st_size
+        total_size = self._get_files_size(self._get_source_dir(), self.component_files)
         
         # Add overhead for directory and settings
         total_size += 5120  # ~5KB overhead
@@ -302,7 +271,7 @@ class CommandsComponent(Component):
                             # Remove old file
                             if self.file_manager.remove_file(old_file_path):
                                 migrated_count += 1
-                                self.logger.debug(f"Migrated {filename} to sc/ subdirectory")
+                                self.logger.debug("Migrated %s to sc/ subdirectory", filename)
                             else:
                                 self.logger.warning(f"Could not remove old {filename}")
                         else:
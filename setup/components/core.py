@@ -4,7 +4,6 @@ Core component for SuperClaude framework files installation
 
 from typing import Dict, List, Tuple, Optional, Any
 from pathlib import Path
-import shutil
 
 from ..base.component import Component
 
@@ -51,16 +50,17 @@ class CoreComponent(Component):
     def _post_install(self):
         # Create or update metadata
         try:
-            metadata_mods = self.get_metadata_modifications()
-            self.settings_manager.update_metadata(metadata_mods)
-            self.logger.info("Updated metadata with framework configuration")
+            with self.settings_manager.batch():
+                metadata_mods = self.get_metadata_modifications()
+                self.settings_manager.update_metadata(metadata_mods)
+                self.logger.info("Updated metadata with framework configuration")
             
-            # Add component registration to metadata
-            self.settings_manager.add_component_registration("core", {
-                "version": "3.0.0",
-                "category": "core",
-                "files_count": len(self.component_files)
-            })
+                # Add component registration to metadata
+                self.settings_manager.add_component_registration("core", {
+                    "version": "3.0.0",
+                    "category": "core",
+                    "files_count": len(self.component_files)
+                })
 
             self.logger.info("Updated metadata with core component registration")
             
@@ -92,22 +92,24 @@ class CoreComponent(Component):
                 file_path = self.install_dir / filename
                 if self.file_manager.remove_file(file_path):
                     removed_count += 1
-                    self.logger.debug(f"Removed {filename}")
+                    self.logger.debug("Removed %s", filename)
                 else:
                     self.logger.warning(f"Could not remove {filename}")
             
             # Update metadata to remove core component
             try:
-                if self.settings_manager.is_component_installed("core"):
-                    self.settings_manager.remove_component_registration("core")
-                    metadata_mods = self.get_metadata_modifications()
-                    metadata = self.settings_manager.load_metadata()
-                    for key in metadata_mods.keys():
-                        if key in metadata:
-                            del metadata[key]
+                self.manifest_manager.remove_component("core")
+                with self.settings_manager.batch():
+                    if self.settings_manager.is_component_installed("core"):
+                        self.settings_manager.remove_component_registration("core")
+                        metadata_mods = self.get_metadata_modifications()
+                        metadata = self.settings_manager.load_metadata()
+                        for key in metadata_mods.keys():
+                            if key in metadata:
+                                del metadata[key]
 
-                    self.settings_manager.save_metadata(metadata)
-                    self.logger.info("Removed core component from metadata")
+                        self.settings_manager.save_metadata(metadata)
+                        self.logger.info("Removed core component from metadata")
             except Exception as e:
                 self.logger.warning(f"Could not update metadata: {e}")
             
@@ -137,38 +139,13 @@ class CoreComponent(Component):
             
             self.logger.info(f"Updating core component from {current_version} to {target_version}")
             
-            # Create backup of existing files
-            backup_files = []
-            for filename in self.component_files:
-                file_path = self.install_dir / filename
-                if file_path.exists():
-                    backup_path = self.file_manager.backup_file(file_path)
-                    if backup_path:
-                        backup_files.append(backup_path)
-                        self.logger.debug(f"Backed up {filename}")
-            
-            # Perform installation (overwrites existing files)
-            success = self.install(config)
+            # Perform installation; journaled changes are rolled back if it fails
+            success = self._journaled_install(config)
             
             if success:
-                # Remove backup files on successful update
-                for backup_path in backup_files:
-                    try:
-                        backup_path.unlink()
-                    except Exception:
-                        pass  # Ignore cleanup errors
-                
                 self.logger.success(f"Core component updated to version {target_version}")
             else:
-                # Restore from backup on failure
-                self.logger.warning("Update failed, restoring from backup...")
-                for backup_path in backup_files:
-                    try:
-                        original_path = backup_path.with_suffix('')
-                        shutil.move(str(backup_path), str(original_path))
-                        self.logger.debug(f"Restored {original_path.name}")
-                    except Exception as e:
-                        self.logger.error(f"Could not restore {backup_path}: {e}")
+                self.logger.warning("Update failed, changes were rolled back")
             
             return success
             
@@ -188,17 +165,15 @@ class CoreComponent(Component):
             elif not file_path.is_file():
                 errors.append(f"Framework file is not a regular file: {filename}")
         
-        # Check metadata registration
-        if not self.settings_manager.is_component_installed("core"):
-            errors.append("Core component not registered in metadata")
-        else:
-            # Check version matches
-            installed_version = self.settings_manager.get_component_version("core")
-            expected_version = self.get_metadata()["version"]
-            if installed_version != expected_version:
-                errors.append(f"Version mismatch: installed {installed_version}, expected {expected_version}")
+        # Check metadata registration, version and framework configuration
+        errors.extend(self.validate_registration())
+        
+        return len(errors) == 0, errors
+    
+    def validate_registration(self) -> List[str]:
+        """Check core's metadata registration, version and framework configuration"""
+        errors = super().validate_registration()
         
-        # Check metadata structure
         try:
             framework_config = self.settings_manager.get_metadata_setting("framework")
             if not framework_config:
@@ -211,7 +186,7 @@ class CoreComponent(Component):
         except Exception as e:
             errors.append(f"Could not validate metadata: {e}")
         
-        return len(errors) == 0, errors
+        return errors
     
     def _get_source_dir(self):
         """Get source directory for framework files"""
@@ -222,13 +197,7 @@ class CoreComponent(Component):
     
     def get_size_estimate(self) -> int:
         """Get estimated installation size"""
-        total_size = 0
-        source_dir = self._get_source_dir()
-        
-        for filename in self.component_files:
-            file_path = source_dir / filename
-            if file_path.exists():
-                total_size += file_path.stat().st_size
+        total_size = self._get_files_size(self._get_source_dir(), self.component_files)
         
         # Add overhead for settings.json and directories
         total_size += 10240  # ~10KB overhead
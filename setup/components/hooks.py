@@ -146,15 +146,7 @@ pass
             return False
 
         # Copy hook files
-        success_count = 0
-        for source, target in files_to_install:
-            self.logger.debug(f"Copying {source.name} to {target}")
-            
-            if self.file_manager.copy_file(source, target):
-                success_count += 1
-                self.logger.debug(f"Successfully copied {source.name}")
-            else:
-                self.logger.error(f"Failed to copy {source.name}")
+        success_count = self._copy_files(files_to_install, config)
 
         if success_count != len(files_to_install):
             self.logger.error(f"Only {success_count}/{len(files_to_install)} hook files copied successfully")
@@ -167,16 +159,17 @@ pass
     def _post_install(self):
         # Update metadata
         try:
-            metadata_mods = self.get_metadata_modifications()
-            self.settings_manager.update_metadata(metadata_mods)
-            self.logger.info("Updated metadata with hooks configuration")
+            with self.settings_manager.batch():
+                metadata_mods = self.get_metadata_modifications()
+                self.settings_manager.update_metadata(metadata_mods)
+                self.logger.info("Updated metadata with hooks configuration")
 
-            # Add hook registration to metadata
-            self.settings_manager.add_component_registration("hooks", {
-                "version": "3.0.0",
-                "category": "commands",
-                "files_count": len(self.hook_files)
-            })
+                # Add hook registration to metadata
+                self.settings_manager.add_component_registration("hooks", {
+                    "version": "3.0.0",
+                    "category": "commands",
+                    "files_count": len(self.hook_files)
+                })
 
             self.logger.info("Updated metadata with commands component registration")
         except Exception as e:
@@ -198,7 +191,7 @@ pass
                 file_path = self.install_component_subdir / filename
                 if self.file_manager.remove_file(file_path):
                     removed_count += 1
-                    self.logger.debug(f"Removed {filename}")
+                    self.logger.debug("Removed %s", filename)
             
             # Remove placeholder file
             placeholder_path = self.install_component_subdir / "PLACEHOLDER.py"
@@ -218,16 +211,18 @@ pass
             
             # Update settings.json to remove hooks component and configuration
             try:
-                if self.settings_manager.is_component_installed("hooks"):
-                    self.settings_manager.remove_component_registration("hooks")
+                self.manifest_manager.remove_component("hooks")
+                with self.settings_manager.batch():
+                    if self.settings_manager.is_component_installed("hooks"):
+                        self.settings_manager.remove_component_registration("hooks")
                     
-                    # Also remove hooks configuration section if it exists
-                    settings = self.settings_manager.load_settings()
-                    if "hooks" in settings:
-                        del settings["hooks"]
-                        self.settings_manager.save_settings(settings)
+                        # Also remove hooks configuration section if it exists
+                        settings = self.settings_manager.load_settings()
+                        if "hooks" in settings:
+                            del settings["hooks"]
+                            self.settings_manager.save_settings(settings)
                     
-                    self.logger.info("Removed hooks component and configuration from settings.json")
+                        self.logger.info("Removed hooks component and configuration from settings.json")
             except Exception as e:
                 self.logger.warning(f"Could not update settings.json: {e}")
             
@@ -257,40 +252,13 @@ pass
             
             self.logger.info(f"Updating hooks component from {current_version} to {target_version}")
             
-            # Create backup of existing hook files
-            backup_files = []
-            
-            if self.install_component_subdir.exists():
-                for filename in self.hook_files + ["PLACEHOLDER.py"]:
-                    file_path = self.install_component_subdir / filename
-                    if file_path.exists():
-                        backup_path = self.file_manager.backup_file(file_path)
-                        if backup_path:
-                            backup_files.append(backup_path)
-                            self.logger.debug(f"Backed up {filename}")
-            
-            # Perform installation (overwrites existing files)
-            success = self.install(config)
+            # Perform installation; journaled changes are rolled back if it fails
+            success = self._journaled_install(config)
             
             if success:
-                # Remove backup files on successful update
-                for backup_path in backup_files:
-                    try:
-                        backup_path.unlink()
-                    except Exception:
-                        pass  # Ignore cleanup errors
-                
                 self.logger.success(f"Hooks component updated to version {target_version}")
             else:
-                # Restore from backup on failure
-                self.logger.warning("Update failed, restoring from backup...")
-                for backup_path in backup_files:
-                    try:
-                        original_path = backup_path.with_suffix('')
-                        backup_path.rename(original_path)
-                        self.logger.debug(f"Restored {original_path.name}")
-                    except Exception as e:
-                        self.logger.error(f"Could not restore {backup_path}: {e}")
+                self.logger.warning("Update failed, changes were rolled back")
             
             return success
             
@@ -326,6 +294,12 @@ pass
         
         return len(errors) == 0, errors
     
+    def get_installed_files(self) -> List[Path]:
+        """Get installed hook files (or the placeholder)"""
+        candidates = self.hook_files + ["PLACEHOLDER.py"]
+        return [self.install_component_subdir / name for name in candidates
+                if (self.install_component_subdir / name).is_file()]
+
     def _get_source_dir(self) -> Path:
         """Get source directory for hook files"""
         # Assume we're in SuperClaude/setup/components/hooks.py
@@ -336,14 +310,7 @@ pass
     def get_size_estimate(self) -> int:
         """Get estimated installation size"""
         # Estimate based on placeholder or actual files
-        source_dir = self._get_source_dir()
-        total_size = 0
-        
-        if source_dir.exists():
-            for filename in self.hook_files:
-                file_path = source_dir / filename
-                if file_path.exists():
-                    total_size += file_path.stat().st_size
+        total_size = self._get_files_size(self._get_source_dir(), self.hook_files)
         
         # Add placeholder overhead or minimum size
         total_size = max(total_size, 10240)  # At least 10KB
@@ -4,16 +4,25 @@ MCP component for MCP server integration
 
 import subprocess
 import sys
-from typing import Dict, List, Tuple, Optional, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Tuple, Optional, Any, Set
 from pathlib import Path
 
 from ..base.component import Component
+from ..core.tool_prober import get_tool_prober
 from ..utils.ui import display_info, display_warning
 
 
 class MCPComponent(Component):
     """MCP servers integration component"""
     
+    # Upper bound on concurrent `claude mcp add` runs
+    MAX_CONCURRENT_INSTALLS = 4
+    
+    # Default per-server timeouts in seconds
+    LIST_TIMEOUT = 15
+    INSTALL_TIMEOUT = 120
+    
     def __init__(self, install_dir: Optional[Path] = None):
         """Initialize MCP component"""
         super().__init__(install_dir)
@@ -61,64 +70,41 @@ class MCPComponent(Component):
         """Check prerequisites"""
         errors = []
         
+        # Probe node, claude and npm concurrently (cached across runs)
+        node, claude, npm = get_tool_prober().probe_many([
+            ["node", "--version"],
+            ["claude", "--version"],
+            ["npm", "--version"]
+        ])
+        
         # Check if Node.js is available
-        try:
-            result = subprocess.run(
-                ["node", "--version"], 
-                capture_output=True, 
-                text=True, 
-                timeout=10,
-                shell=(sys.platform == "win32")
-            )
-            if result.returncode != 0:
-                errors.append("Node.js not found - required for MCP servers")
-            else:
-                version = result.stdout.strip()
-                self.logger.debug(f"Found Node.js {version}")
-                
-                # Check version (require 18+)
-                try:
-                    version_num = int(version.lstrip('v').split('.')[0])
-                    if version_num < 18:
-                        errors.append(f"Node.js version {version} found, but version 18+ required")
-                except:
-                    self.logger.warning(f"Could not parse Node.js version: {version}")
-        except (subprocess.TimeoutExpired, FileNotFoundError):
+        if node["returncode"] != 0:
             errors.append("Node.js not found - required for MCP servers")
+        else:
+            version = node["stdout"].strip()
+            self.logger.debug(f"Found Node.js {version}")
+            
+            # Check version (require 18+)
+            try:
+                version_num = int(version.lstrip('v').split('.')[0])
+                if version_num < 18:
+                    errors.append(f"Node.js version {version} found, but version 18+ required")
+            except:
+                self.logger.warning(f"Could not parse Node.js version: {version}")
         
         # Check if Claude CLI is available
-        try:
-            result = subprocess.run(
-                ["claude", "--version"], 
-                capture_output=True, 
-                text=True, 
-                timeout=10,
-                shell=(sys.platform == "win32")
-            )
-            if result.returncode != 0:
-                errors.append("Claude CLI not found - required for MCP server management")
-            else:
-                version = result.stdout.strip()
-                self.logger.debug(f"Found Claude CLI {version}")
-        except (subprocess.TimeoutExpired, FileNotFoundError):
+        if claude["returncode"] != 0:
             errors.append("Claude CLI not found - required for MCP server management")
+        else:
+            version = claude["stdout"].strip()
+            self.logger.debug(f"Found Claude CLI {version}")
         
         # Check if npm is available
-        try:
-            result = subprocess.run(
-                ["npm", "--version"], 
-                capture_output=True, 
-                text=True, 
-                timeout=10,
-                shell=(sys.platform == "win32")
-            )
-            if result.returncode != 0:
-                errors.append("npm not found - required for MCP server installation")
-            else:
-                version = result.stdout.strip()
-                self.logger.debug(f"Found npm {version}")
-        except (subprocess.TimeoutExpired, FileNotFoundError):
+        if npm["returncode"] != 0:
             errors.append("npm not found - required for MCP server installation")
+        else:
+            version = npm["stdout"].strip()
+            self.logger.debug(f"Found npm {version}")
         
         return len(errors) == 0, errors
     
@@ -143,72 +129,90 @@ class MCPComponent(Component):
             }
         }
     
-    def _check_mcp_server_installed(self, server_name: str) -> bool:
-        """Check if MCP server is already installed"""
+    def _list_mcp_servers(self) -> Optional[Set[str]]:
+        """
+        Take a snapshot of installed MCP servers with a single `claude mcp list`
+        
+        Returns:
+            Set of lowercased server names, or None if the list could not be read
+        """
         try:
             result = subprocess.run(
                 ["claude", "mcp", "list"], 
                 capture_output=True, 
                 text=True, 
-                timeout=15,
+                timeout=self.LIST_TIMEOUT,
                 shell=(sys.platform == "win32")
             )
             
             if result.returncode != 0:
                 self.logger.warning(f"Could not list MCP servers: {result.stderr}")
-                return False
+                return None
             
-            # Parse output to check if server is installed
-            output = result.stdout.lower()
-            return server_name.lower() in output
+            return self._parse_mcp_list(result.stdout)
             
-        except (subprocess.TimeoutExpired, subprocess.SubprocessError) as e:
+        except (subprocess.TimeoutExpired, subprocess.SubprocessError, OSError) as e:
             self.logger.warning(f"Error checking MCP server status: {e}")
-            return False
+            return None
     
-    def _install_mcp_server(self, server_info: Dict[str, Any], config: Dict[str, Any]) -> bool:
-        """Install a single MCP server"""
+    def _parse_mcp_list(self, output: str) -> Set[str]:
+        """Parse `claude mcp list` output ("name: command ...") into server names"""
+        servers = set()
+        for line in output.splitlines():
+            name, sep, _ = line.partition(":")
+            name = name.strip().lower()
+            if sep and name and " " not in name:
+                servers.add(name)
+        return servers
+    
+    def _check_mcp_server_installed(self, server_name: str, installed: Optional[Set[str]] = None) -> bool:
+        """
+        Check if MCP server is already installed
+        
+        Args:
+            server_name: Name of MCP server
+            installed: Snapshot from _list_mcp_servers (taken on demand if None)
+        """
+        if installed is None:
+            installed = self._list_mcp_servers()
+            if installed is None:
+                return False
+        return server_name.lower() in installed
+    
+    def _announce_api_key(self, server_info: Dict[str, Any], config: Dict[str, Any]) -> None:
+        """Tell the user about API key requirements of a server"""
+        if "api_key_env" not in server_info or config.get("dry_run", False):
+            return
+        
         server_name = server_info["name"]
-        npm_package = server_info["npm_package"]
+        api_key_env = server_info["api_key_env"]
+        api_key_desc = server_info.get("api_key_description", f"API key for {server_name}")
         
+        display_info(f"MCP server '{server_name}' requires an API key")
+        display_info(f"Environment variable: {api_key_env}")
+        display_info(f"Description: {api_key_desc}")
+        
+        # Check if API key is already set
+        import os
+        if not os.getenv(api_key_env):
+            display_warning(f"API key {api_key_env} not found in environment")
+            self.logger.warning(f"Proceeding without {api_key_env} - server may not function properly")
+    
+    def _run_mcp_add(self, server_info: Dict[str, Any]) -> bool:
+        """Run `claude mcp add` for a single server"""
+        server_name = server_info["name"]
+        npm_package = server_info["npm_package"]
         command = "npx"
+        timeout = server_info.get("timeout", self.INSTALL_TIMEOUT)
+        
+        self.logger.debug(f"Running: claude mcp add -s user {server_name} {command} -y {npm_package}")
         
         try:
-            self.logger.info(f"Installing MCP server: {server_name}")
-            
-            # Check if already installed
-            if self._check_mcp_server_installed(server_name):
-                self.logger.info(f"MCP server {server_name} already installed")
-                return True
-            
-            # Handle API key requirements
-            if "api_key_env" in server_info:
-                api_key_env = server_info["api_key_env"]
-                api_key_desc = server_info.get("api_key_description", f"API key for {server_name}")
-                
-                if not config.get("dry_run", False):
-                    display_info(f"MCP server '{server_name}' requires an API key")
-                    display_info(f"Environment variable: {api_key_env}")
-                    display_info(f"Description: {api_key_desc}")
-                    
-                    # Check if API key is already set
-                    import os
-                    if not os.getenv(api_key_env):
-                        display_warning(f"API key {api_key_env} not found in environment")
-                        self.logger.warning(f"Proceeding without {api_key_env} - server may not function properly")
-            
-            # Install using Claude CLI
-            if config.get("dry_run"):
-                self.logger.info(f"Would install MCP server (user scope): claude mcp add -s user {server_name} {command} -y {npm_package}")
-                return True
-            
-            self.logger.debug(f"Running: claude mcp add -s user {server_name} {command} -y {npm_package}")
-            
             result = subprocess.run(
                 ["claude", "mcp", "add", "-s", "user", "--", server_name, command, "-y", npm_package],
                 capture_output=True,
                 text=True,
-                timeout=120,  # 2 minutes timeout for installation
+                timeout=timeout,
                 shell=(sys.platform == "win32")
             )
             
@@ -221,19 +225,93 @@ class MCPComponent(Component):
                 return False
                 
         except subprocess.TimeoutExpired:
-            self.logger.error(f"Timeout installing MCP server {server_name}")
+            self.logger.error(f"Timeout installing MCP server {server_name} (after {timeout}s)")
             return False
         except Exception as e:
             self.logger.error(f"Error installing MCP server {server_name}: {e}")
             return False
     
-    def _uninstall_mcp_server(self, server_name: str) -> bool:
+    def _install_mcp_servers(self, servers: Dict[str, Dict[str, Any]], config: Dict[str, Any],
+                             installed: Optional[Set[str]] = None) -> Tuple[List[str], List[str]]:
+        """
+        Install MCP servers as a batch
+        
+        Takes one `claude mcp list` snapshot (unless one is given), runs the
+        missing `claude mcp add` commands on a bounded pool and refreshes the
+        snapshot once at the end to verify the result.
+        
+        Args:
+            servers: Server name -> server info
+            config: Installation configuration
+            installed: Existing snapshot of installed servers (optional)
+            
+        Returns:
+            Tuple of (installed server names, failed server names)
+        """
+        if installed is None:
+            installed = self._list_mcp_servers() or set()
+        
+        succeeded = []
+        pending = []
+        
+        for server_name, server_info in servers.items():
+            self.logger.info(f"Installing MCP server: {server_name}")
+            
+            if self._check_mcp_server_installed(server_name, installed):
+                self.logger.info(f"MCP server {server_name} already installed")
+                succeeded.append(server_name)
+                continue
+            
+            # Prompts are shown up front so they do not interleave
+            self._announce_api_key(server_info, config)
+            
+            if config.get("dry_run"):
+                self.logger.info(
+                    f"Would install MCP server (user scope): claude mcp add -s user "
+                    f"{server_name} npx -y {server_info['npm_package']}"
+                )
+                succeeded.append(server_name)
+                continue
+            
+            pending.append(server_name)
+        
+        if not pending:
+            return succeeded, []
+        
+        workers = min(self.MAX_CONCURRENT_INSTALLS, len(pending))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="mcp-add") as executor:
+            results = list(executor.map(lambda name: self._run_mcp_add(servers[name]), pending))
+        
+        failed = [name for name, ok in zip(pending, results) if not ok]
+        added = [name for name, ok in zip(pending, results) if ok]
+        
+        # Verify installation against a fresh snapshot
+        self.logger.info("Verifying MCP server installation...")
+        refreshed = self._list_mcp_servers()
+        if refreshed is None:
+            self.logger.warning("Could not verify MCP server installation")
+        else:
+            self.logger.debug(f"MCP servers list: {sorted(refreshed)}")
+            for server_name in added:
+                if not self._check_mcp_server_installed(server_name, refreshed):
+                    self.logger.warning(f"MCP server {server_name} not listed after installation")
+        
+        return succeeded + added, failed
+    
+    def _install_mcp_server(self, server_info: Dict[str, Any], config: Dict[str, Any],
+                            installed: Optional[Set[str]] = None) -> bool:
+        """Install a single MCP server"""
+        server_name = server_info["name"]
+        _, failed = self._install_mcp_servers({server_name: server_info}, config, installed)
+        return not failed
+    
+    def _uninstall_mcp_server(self, server_name: str, installed: Optional[Set[str]] = None) -> bool:
         """Uninstall a single MCP server"""
         try:
             self.logger.info(f"Uninstalling MCP server: {server_name}")
             
             # Check if installed
-            if not self._check_mcp_server_installed(server_name):
+            if not self._check_mcp_server_installed(server_name, installed):
                 self.logger.info(f"MCP server {server_name} not installed")
                 return True
             
@@ -273,43 +351,15 @@ class MCPComponent(Component):
                 self.logger.error(error)
             return False
 
-        # Install each MCP server
-        installed_count = 0
-        failed_servers = []
+        # Install MCP servers as one batch
+        installed_servers, failed_servers = self._install_mcp_servers(self.mcp_servers, config)
+        installed_count = len(installed_servers)
 
-        for server_name, server_info in self.mcp_servers.items():
-            if self._install_mcp_server(server_info, config):
-                installed_count += 1
-            else:
-                failed_servers.append(server_name)
-                
-                # Check if this is a required server
-                if server_info.get("required", False):
-                    self.logger.error(f"Required MCP server {server_name} failed to install")
-                    return False
-
-        # Verify installation
-        if not config.get("dry_run", False):
-            self.logger.info("Verifying MCP server installation...")
-            try:
-                result = subprocess.run(
-                    ["claude", "mcp", "list"],
-                    capture_output=True,
-                    text=True,
-                    timeout=15,
-                    shell=(sys.platform == "win32")
-                )
-                
-                if result.returncode == 0:
-                    self.logger.debug("MCP servers list:")
-                    for line in result.stdout.strip().split('\n'):
-                        if line.strip():
-                            self.logger.debug(f"  {line.strip()}")
-                else:
-                    self.logger.warning("Could not verify MCP server installation")
-                    
-            except Exception as e:
-                self.logger.warning(f"Could not verify MCP installation: {e}")
+        required_failed = [name for name in failed_servers if self.mcp_servers[name].get("required", False)]
+        if required_failed:
+            for server_name in required_failed:
+                self.logger.error(f"Required MCP server {server_name} failed to install")
+            return False
 
         if failed_servers:
             self.logger.warning(f"Some MCP servers failed to install: {failed_servers}")
@@ -322,15 +372,16 @@ class MCPComponent(Component):
     def _post_install(self) -> bool:
         # Update metadata
         try:
-            metadata_mods = self.get_metadata_modifications()
-            self.settings_manager.update_metadata(metadata_mods)
+            with self.settings_manager.batch():
+                metadata_mods = self.get_metadata_modifications()
+                self.settings_manager.update_metadata(metadata_mods)
 
-            # Add component registration to metadata
-            self.settings_manager.add_component_registration("mcp", {
-                "version": "3.0.0",
-                "category": "integration",
-                "servers_count": len(self.mcp_servers)
-            })
+                # Add component registration to metadata
+                self.settings_manager.add_component_registration("mcp", {
+                    "version": "3.0.0",
+                    "category": "integration",
+                    "servers_count": len(self.mcp_servers)
+                })
 
             self.logger.info("Updated metadata with MCP component registration")
         except Exception as e:
@@ -345,23 +396,26 @@ class MCPComponent(Component):
         try:
             self.logger.info("Uninstalling SuperClaude MCP servers...")
             
-            # Uninstall each MCP server
+            # Uninstall each MCP server against a single snapshot
             uninstalled_count = 0
+            installed = self._list_mcp_servers() or set()
             
             for server_name in self.mcp_servers.keys():
-                if self._uninstall_mcp_server(server_name):
+                if self._uninstall_mcp_server(server_name, installed):
                     uninstalled_count += 1
             
             # Update metadata to remove MCP component
             try:
-                if self.settings_manager.is_component_installed("mcp"):
-                    self.settings_manager.remove_component_registration("mcp")
-                    # Also remove MCP configuration from metadata
-                    metadata = self.settings_manager.load_metadata()
-                    if "mcp" in metadata:
-                        del metadata["mcp"]
-                        self.settings_manager.save_metadata(metadata)
-                    self.logger.info("Removed MCP component from metadata")
+                self.manifest_manager.remove_component("mcp")
+                with self.settings_manager.batch():
+                    if self.settings_manager.is_component_installed("mcp"):
+                        self.settings_manager.remove_component_registration("mcp")
+                        # Also remove MCP configuration from metadata
+                        metadata = self.settings_manager.load_metadata()
+                        if "mcp" in metadata:
+                            del metadata["mcp"]
+                            self.settings_manager.save_metadata(metadata)
+                        self.logger.info("Removed MCP component from metadata")
             except Exception as e:
                 self.logger.warning(f"Could not update metadata: {e}")
             
@@ -392,24 +446,19 @@ class MCPComponent(Component):
             self.logger.info(f"Updating MCP component from {current_version} to {target_version}")
             
             # For MCP servers, update means reinstall to get latest versions
-            updated_count = 0
-            failed_servers = []
+            installed = self._list_mcp_servers() or set()
             
-            for server_name, server_info in self.mcp_servers.items():
+            for server_name in self.mcp_servers.keys():
                 try:
                     # Uninstall old version
-                    if self._check_mcp_server_installed(server_name):
-                        self._uninstall_mcp_server(server_name)
-                    
-                    # Install new version
-                    if self._install_mcp_server(server_info, config):
-                        updated_count += 1
-                    else:
-                        failed_servers.append(server_name)
-                        
+                    if self._check_mcp_server_installed(server_name, installed):
+                        if self._uninstall_mcp_server(server_name, installed):
+                            installed.discard(server_name.lower())
                 except Exception as e:
-                    self.logger.error(f"Error updating MCP server {server_name}: {e}")
-                    failed_servers.append(server_name)
+                    self.logger.error(f"Error removing MCP server {server_name}: {e}")
+            
+            # Install new versions as one batch
+            _, failed_servers = self._install_mcp_servers(self.mcp_servers, config, installed)
             
             # Update metadata
             try:
@@ -450,28 +499,15 @@ class MCPComponent(Component):
         if installed_version != expected_version:
             errors.append(f"Version mismatch: installed {installed_version}, expected {expected_version}")
         
-        # Check if Claude CLI is available
-        try:
-            result = subprocess.run(
-                ["claude", "mcp", "list"],
-                capture_output=True,
-                text=True,
-                timeout=15,
-                shell=(sys.platform == "win32")
-            )
-            
-            if result.returncode != 0:
-                errors.append("Could not communicate with Claude CLI for MCP server verification")
-            else:
-                # Check if required servers are installed
-                output = result.stdout.lower()
-                for server_name, server_info in self.mcp_servers.items():
-                    if server_info.get("required", False):
-                        if server_name.lower() not in output:
-                            errors.append(f"Required MCP server not found: {server_name}")
-                            
-        except Exception as e:
-            errors.append(f"Could not verify MCP server installation: {e}")
+        # Check if required servers are installed
+        installed = self._list_mcp_servers()
+        if installed is None:
+            errors.append("Could not communicate with Claude CLI for MCP server verification")
+        else:
+            for server_name, server_info in self.mcp_servers.items():
+                if server_info.get("required", False):
+                    if not self._check_mcp_server_installed(server_name, installed):
+                        errors.append(f"Required MCP server not found: {server_name}")
         
         return len(errors) == 0, errors
     
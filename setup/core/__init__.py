@@ -2,8 +2,14 @@
 
 from .validator import Validator
 from .registry import ComponentRegistry
+from .dependency_graph import DependencyGraph, DependencyCycleError
+from .tool_prober import ToolProber, get_tool_prober
 
 __all__ = [
     'Validator',
-    'ComponentRegistry'
+    'ComponentRegistry',
+    'DependencyGraph',
+    'DependencyCycleError',
+    'ToolProber',
+    'get_tool_prober'
 ]
@@ -0,0 +1,329 @@
+"""
+Dependency graph engine shared by the component registry and the installer
+"""
+
+from collections import deque
+from typing import Dict, List, Set, Iterable, Optional, FrozenSet
+
+
+class DependencyCycleError(ValueError):
+    """Raised when components depend on each other in a cycle"""
+
+    def __init__(self, cycle: List[str]):
+        """
+        Args:
+            cycle: Cycle path, starting and ending with the same component
+        """
+        self.cycle = cycle
+        super().__init__(f"Circular dependency detected involving {cycle[0]}: {' -> '.join(cycle)}")
+
+
+class DependencyGraph:
+    """
+    Directed graph of component -> dependencies
+
+    Keeps a reverse-edge index so dependents are a dict lookup, orders
+    components with Kahn's algorithm (linear in nodes + edges) and memoizes
+    transitive closures until the graph changes.
+    """
+
+    # Distinct closure requests remembered between graph changes
+    MAX_CACHED_CLOSURES = 128
+
+    def __init__(self, edges: Optional[Dict[str, Iterable[str]]] = None):
+        """
+        Initialize dependency graph
+
+        Args:
+            edges: Optional mapping of component name -> dependency names
+        """
+        self._dependencies: Dict[str, List[str]] = {}
+        self._dependents: Dict[str, Set[str]] = {}
+        self._closures: Dict[FrozenSet[str], FrozenSet[str]] = {}
+        self._validation: Optional[List[str]] = None
+
+        for name, dependencies in (edges or {}).items():
+            self.add_node(name, dependencies)
+
+    def add_node(self, name: str, dependencies: Iterable[str] = ()) -> None:
+        """
+        Add a component, replacing its dependencies if it already exists
+
+        Args:
+            name: Component name
+            dependencies: Names of components it depends on
+        """
+        if name in self._dependencies:
+            self.remove_node(name)
+
+        deps = list(dict.fromkeys(dependencies))
+        self._dependencies[name] = deps
+        self._dependents.setdefault(name, set())
+        for dep in deps:
+            self._dependents.setdefault(dep, set()).add(name)
+
+        self._invalidate()
+
+    def remove_node(self, name: str) -> None:
+        """
+        Remove a component (components depending on it keep the edge as missing)
+
+        Args:
+            name: Component name
+        """
+        for dep in self._dependencies.pop(name, []):
+            self._dependents.get(dep, set()).discard(name)
+        self._invalidate()
+
+    def clear(self) -> None:
+        """Remove every component"""
+        self._dependencies.clear()
+        self._dependents.clear()
+        self._invalidate()
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._dependencies
+
+    def __len__(self) -> int:
+        return len(self._dependencies)
+
+    def nodes(self) -> List[str]:
+        """Get component names in registration order"""
+        return list(self._dependencies)
+
+    def dependencies(self, name: str) -> Set[str]:
+        """Get direct dependencies of a component (empty if unknown)"""
+        return set(self._dependencies.get(name, ()))
+
+    def dependents(self, name: str) -> Set[str]:
+        """Get components that directly depend on a component"""
+        return {dependent for dependent in self._dependents.get(name, ()) if dependent in self._dependencies}
+
+    def to_dict(self) -> Dict[str, List[str]]:
+        """Get the graph as component name -> dependency list"""
+        return {name: list(deps) for name, deps in self._dependencies.items()}
+
+    def closure(self, names: Iterable[str]) -> Set[str]:
+        """
+        Get components plus all of their transitive dependencies
+
+        Args:
+            names: Component names
+
+        Returns:
+            Set of component names
+
+        Raises:
+            ValueError: If a component or one of its dependencies is unknown
+        """
+        return set(self._closure(frozenset(names)))
+
+    def resolve(self, names: Iterable[str]) -> List[str]:
+        """
+        Order components and their dependencies so dependencies come first
+
+        Args:
+            names: Component names to install
+
+        Returns:
+            Ordered list of component names including dependencies
+
+        Raises:
+            ValueError: If a component is unknown
+            DependencyCycleError: If the components form a dependency cycle
+        """
+        return [name for level in self._kahn(names) for name in level]
+
+    def levels(self, names: Iterable[str]) -> List[List[str]]:
+        """
+        Group components and their dependencies into installation levels
+
+        Args:
+            names: Component names to install
+
+        Returns:
+            List of levels; components within a level do not depend on each
+            other and every dependency sits in an earlier level
+
+        Raises:
+            ValueError: If a component is unknown
+            DependencyCycleError: If the components form a dependency cycle
+        """
+        return self._kahn(names)
+
+    def validate(self) -> List[str]:
+        """
+        Check the whole graph for missing dependencies and cycles
+
+        Returns:
+            List of validation errors (empty if valid)
+        """
+        if self._validation is None:
+            errors = []
+
+            for name, deps in self._dependencies.items():
+                missing = {dep for dep in deps if dep not in self._dependencies}
+                if missing:
+                    errors.append(f"Component {name} has missing dependencies: {missing}")
+
+            for cycle in self.find_cycles():
+                errors.append(str(DependencyCycleError(cycle)))
+
+            self._validation = errors
+
+        return list(self._validation)
+
+    def find_cycles(self, nodes: Optional[Iterable[str]] = None) -> List[List[str]]:
+        """
+        Find dependency cycles (Tarjan's strongly connected components)
+
+        Args:
+            nodes: Restrict the search to these components (default: all)
+
+        Returns:
+            One cycle path per cyclic group, e.g. ["a", "b", "a"]
+        """
+        members = set(self._dependencies if nodes is None else nodes) & set(self._dependencies)
+        order = [name for name in self._dependencies if name in members]
+
+        index: Dict[str, int] = {}
+        lowlink: Dict[str, int] = {}
+        on_stack: Set[str] = set()
+        stack: List[str] = []
+        cycles: List[List[str]] = []
+
+        for root in order:
+            if root in index:
+                continue
+
+            # Iterative DFS: (node, iterator over its in-scope dependencies)
+            work = [(root, iter(self._dependencies[root]))]
+            index[root] = lowlink[root] = len(index)
+            stack.append(root)
+            on_stack.add(root)
+
+            while work:
+                node, deps = work[-1]
+                advanced = False
+                for dep in deps:
+                    if dep not in members:
+                        continue
+                    if dep not in index:
+                        index[dep] = lowlink[dep] = len(index)
+                        stack.append(dep)
+                        on_stack.add(dep)
+                        work.append((dep, iter(self._dependencies[dep])))
+                        advanced = True
+                        break
+                    if dep in on_stack:
+                        lowlink[node] = min(lowlink[node], index[dep])
+
+                if advanced:
+                    continue
+
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    lowlink[parent] = min(lowlink[parent], lowlink[node])
+
+                if lowlink[node] == index[node]:
+                    component = set()
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.add(member)
+                        if member == node:
+                            break
+
+                    if len(component) > 1 or node in self._dependencies[node]:
+                        cycles.append(self._cycle_path(node, component))
+
+        return cycles
+
+    def _closure(self, names: FrozenSet[str]) -> FrozenSet[str]:
+        """Get (and memoize) the transitive closure of a set of components"""
+        cached = self._closures.get(names)
+        if cached is not None:
+            return cached
+
+        for name in names:
+            if name not in self._dependencies:
+                raise ValueError(f"Unknown component: {name}")
+
+        seen = set(names)
+        queue = deque(names)
+        while queue:
+            node = queue.popleft()
+            for dep in self._dependencies[node]:
+                if dep in seen:
+                    continue
+                if dep not in self._dependencies:
+                    raise ValueError(f"Unknown component: {dep}")
+                seen.add(dep)
+                queue.append(dep)
+
+        if len(self._closures) >= self.MAX_CACHED_CLOSURES:
+            self._closures.clear()
+
+        closure = frozenset(seen)
+        self._closures[names] = closure
+        return closure
+
+    def _kahn(self, names: Iterable[str]) -> List[List[str]]:
+        """Level-by-level Kahn's algorithm over the closure of names"""
+        names = list(names)
+        subgraph = self.closure(names)
+
+        # Ties are broken by request order, then registration order
+        rank = {name: position for position, name in enumerate(dict.fromkeys(names))}
+        for name in self._dependencies:
+            if name in subgraph:
+                rank.setdefault(name, len(rank))
+
+        in_degree = {name: len(set(self._dependencies[name])) for name in subgraph}
+        frontier = sorted((name for name, degree in in_degree.items() if degree == 0), key=rank.__getitem__)
+        levels: List[List[str]] = []
+        placed = 0
+
+        while frontier:
+            levels.append(frontier)
+            placed += len(frontier)
+            next_frontier = []
+            for name in frontier:
+                for dependent in self._dependents.get(name, ()):
+                    if dependent not in in_degree:
+                        continue
+                    in_degree[dependent] -= 1
+                    if in_degree[dependent] == 0:
+                        next_frontier.append(dependent)
+            frontier = sorted(next_frontier, key=rank.__getitem__)
+
+        if placed != len(subgraph):
+            remaining = [name for name, degree in in_degree.items() if degree > 0]
+            cycles = self.find_cycles(remaining)
+            raise DependencyCycleError(cycles[0])
+
+        return levels
+
+    def _cycle_path(self, start: str, component: Set[str]) -> List[str]:
+        """Walk dependencies inside a strongly connected group back to start"""
+        # Breadth-first search for the shortest path from start back to itself
+        parents: Dict[str, str] = {}
+        queue = deque([start])
+        while queue:
+            node = queue.popleft()
+            for dep in self._dependencies[node]:
+                if dep == start:
+                    chain = [node]
+                    while chain[-1] != start:
+                        chain.append(parents[chain[-1]])
+                    return list(reversed(chain)) + [start]
+                if dep in component and dep not in parents:
+                    parents[dep] = node
+                    queue.append(dep)
+        return [start, start]
+
+    def _invalidate(self) -> None:
+        """Forget memoized results after the graph changed"""
+        self._closures.clear()
+        self._validation = None
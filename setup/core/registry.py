@@ -4,37 +4,57 @@ Component registry for auto-discovery and dependency resolution
 
 import importlib
 import inspect
-from typing import Dict, List, Set, Optional, Type
+import json
+import os
+from typing import Dict, List, Set, Optional, Type, Any
 from pathlib import Path
 from ..base.component import Component
+from .dependency_graph import DependencyGraph
+from ..utils.profiling import timed
 
 
 class ComponentRegistry:
     """Auto-discovery and management of installable components"""
     
-    def __init__(self, components_dir: Path):
+    CACHE_VERSION = 1
+    
+    def __init__(self, components_dir: Path, cache_file: Optional[Path] = None):
         """
         Initialize component registry
         
         Args:
             components_dir: Directory containing component modules
+            cache_file: Discovery cache (default: <CACHE_DIR>/component_registry.json)
         """
+        if cache_file is None:
+            from .. import CACHE_DIR
+            cache_file = CACHE_DIR / "component_registry.json"
+        
         self.components_dir = components_dir
+        self.cache_file = cache_file
+        self.component_info: Dict[str, Dict[str, Any]] = {}
         self.component_classes: Dict[str, Type[Component]] = {}
         self.component_instances: Dict[str, Component] = {}
-        self.dependency_graph: Dict[str, Set[str]] = {}
+        self.dependency_graph = DependencyGraph()
         self._discovered = False
     
+    @timed("registry.discover", "registry")
     def discover_components(self, force_reload: bool = False) -> None:
         """
         Auto-discover all component classes in components directory
         
+        Component names, class paths, metadata and dependencies are cached
+        on disk, keyed by the size and mtime of every component module.
+        While the cache is valid nothing is imported or instantiated here;
+        classes are loaded on first use (get_component_class/instance).
+        
         Args:
-            force_reload: Force rediscovery even if already done
+            force_reload: Force rediscovery (importing every module) even if cached
         """
         if self._discovered and not force_reload:
             return
         
+        self.component_info.clear()
         self.component_classes.clear()
         self.component_instances.clear()
         self.dependency_graph.clear()
@@ -42,27 +62,20 @@ class ComponentRegistry:
         if not self.components_dir.exists():
             return
         
-        # Add components directory to Python path temporarily
-        import sys
-        original_path = sys.path.copy()
-        
-        try:
-            # Add parent directory to path so we can import setup.components
-            setup_dir = self.components_dir.parent
-            if str(setup_dir) not in sys.path:
-                sys.path.insert(0, str(setup_dir))
-            
-            # Discover all Python files in components directory
-            for py_file in self.components_dir.glob("*.py"):
-                if py_file.name.startswith("__"):
-                    continue
-                
-                module_name = py_file.stem
-                self._load_component_module(module_name)
-        
-        finally:
-            # Restore original Python path
-            sys.path = original_path
+        # Discover all Python files in components directory
+        module_files = sorted(
+            py_file for py_file in self.components_dir.glob("*.py")
+            if not py_file.name.startswith("__")
+        )
+        fingerprint = self._fingerprint(module_files)
+        
+        cached = None if force_reload else self._load_cached_components(fingerprint)
+        if cached is not None:
+            self.component_info.update(cached)
+        else:
+            for py_file in module_files:
+                self._load_component_module(py_file.stem)
+            self._save_cached_components(fingerprint)
         
         # Build dependency graph
         self._build_dependency_graph()
@@ -94,6 +107,12 @@ class ComponentRegistry:
                         
                         self.component_classes[component_name] = obj
                         self.component_instances[component_name] = instance
+                        self.component_info[component_name] = {
+                            "module": obj.__module__,
+                            "class": obj.__name__,
+                            "metadata": dict(metadata),
+                            "dependencies": list(self._instance_dependencies(component_name, instance))
+                        }
                         
                     except Exception as e:
                         print(f"Warning: Could not instantiate component {name}: {e}")
@@ -101,15 +120,82 @@ class ComponentRegistry:
         except Exception as e:
             print(f"Warning: Could not load component module {module_name}: {e}")
     
+    def _instance_dependencies(self, name: str, instance: Component) -> List[str]:
+        """Ask a component instance for its dependencies"""
+        try:
+            return instance.get_dependencies()
+        except Exception as e:
+            print(f"Warning: Could not get dependencies for {name}: {e}")
+            return []
+    
     def _build_dependency_graph(self) -> None:
         """Build dependency graph for all discovered components"""
-        for name, instance in self.component_instances.items():
+        for name, info in self.component_info.items():
+            self.dependency_graph.add_node(name, info["dependencies"])
+    
+    def _fingerprint(self, module_files: List[Path]) -> Dict[str, List[int]]:
+        """Get size and mtime of each component module (the cache key)"""
+        fingerprint = {}
+        for py_file in module_files:
             try:
-                dependencies = instance.get_dependencies()
-                self.dependency_graph[name] = set(dependencies)
-            except Exception as e:
-                print(f"Warning: Could not get dependencies for {name}: {e}")
-                self.dependency_graph[name] = set()
+                stat = py_file.stat()
+            except OSError:
+                continue
+            fingerprint[py_file.name] = [stat.st_size, stat.st_mtime_ns]
+        return fingerprint
+    
+    def _load_cached_components(self, fingerprint: Dict[str, List[int]]) -> Optional[Dict[str, Dict[str, Any]]]:
+        """
+        Load cached component info if it matches the current component modules
+        
+        Args:
+            fingerprint: Current module fingerprint
+            
+        Returns:
+            Dict of component name -> info, or None on a cache miss
+        """
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                cache = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None
+        
+        if not isinstance(cache, dict) or cache.get("cache_version") != self.CACHE_VERSION:
+            return None
+        
+        entry = cache.get("registries", {}).get(str(self.components_dir.resolve()))
+        if not entry or entry.get("fingerprint") != fingerprint:
+            return None
+        
+        return entry.get("components")
+    
+    def _save_cached_components(self, fingerprint: Dict[str, List[int]]) -> None:
+        """Save discovered component info to the cache, ignoring failures"""
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                cache = json.load(f)
+            if cache.get("cache_version") != self.CACHE_VERSION:
+                cache = {}
+        except (OSError, json.JSONDecodeError, AttributeError):
+            cache = {}
+        
+        cache["cache_version"] = self.CACHE_VERSION
+        cache.setdefault("registries", {})[str(self.components_dir.resolve())] = {
+            "fingerprint": fingerprint,
+            "components": self.component_info
+        }
+        
+        temp_file = self.cache_file.with_name(f"{self.cache_file.name}.{os.getpid()}.tmp")
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                json.dump(cache, f, indent=2)
+            os.replace(temp_file, self.cache_file)
+        except (OSError, TypeError, ValueError):
+            pass  # The cache is only an optimization
+        finally:
+            if temp_file.exists():
+                temp_file.unlink()
     
     def get_component_class(self, component_name: str) -> Optional[Type[Component]]:
         """
@@ -122,7 +208,21 @@ class ComponentRegistry:
             Component class or None if not found
         """
         self.discover_components()
-        return self.component_classes.get(component_name)
+        
+        if component_name not in self.component_classes:
+            info = self.component_info.get(component_name)
+            if info is None:
+                return None
+            
+            # Import lazily - on a cache hit nothing was imported during discovery
+            try:
+                module = importlib.import_module(info["module"])
+                self.component_classes[component_name] = getattr(module, info["class"])
+            except Exception as e:
+                print(f"Warning: Could not load component {component_name}: {e}")
+                return None
+        
+        return self.component_classes[component_name]
     
     def get_component_instance(self, component_name: str, install_dir: Optional[Path] = None) -> Optional[Component]:
         """
@@ -137,17 +237,23 @@ class ComponentRegistry:
         """
         self.discover_components()
         
-        if install_dir is not None:
-            # Create new instance with specified install directory
-            component_class = self.component_classes.get(component_name)
-            if component_class:
-                try:
-                    return component_class(install_dir)
-                except Exception as e:
-                    print(f"Error creating component instance {component_name}: {e}")
-                    return None
-        
-        return self.component_instances.get(component_name)
+        if install_dir is None and component_name in self.component_instances:
+            return self.component_instances[component_name]
+        
+        component_class = self.get_component_class(component_name)
+        if component_class is None:
+            return None
+        
+        try:
+            if install_dir is not None:
+                # Create new instance with specified install directory
+                return component_class(install_dir)
+            
+            self.component_instances[component_name] = component_class()
+            return self.component_instances[component_name]
+        except Exception as e:
+            print(f"Error creating component instance {component_name}: {e}")
+            return None
     
     def list_components(self) -> List[str]:
         """
@@ -157,7 +263,7 @@ class ComponentRegistry:
             List of component names
         """
         self.discover_components()
-        return list(self.component_classes.keys())
+        return list(self.component_info.keys())
     
     def get_component_metadata(self, component_name: str) -> Optional[Dict[str, str]]:
         """
@@ -170,12 +276,9 @@ class ComponentRegistry:
             Component metadata dict or None if not found
         """
         self.discover_components()
-        instance = self.component_instances.get(component_name)
-        if instance:
-            try:
-                return instance.get_metadata()
-            except Exception:
-                return None
+        info = self.component_info.get(component_name)
+        if info:
+            return dict(info["metadata"])
         return None
     
     def resolve_dependencies(self, component_names: List[str]) -> List[str]:
@@ -192,34 +295,7 @@ class ComponentRegistry:
             ValueError: If circular dependencies detected or unknown component
         """
         self.discover_components()
-        
-        resolved = []
-        resolving = set()
-        
-        def resolve(name: str):
-            if name in resolved:
-                return
-                
-            if name in resolving:
-                raise ValueError(f"Circular dependency detected involving {name}")
-                
-            if name not in self.dependency_graph:
-                raise ValueError(f"Unknown component: {name}")
-                
-            resolving.add(name)
-            
-            # Resolve dependencies first
-            for dep in self.dependency_graph[name]:
-                resolve(dep)
-                
-            resolving.remove(name)
-            resolved.append(name)
-        
-        # Resolve each requested component
-        for name in component_names:
-            resolve(name)
-            
-        return resolved
+        return self.dependency_graph.resolve(component_names)
     
     def get_dependencies(self, component_name: str) -> Set[str]:
         """
@@ -232,7 +308,7 @@ class ComponentRegistry:
             Set of dependency component names
         """
         self.discover_components()
-        return self.dependency_graph.get(component_name, set())
+        return self.dependency_graph.dependencies(component_name)
     
     def get_dependents(self, component_name: str) -> Set[str]:
         """
@@ -245,13 +321,7 @@ class ComponentRegistry:
             Set of component names that depend on this component
         """
         self.discover_components()
-        dependents = set()
-        
-        for name, deps in self.dependency_graph.items():
-            if component_name in deps:
-                dependents.add(name)
-                
-        return dependents
+        return self.dependency_graph.dependents(component_name)
     
     def validate_dependency_graph(self) -> List[str]:
         """
@@ -261,23 +331,7 @@ class ComponentRegistry:
             List of validation errors (empty if valid)
         """
         self.discover_components()
-        errors = []
-        
-        # Check for missing dependencies
-        all_components = set(self.dependency_graph.keys())
-        for name, deps in self.dependency_graph.items():
-            missing_deps = deps - all_components
-            if missing_deps:
-                errors.append(f"Component {name} has missing dependencies: {missing_deps}")
-        
-        # Check for circular dependencies
-        for name in all_components:
-            try:
-                self.resolve_dependencies([name])
-            except ValueError as e:
-                errors.append(str(e))
-        
-        return errors
+        return self.dependency_graph.validate()
     
     def get_components_by_category(self, category: str) -> List[str]:
         """
@@ -292,13 +346,9 @@ class ComponentRegistry:
         self.discover_components()
         components = []
         
-        for name, instance in self.component_instances.items():
-            try:
-                metadata = instance.get_metadata()
-                if metadata.get("category") == category:
-                    components.append(name)
-            except Exception:
-                continue
+        for name, info in self.component_info.items():
+            if info["metadata"].get("category") == category:
+                components.append(name)
         
         return components
     
@@ -314,32 +364,7 @@ class ComponentRegistry:
             that can be installed in parallel at that dependency level
         """
         self.discover_components()
-        
-        # Get all components including dependencies
-        all_components = set(self.resolve_dependencies(component_names))
-        
-        # Group by dependency level
-        levels = []
-        remaining = all_components.copy()
-        
-        while remaining:
-            # Find components with no unresolved dependencies
-            current_level = []
-            for name in list(remaining):
-                deps = self.dependency_graph.get(name, set())
-                unresolved_deps = deps & remaining
-                
-                if not unresolved_deps:
-                    current_level.append(name)
-            
-            if not current_level:
-                # This shouldn't happen if dependency graph is valid
-                raise ValueError("Circular dependency detected in installation order calculation")
-            
-            levels.append(current_level)
-            remaining -= set(current_level)
-        
-        return levels
+        return self.dependency_graph.levels(component_names)
     
     def create_component_instances(self, component_names: List[str], install_dir: Optional[Path] = None) -> Dict[str, Component]:
         """
@@ -375,21 +400,15 @@ class ComponentRegistry:
         
         # Group components by category
         categories = {}
-        for name, instance in self.component_instances.items():
-            try:
-                metadata = instance.get_metadata()
-                category = metadata.get("category", "unknown")
-                if category not in categories:
-                    categories[category] = []
-                categories[category].append(name)
-            except Exception:
-                if "unknown" not in categories:
-                    categories["unknown"] = []
-                categories["unknown"].append(name)
+        for name, info in self.component_info.items():
+            category = info["metadata"].get("category", "unknown")
+            if category not in categories:
+                categories[category] = []
+            categories[category].append(name)
         
         return {
-            "total_components": len(self.component_classes),
+            "total_components": len(self.component_info),
             "categories": categories,
-            "dependency_graph": {name: list(deps) for name, deps in self.dependency_graph.items()},
+            "dependency_graph": self.dependency_graph.to_dict(),
             "validation_errors": self.validate_dependency_graph()
         }
\ No newline at end of file
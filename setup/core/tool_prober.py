@@ -0,0 +1,209 @@
+"""
+Cached, concurrent probing of external tools (node, npm, claude, ...)
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Any, Optional
+
+from ..utils.profiling import span
+
+
+class ToolProber:
+    """Runs tool version commands concurrently and caches the results on disk"""
+
+    # Cached results are reused for a day unless the binary or PATH changes
+    DEFAULT_TTL = 24 * 60 * 60
+    PROBE_TIMEOUT = 10
+    MAX_WORKERS = 4
+
+    def __init__(self, cache_file: Optional[Path] = None, ttl: int = DEFAULT_TTL):
+        """
+        Initialize tool prober
+
+        Args:
+            cache_file: On-disk probe cache (default: <CACHE_DIR>/tool_probes.json)
+            ttl: Seconds a cached probe stays valid (0 disables the disk cache)
+        """
+        if cache_file is None:
+            from .. import CACHE_DIR
+            cache_file = CACHE_DIR / "tool_probes.json"
+
+        self.cache_file = cache_file
+        self.ttl = ttl
+        self._results: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def probe(self, command: List[str]) -> Dict[str, Any]:
+        """
+        Probe a single command
+
+        Args:
+            command: Command and arguments, e.g. ["node", "--version"]
+
+        Returns:
+            Dict with found, path, returncode, stdout, stderr and error
+            ("not_found", "timeout", an error message, or None)
+        """
+        return self.probe_many([command])[0]
+
+    def probe_many(self, commands: List[List[str]]) -> List[Dict[str, Any]]:
+        """
+        Probe several commands, running uncached ones concurrently
+
+        Binaries are resolved with shutil.which first, so missing tools are
+        reported without spawning anything.
+
+        Args:
+            commands: List of commands
+
+        Returns:
+            Probe results in the same order as commands
+        """
+        keys = [" ".join(command) for command in commands]
+
+        with self._lock:
+            pending = {key: command for key, command in zip(keys, commands) if key not in self._results}
+            if pending:
+                self._probe_pending(pending)
+
+            return [self._results[key] for key in keys]
+
+    def clear(self) -> None:
+        """Forget in-process results (the disk cache is kept)"""
+        with self._lock:
+            self._results.clear()
+
+    def _probe_pending(self, pending: Dict[str, List[str]]) -> None:
+        """Fill self._results for commands not probed in this process yet"""
+        disk_cache = self._load_disk_cache()
+        path_hash = hashlib.sha256(os.environ.get("PATH", "").encode()).hexdigest()[:16]
+        now = time.time()
+        to_run = {}
+
+        for key, command in pending.items():
+            binary = shutil.which(command[0])
+            if binary is None:
+                self._results[key] = self._result(False, error="not_found")
+                continue
+
+            try:
+                mtime_ns = os.stat(binary).st_mtime_ns
+            except OSError:
+                self._results[key] = self._result(False, error="not_found")
+                continue
+
+            cached = disk_cache.get(key)
+            if (cached and cached.get("binary") == binary and cached.get("mtime_ns") == mtime_ns
+                    and cached.get("path_hash") == path_hash and now - cached.get("checked_at", 0) < self.ttl):
+                self._results[key] = cached["result"]
+                continue
+
+            to_run[key] = (binary, command, mtime_ns)
+
+        if not to_run:
+            return
+
+        workers = min(self.MAX_WORKERS, len(to_run))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="probe") as executor:
+            futures = {
+                key: executor.submit(self._run, binary, command)
+                for key, (binary, command, _) in to_run.items()
+            }
+
+        for key, future in futures.items():
+            result = future.result()
+            self._results[key] = result
+
+            # Only remember successful probes; failures are re-checked next time
+            if result["returncode"] == 0:
+                binary, _, mtime_ns = to_run[key]
+                disk_cache[key] = {
+                    "binary": binary,
+                    "mtime_ns": mtime_ns,
+                    "path_hash": path_hash,
+                    "checked_at": now,
+                    "result": result
+                }
+
+        self._save_disk_cache(disk_cache)
+
+    def _run(self, binary: str, command: List[str]) -> Dict[str, Any]:
+        """Run a resolved command"""
+        import subprocess
+
+        try:
+            with span("validator.probe", "validator", command=" ".join(command)):
+                completed = subprocess.run(
+                    [binary] + command[1:],
+                    capture_output=True,
+                    text=True,
+                    timeout=self.PROBE_TIMEOUT
+                )
+        except subprocess.TimeoutExpired:
+            return self._result(True, binary, error="timeout")
+        except FileNotFoundError:
+            return self._result(False, error="not_found")
+        except OSError as e:
+            return self._result(True, binary, error=str(e))
+
+        return self._result(True, binary, completed.returncode, completed.stdout, completed.stderr)
+
+    def _result(self, found: bool, path: Optional[str] = None, returncode: Optional[int] = None,
+                stdout: str = "", stderr: str = "", error: Optional[str] = None) -> Dict[str, Any]:
+        """Build a probe result dict"""
+        return {
+            "found": found,
+            "path": path,
+            "returncode": returncode,
+            "stdout": stdout,
+            "stderr": stderr,
+            "error": error
+        }
+
+    def _load_disk_cache(self) -> Dict[str, Any]:
+        """Load the on-disk probe cache (empty if disabled or unreadable)"""
+        if self.ttl <= 0 or not self.cache_file.exists():
+            return {}
+
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (json.JSONDecodeError, IOError):
+            return {}
+
+    def _save_disk_cache(self, cache: Dict[str, Any]) -> None:
+        """Save the on-disk probe cache, ignoring failures"""
+        if self.ttl <= 0:
+            return
+
+        temp_file = self.cache_file.with_name(f"{self.cache_file.name}.{os.getpid()}.tmp")
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                json.dump(cache, f, indent=2)
+            os.replace(temp_file, self.cache_file)
+        except OSError:
+            pass  # The cache is only an optimization
+        finally:
+            if temp_file.exists():
+                temp_file.unlink()
+
+
+_tool_prober: Optional[ToolProber] = None
+_tool_prober_lock = threading.Lock()
+
+
+def get_tool_prober() -> ToolProber:
+    """Get the process-wide tool prober"""
+    global _tool_prober
+    with _tool_prober_lock:
+        if _tool_prober is None:
+            _tool_prober = ToolProber()
+        return _tool_prober
@@ -2,13 +2,15 @@
 System validation for SuperClaude installation requirements
 """
 
-import subprocess
 import sys
 import shutil
 from typing import Tuple, List, Dict, Any, Optional
 from pathlib import Path
 import re
 
+from .tool_prober import ToolProber, get_tool_prober
+from ..utils.profiling import timed
+
 # Handle packaging import - if not available, use a simple version comparison
 try:
     from packaging import version
@@ -53,9 +55,15 @@ except ImportError:
 class Validator:
     """System requirements validator"""
     
-    def __init__(self):
-        """Initialize validator"""
+    def __init__(self, prober: Optional[ToolProber] = None):
+        """
+        Initialize validator
+        
+        Args:
+            prober: Tool prober to use (defaults to the shared, disk-cached prober)
+        """
         self.validation_cache: Dict[str, Any] = {}
+        self.prober = prober or get_tool_prober()
     
     def check_python(self, min_version: str = "3.8", max_version: Optional[str] = None) -> Tuple[bool, str]:
         """
@@ -114,23 +122,22 @@ class Validator:
             return self.validation_cache[cache_key]
         
         try:
-            # Check if node is installed - use shell=True on Windows for better PATH resolution
-            result = subprocess.run(
-                ['node', '--version'],
-                capture_output=True,
-                text=True,
-                timeout=10,
-                shell=(sys.platform == "win32")
-            )
+            # Resolved with shutil.which first; results are cached on disk
+            result = self.prober.probe(['node', '--version'])
+            
+            if result["error"] == "timeout":
+                result_tuple = (False, "Node.js version check timed out")
+                self.validation_cache[cache_key] = result_tuple
+                return result_tuple
             
-            if result.returncode != 0:
+            if result["returncode"] != 0:
                 help_msg = self.get_installation_help("node")
                 result_tuple = (False, f"Node.js not found in PATH{help_msg}")
                 self.validation_cache[cache_key] = result_tuple
                 return result_tuple
             
             # Parse version (format: v18.17.0)
-            version_output = result.stdout.strip()
+            version_output = result["stdout"].strip()
             if version_output.startswith('v'):
                 current_version = version_output[1:]
             else:
@@ -153,15 +160,6 @@ class Validator:
             self.validation_cache[cache_key] = result_tuple
             return result_tuple
             
-        except subprocess.TimeoutExpired:
-            result_tuple = (False, "Node.js version check timed out")
-            self.validation_cache[cache_key] = result_tuple
-            return result_tuple
-        except FileNotFoundError:
-            help_msg = self.get_installation_help("node")
-            result_tuple = (False, f"Node.js not found in PATH{help_msg}")
-            self.validation_cache[cache_key] = result_tuple
-            return result_tuple
         except Exception as e:
             result_tuple = (False, f"Could not check Node.js version: {e}")
             self.validation_cache[cache_key] = result_tuple
@@ -182,23 +180,22 @@ class Validator:
             return self.validation_cache[cache_key]
         
         try:
-            # Check if claude is installed - use shell=True on Windows for better PATH resolution
-            result = subprocess.run(
-                ['claude', '--version'],
-                capture_output=True,
-                text=True,
-                timeout=10,
-                shell=(sys.platform == "win32")
-            )
+            # Resolved with shutil.which first; results are cached on disk
+            result = self.prober.probe(['claude', '--version'])
             
-            if result.returncode != 0:
+            if result["error"] == "timeout":
+                result_tuple = (False, "Claude CLI version check timed out")
+                self.validation_cache[cache_key] = result_tuple
+                return result_tuple
+            
+            if result["returncode"] != 0:
                 help_msg = self.get_installation_help("claude_cli")
                 result_tuple = (False, f"Claude CLI not found in PATH{help_msg}")
                 self.validation_cache[cache_key] = result_tuple
                 return result_tuple
             
             # Parse version from output
-            version_output = result.stdout.strip()
+            version_output = result["stdout"].strip()
             version_match = re.search(r'(\d+\.\d+\.\d+)', version_output)
             
             if not version_match:
@@ -218,15 +215,6 @@ class Validator:
             self.validation_cache[cache_key] = result_tuple
             return result_tuple
             
-        except subprocess.TimeoutExpired:
-            result_tuple = (False, "Claude CLI version check timed out")
-            self.validation_cache[cache_key] = result_tuple
-            return result_tuple
-        except FileNotFoundError:
-            help_msg = self.get_installation_help("claude_cli")
-            result_tuple = (False, f"Claude CLI not found in PATH{help_msg}")
-            self.validation_cache[cache_key] = result_tuple
-            return result_tuple
         except Exception as e:
             result_tuple = (False, f"Could not check Claude CLI: {e}")
             self.validation_cache[cache_key] = result_tuple
@@ -252,22 +240,26 @@ class Validator:
             # Split command into parts
             cmd_parts = command.split()
             
-            result = subprocess.run(
-                cmd_parts,
-                capture_output=True,
-                text=True,
-                timeout=10,
-                shell=(sys.platform == "win32")
-            )
+            result = self.prober.probe(cmd_parts)
+            
+            if result["error"] == "timeout":
+                result_tuple = (False, f"{tool_name} check timed out")
+                self.validation_cache[cache_key] = result_tuple
+                return result_tuple
+            
+            if result["error"] == "not_found":
+                result_tuple = (False, f"{tool_name} not found in PATH")
+                self.validation_cache[cache_key] = result_tuple
+                return result_tuple
             
-            if result.returncode != 0:
+            if result["returncode"] != 0:
                 result_tuple = (False, f"{tool_name} not found or command failed")
                 self.validation_cache[cache_key] = result_tuple
                 return result_tuple
             
             # Extract version if min_version specified
             if min_version:
-                version_output = result.stdout + result.stderr
+                version_output = result["stdout"] + result["stderr"]
                 version_match = re.search(r'(\d+\.\d+(?:\.\d+)?)', version_output)
                 
                 if version_match:
@@ -290,14 +282,6 @@ class Validator:
                 self.validation_cache[cache_key] = result_tuple
                 return result_tuple
                 
-        except subprocess.TimeoutExpired:
-            result_tuple = (False, f"{tool_name} check timed out")
-            self.validation_cache[cache_key] = result_tuple
-            return result_tuple
-        except FileNotFoundError:
-            result_tuple = (False, f"{tool_name} not found in PATH")
-            self.validation_cache[cache_key] = result_tuple
-            return result_tuple
         except Exception as e:
             result_tuple = (False, f"Could not check {tool_name}: {e}")
             self.validation_cache[cache_key] = result_tuple
@@ -372,6 +356,7 @@ class Validator:
             self.validation_cache[cache_key] = result
             return result
     
+    @timed("validator.requirements", "validator")
     def validate_requirements(self, requirements: Dict[str, Any]) -> Tuple[bool, List[str]]:
         """
         Validate all system requirements
@@ -384,6 +369,15 @@ class Validator:
         """
         errors = []
         
+        # Probe all required tools concurrently; the checks below reuse the results
+        commands = []
+        if "node" in requirements:
+            commands.append(["node", "--version"])
+        for tool_req in requirements.get("external_tools", {}).values():
+            commands.append(tool_req["command"].split())
+        if commands:
+            self.prober.probe_many(commands)
+        
         # Check Python requirements
         if "python" in requirements:
             python_req = requirements["python"]
@@ -490,6 +484,8 @@ class Validator:
             "python_executable": sys.executable
         }
         
+        self.prober.probe_many([["node", "--version"], ["claude", "--version"]])
+        
         # Add Node.js info if available
         node_success, node_msg = self.check_node()
         info["node_available"] = node_success
@@ -589,6 +585,8 @@ class Validator:
             "recommendations": []
         }
         
+        self.prober.probe_many([["node", "--version"], ["claude", "--version"]])
+        
         # Check Python
         python_success, python_msg = self.check_python()
         diagnostics["checks"]["python"] = {
@@ -649,19 +647,9 @@ class Validator:
         for tool_alternatives, display_name in tool_checks:
             tool_found = False
             for tool in tool_alternatives:
-                try:
-                    result = subprocess.run(
-                        ["which" if sys.platform != "win32" else "where", tool],
-                        capture_output=True,
-                        text=True,
-                        timeout=5,
-                        shell=(sys.platform == "win32")
-                    )
-                    if result.returncode == 0:
-                        tool_found = True
-                        break
-                except Exception:
-                    continue
+                if shutil.which(tool):
+                    tool_found = True
+                    break
             
             if not tool_found:
                 # Only report as missing if none of the alternatives were found
@@ -683,3 +671,4 @@ class Validator:
     def clear_cache(self) -> None:
         """Clear validation cache"""
         self.validation_cache.clear()
+        self.prober.clear()
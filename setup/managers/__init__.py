@@ -1,9 +1,15 @@
 from .config_manager import ConfigManager
 from .settings_manager import SettingsManager
 from .file_manager import FileManager
+from .manifest_manager import ManifestManager
+from .backup_manager import BackupManager
+from .journal_manager import JournalManager
 
 __all__ = [
     'ConfigManager',
     'SettingsManager',
-    'FileManager'
+    'FileManager',
+    'ManifestManager',
+    'BackupManager',
+    'JournalManager'
 ]
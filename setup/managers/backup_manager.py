@@ -0,0 +1,997 @@
+"""
+Backup management for SuperClaude installation system
+Streams installation files straight into compressed tar archives
+"""
+
+import fnmatch
+import hashlib
+import io
+import json
+import os
+import shutil
+import stat
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Set, Tuple, Iterator, BinaryIO, Callable, TYPE_CHECKING
+
+# tarfile and the compression modules are imported where they are used
+# so that listing backups from the catalog stays cheap at CLI startup
+if TYPE_CHECKING:
+    import tarfile
+
+from .file_manager import FileManager
+from .settings_manager import SettingsManager
+from .manifest_manager import ManifestManager
+from ..utils.walker import walk, WalkResult
+from ..utils.ignore import IgnoreMatcher
+from ..utils.profiling import timed
+
+
+def _load_zstandard():
+    """Import the optional zstandard package (None if not installed)"""
+    try:
+        import zstandard
+    except ImportError:
+        return None
+    return zstandard
+
+
+class BackupManager:
+    """Creates and reads installation backup archives"""
+
+    METADATA_NAME = "backup_metadata.json"
+    BACKUP_VERSION = "3.0.0"
+
+    # Incremental backups: per-backup manifest + content-addressed objects
+    MANIFEST_SUFFIX = ".manifest.json"
+    OBJECTS_DIR_NAME = "objects"
+
+    # Catalog of backup summaries so listing never opens archives
+    CATALOG_NAME = "backup_catalog.json"
+    CATALOG_VERSION = 1
+
+    # Archive suffix per compression method
+    COMPRESSION_SUFFIXES = {
+        "none": ".tar",
+        "gzip": ".tar.gz",
+        "bzip2": ".tar.bz2",
+        "xz": ".tar.xz",
+        "zstd": ".tar.zst"
+    }
+
+    # External multi-threaded compressors used when --threads > 1
+    PARALLEL_COMPRESSORS = {
+        "gzip": ["pigz", "-p", "{threads}"],
+        "xz": ["xz", "-T", "{threads}"],
+        "zstd": ["zstd", "-q", "-T{threads}"]
+    }
+
+    # Writer threads used by restore_backup
+    RESTORE_WORKERS = 4
+
+    # Top-level directories of the installation that are never backed up
+    EXCLUDED_DIRS = {"backups", "logs", ".superclaude-journal"}
+
+    # Threads scanning the installation directory
+    WALK_WORKERS = 4
+
+    def __init__(self, install_dir: Path, backup_dir: Optional[Path] = None,
+                 ignore_patterns: Optional[List[str]] = None):
+        """
+        Initialize backup manager
+
+        Args:
+            install_dir: Installation directory to back up
+            backup_dir: Directory holding backups (default: <install_dir>/backups)
+            ignore_patterns: Gitignore-style patterns for files left out of new backups
+        """
+        self.install_dir = install_dir
+        self.backup_dir = backup_dir or install_dir / "backups"
+        self.ignore_matcher = IgnoreMatcher(ignore_patterns or [])
+        self.file_manager = FileManager()
+        self.objects_dir = self.backup_dir / self.OBJECTS_DIR_NAME
+        self.catalog_file = self.backup_dir / self.CATALOG_NAME
+
+    def build_metadata(self, files_count: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Build metadata describing the current installation
+
+        Args:
+            files_count: Number of files in the backup (optional)
+
+        Returns:
+            Metadata dict stored as backup_metadata.json in the archive
+        """
+        metadata = {
+            "backup_version": self.BACKUP_VERSION,
+            "created": datetime.now().isoformat(),
+            "install_dir": str(self.install_dir),
+            "components": {},
+            "framework_version": "unknown"
+        }
+
+        if files_count is not None:
+            metadata["files"] = files_count
+
+        try:
+            # Get installed components from metadata
+            settings_manager = SettingsManager(self.install_dir)
+            framework_config = settings_manager.get_metadata_setting("framework")
+
+            if framework_config:
+                metadata["framework_version"] = framework_config.get("version", "unknown")
+
+                if "components" in framework_config:
+                    for component_name in framework_config["components"]:
+                        version = settings_manager.get_component_version(component_name)
+                        if version:
+                            metadata["components"][component_name] = version
+
+            for component_name, info in settings_manager.get_installed_components().items():
+                if info.get("version"):
+                    metadata["components"][component_name] = info["version"]
+
+            # Which component owns each file, for selective restore
+            metadata["file_components"] = self._current_file_components()
+        except Exception:
+            pass  # Continue without metadata
+
+        return metadata
+
+    def collect_files(self) -> List[Tuple[Path, str]]:
+        """
+        Walk the installation directory, pruning excluded subtrees
+
+        Returns:
+            List of (path, archive name) tuples in a stable order
+        """
+        return [(path, arcname) for path, arcname, _ in self._walk_install_dir().files]
+
+    def _walk_install_dir(self) -> WalkResult:
+        """Scan the installation directory once, keeping each file's stat result"""
+        excluded = set(self.EXCLUDED_DIRS)
+        try:
+            excluded.add(self.backup_dir.relative_to(self.install_dir).as_posix())
+        except ValueError:
+            pass  # Backup directory lives outside the installation
+
+        return walk(self.install_dir, exclude=excluded, ignore=self.ignore_matcher or None,
+                    workers=self.WALK_WORKERS)
+
+    @timed("backup.create", "backup")
+    def create_backup(self, name: Optional[str] = None, compression: str = "gzip",
+                      level: Optional[int] = None, threads: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Create a backup archive of the installation in a single streaming pass
+
+        Args:
+            name: Backup name prefix (default: superclaude_backup)
+            compression: One of COMPRESSION_SUFFIXES
+            level: Compression level (compressor default if None)
+            threads: Compression threads (uses an external compressor if > 1)
+
+        Returns:
+            Dict with path, files, size, bytes_read, duration, skipped and metadata
+
+        Raises:
+            ValueError: If compression method is unsupported
+            IOError: If the archive could not be written
+        """
+        import tarfile
+
+        if compression not in self.COMPRESSION_SUFFIXES:
+            raise ValueError(f"Unsupported compression method: {compression}")
+
+        self.backup_dir.mkdir(parents=True, exist_ok=True)
+
+        backup_file = self._new_backup_path(name, self.COMPRESSION_SUFFIXES[compression])
+        backup_name = backup_file.name[:-len(self.COMPRESSION_SUFFIXES[compression])]
+
+        # Written under a temporary name so partial archives are never listed
+        temp_file = self.backup_dir / f".{backup_name}.tmp"
+
+        start_time = time.time()
+        files = self.collect_files()
+        metadata = self.build_metadata(files_count=len(files))
+        files_added = 0
+        bytes_read = 0
+        skipped = []
+
+        try:
+            with self._open_compressed_writer(temp_file, compression, level, threads) as stream:
+                with tarfile.open(fileobj=stream, mode="w|") as tar:
+                    self._add_bytes(tar, self.METADATA_NAME, json.dumps(metadata, indent=2).encode())
+
+                    for path, arcname in files:
+                        try:
+                            bytes_read += self._add_file(tar, path, arcname)
+                            files_added += 1
+                        except OSError:
+                            skipped.append(arcname)  # File vanished or is unreadable
+
+            os.replace(temp_file, backup_file)
+        finally:
+            if temp_file.exists():
+                temp_file.unlink()
+
+        backup_size = backup_file.stat().st_size
+        self.add_to_catalog(backup_file, backup_size, files_added, metadata)
+
+        return {
+            "path": backup_file,
+            "files": files_added,
+            "size": backup_size,
+            "bytes_read": bytes_read,
+            "duration": time.time() - start_time,
+            "skipped": skipped,
+            "metadata": metadata
+        }
+
+    @classmethod
+    def read_backup_info(cls, backup_path: Path) -> Dict[str, Any]:
+        """
+        Get information about a backup archive
+
+        Reads only the leading metadata member when it records the file count.
+
+        Args:
+            backup_path: Path to backup archive
+
+        Returns:
+            Dict with path, exists, size, created, metadata and files
+            ("error" is set if the archive couldn't be read)
+        """
+        info = {
+            "path": backup_path,
+            "exists": backup_path.exists(),
+            "size": 0,
+            "created": None,
+            "metadata": {}
+        }
+
+        if not info["exists"]:
+            return info
+
+        try:
+            stats = backup_path.stat()
+            info["size"] = stats.st_size
+            info["created"] = datetime.fromtimestamp(stats.st_mtime)
+
+            if cls.is_manifest(backup_path):
+                manifest = cls.load_manifest(backup_path)
+                info["metadata"] = manifest["metadata"]
+                info["files"] = len(manifest["files"])
+                info["size"] = sum(entry["size"] for entry in manifest["files"].values())
+                return info
+
+            with cls.open_archive(backup_path) as tar:
+                count = 0
+                for member in tar:
+                    if member.name == cls.METADATA_NAME:
+                        metadata_file = tar.extractfile(member)
+                        if metadata_file:
+                            info["metadata"] = json.loads(metadata_file.read().decode())
+                        if "files" in info["metadata"]:
+                            break
+                    else:
+                        count += 1
+
+                info["files"] = info["metadata"].get("files", count)
+
+        except Exception as e:
+            info["error"] = str(e)
+
+        return info
+
+    @classmethod
+    def is_manifest(cls, backup_path: Path) -> bool:
+        """Check whether a backup path is an incremental backup manifest"""
+        return backup_path.name.endswith(cls.MANIFEST_SUFFIX)
+
+    @staticmethod
+    def load_manifest(manifest_path: Path) -> Dict[str, Any]:
+        """
+        Load an incremental backup manifest
+
+        Raises:
+            ValueError: If the manifest can't be read
+        """
+        try:
+            with open(manifest_path, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+        except (json.JSONDecodeError, IOError) as e:
+            raise ValueError(f"Could not read backup manifest {manifest_path}: {e}")
+
+        if "files" not in manifest:
+            raise ValueError(f"Invalid backup manifest: {manifest_path}")
+
+        manifest.setdefault("metadata", {})
+        return manifest
+
+    def list_manifests(self) -> List[Path]:
+        """Get incremental backup manifests in the backup directory"""
+        if not self.backup_dir.exists():
+            return []
+        return sorted(self.backup_dir.glob(f"*{self.MANIFEST_SUFFIX}"))
+
+    @timed("backup.create_incremental", "backup")
+    def create_incremental_backup(self, name: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Create an incremental backup
+
+        File contents go to the object store keyed by sha256, so content shared
+        with earlier backups is stored once. Files whose size and mtime match
+        the newest manifest are not rehashed.
+
+        Args:
+            name: Backup name prefix (default: superclaude_backup)
+
+        Returns:
+            Dict with path, files, size, new_objects, bytes_stored, duration,
+            skipped and metadata
+        """
+        self.objects_dir.mkdir(parents=True, exist_ok=True)
+
+        manifest_file = self._new_backup_path(name, self.MANIFEST_SUFFIX)
+
+        start_time = time.time()
+        previous = self._latest_manifest_files()
+        entries = {}
+        skipped = []
+        new_objects = 0
+        bytes_stored = 0
+
+        for path, arcname, st in self._walk_install_dir().files:
+            try:
+                if not stat.S_ISREG(st.st_mode):
+                    raise OSError(f"Not a regular file: {path}")
+
+                old = previous.get(arcname)
+                if (old and old["size"] == st.st_size and old["mtime_ns"] == st.st_mtime_ns
+                        and self._object_path(old["sha256"]).exists()):
+                    digest = old["sha256"]
+                else:
+                    digest, stored = self._store_object(path)
+                    if stored:
+                        new_objects += 1
+                        bytes_stored += st.st_size
+
+                entries[arcname] = {
+                    "sha256": digest,
+                    "size": st.st_size,
+                    "mode": stat.S_IMODE(st.st_mode),
+                    "mtime_ns": st.st_mtime_ns
+                }
+            except OSError:
+                skipped.append(arcname)  # File vanished or is unreadable
+
+        metadata = self.build_metadata(files_count=len(entries))
+        metadata["type"] = "incremental"
+        self._write_json(manifest_file, {"metadata": metadata, "files": entries})
+
+        total_size = sum(entry["size"] for entry in entries.values())
+        self.add_to_catalog(manifest_file, total_size, len(entries), metadata)
+
+        return {
+            "path": manifest_file,
+            "files": len(entries),
+            "size": total_size,
+            "new_objects": new_objects,
+            "bytes_stored": bytes_stored,
+            "duration": time.time() - start_time,
+            "skipped": skipped,
+            "metadata": metadata
+        }
+
+    @timed("backup.restore", "backup")
+    def restore_backup(self, backup_path: Path, components: Optional[List[str]] = None,
+                       patterns: Optional[List[str]] = None, overwrite: bool = False,
+                       max_workers: Optional[int] = None) -> Dict[str, List[str]]:
+        """
+        Restore files from a backup archive or incremental backup manifest
+
+        The archive is read sequentially; file writes run on a bounded pool.
+        Existing files whose content already matches the backup are left alone.
+
+        Args:
+            backup_path: Backup archive or manifest
+            components: Only restore files belonging to these components
+            patterns: Only restore files matching these glob patterns
+            overwrite: Replace files that already exist
+            max_workers: Writer threads (default: RESTORE_WORKERS)
+
+        Returns:
+            Dict with restored, unchanged, existing and failed relative paths
+        """
+        import tarfile
+        # The "data" filter rejects absolute paths, links that leave
+        # install_dir and device files (Python 3.12+ and security backports)
+        extract_args = {"filter": "data"} if hasattr(tarfile, "data_filter") else {}
+
+        workers = max_workers or self.RESTORE_WORKERS
+        result = {"restored": [], "unchanged": [], "existing": [], "failed": []}
+        is_manifest = self.is_manifest(backup_path)
+        manifest = self.load_manifest(backup_path) if is_manifest else None
+        selected = self._restore_filter(backup_path, manifest, components, patterns)
+
+        # Bounds the file contents held in memory by queued writes
+        window = threading.BoundedSemaphore(workers * 2)
+        futures = []
+
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="restore") as executor:
+
+            def submit(fn, *args) -> None:
+                window.acquire()
+                future = executor.submit(fn, *args)
+                future.add_done_callback(lambda _: window.release())
+                futures.append(future)
+
+            if is_manifest:
+                for rel_path, entry in manifest["files"].items():
+                    if not selected(rel_path):
+                        continue
+                    status = self._check_restore_target(rel_path, overwrite)
+                    if status:
+                        result[status].append(rel_path)
+                    else:
+                        submit(self._restore_object_if_changed, rel_path, entry)
+            else:
+                with self.open_archive(backup_path) as tar:
+                    for member in tar:
+                        rel_path = member.name
+                        if rel_path == self.METADATA_NAME or member.isdir() or not selected(rel_path):
+                            continue
+                        status = self._check_restore_target(rel_path, overwrite)
+                        if status:
+                            result[status].append(rel_path)
+                        elif member.isreg():
+                            data = tar.extractfile(member).read()
+                            submit(self._write_if_changed, rel_path, data, member.mode, member.mtime)
+                        else:
+                            try:
+                                tar.extract(member, self.install_dir, **extract_args)
+                                result["restored"].append(rel_path)
+                            except (OSError, tarfile.TarError):
+                                result["failed"].append(rel_path)
+
+            for future in futures:
+                rel_path, status = future.result()
+                result[status].append(rel_path)
+
+        return result
+
+    def collect_garbage(self) -> Tuple[int, int]:
+        """
+        Remove objects no longer referenced by any manifest
+
+        Returns:
+            Tuple of (objects removed, bytes freed)
+
+        Raises:
+            ValueError: If a manifest can't be read (nothing is removed then)
+        """
+        if not self.objects_dir.exists():
+            return 0, 0
+
+        referenced: Set[str] = set()
+        for manifest_path in self.list_manifests():
+            manifest = self.load_manifest(manifest_path)
+            referenced.update(entry["sha256"] for entry in manifest["files"].values())
+
+        removed = 0
+        freed = 0
+        for fanout_dir in self.objects_dir.iterdir():
+            if not fanout_dir.is_dir():
+                continue
+
+            for object_file in fanout_dir.iterdir():
+                if fanout_dir.name + object_file.name in referenced:
+                    continue
+                try:
+                    size = object_file.stat().st_size
+                    object_file.unlink()
+                    removed += 1
+                    freed += size
+                except OSError:
+                    pass
+
+            try:
+                fanout_dir.rmdir()  # Only succeeds once empty
+            except OSError:
+                pass
+
+        return removed, freed
+
+    def list_backup_files(self) -> List[Path]:
+        """Get backup archives and incremental backup manifests in the backup directory"""
+        if not self.backup_dir.exists():
+            return []
+
+        backup_files = list(self.backup_dir.glob("*.tar*")) + self.list_manifests()
+        return [path for path in backup_files if path.is_file()]
+
+    def load_catalog(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Load the backup catalog
+
+        Returns:
+            Dict of backup file name -> catalog entry (empty if missing or unreadable)
+        """
+        if not self.catalog_file.exists():
+            return {}
+
+        try:
+            with open(self.catalog_file, 'r', encoding='utf-8') as f:
+                catalog = json.load(f)
+        except (json.JSONDecodeError, IOError):
+            return {}
+
+        if catalog.get("catalog_version") != self.CATALOG_VERSION:
+            return {}
+
+        return catalog.get("backups", {})
+
+    def save_catalog(self, entries: Dict[str, Dict[str, Any]]) -> None:
+        """Save the backup catalog"""
+        self.backup_dir.mkdir(parents=True, exist_ok=True)
+        self._write_json(self.catalog_file, {
+            "catalog_version": self.CATALOG_VERSION,
+            "backups": entries
+        })
+
+    def add_to_catalog(self, backup_path: Path, size: int, files: int,
+                       metadata: Dict[str, Any]) -> None:
+        """
+        Record a newly created backup in the catalog
+
+        Args:
+            backup_path: Backup archive or manifest
+            size: Backup size as reported by read_backup_info
+            files: Number of files in the backup
+            metadata: Backup metadata
+        """
+        entries = self.load_catalog()
+        entries[backup_path.name] = self._catalog_entry(backup_path, {
+            "size": size,
+            "files": files,
+            "metadata": metadata
+        })
+        self.save_catalog(entries)
+
+    def remove_from_catalog(self, backup_paths: List[Path]) -> None:
+        """Drop removed backups from the catalog"""
+        entries = self.load_catalog()
+        for backup_path in backup_paths:
+            entries.pop(backup_path.name, None)
+        self.save_catalog(entries)
+
+    def mark_restored(self, backup_path: Path) -> None:
+        """Record when a backup was last restored"""
+        entries = self.load_catalog()
+        if backup_path.name in entries:
+            entries[backup_path.name]["last_restored"] = datetime.now().isoformat()
+            self.save_catalog(entries)
+
+    def list_backups(self) -> List[Dict[str, Any]]:
+        """
+        List backups from the catalog
+
+        Only backups missing from the catalog, or whose size/mtime changed,
+        are opened; the catalog is updated with what was found.
+
+        Returns:
+            List of backup info dicts (as read_backup_info), newest first
+        """
+        entries = self.load_catalog()
+        current = {}
+        changed = False
+        backups = []
+
+        for backup_path in self.list_backup_files():
+            entry = entries.get(backup_path.name)
+            try:
+                st = backup_path.stat()
+            except OSError:
+                continue
+
+            if entry is None or entry.get("mtime_ns") != st.st_mtime_ns:
+                info = self.read_backup_info(backup_path)
+                if "error" not in info:
+                    entry = self._catalog_entry(backup_path, info)
+                    changed = True
+                else:
+                    backups.append(info)
+                    continue
+
+            current[backup_path.name] = entry
+            backups.append(self._info_from_entry(backup_path, entry))
+
+        if changed or len(current) != len(entries):
+            self.save_catalog(current)
+
+        backups.sort(key=lambda x: x.get("created") or datetime.min, reverse=True)
+        return backups
+
+    def rebuild_catalog(self, max_workers: Optional[int] = None) -> int:
+        """
+        Rebuild the catalog by reading every backup in parallel
+
+        Args:
+            max_workers: Maximum reader threads (ThreadPoolExecutor default if None)
+
+        Returns:
+            Number of backups indexed
+        """
+        backup_files = self.list_backup_files()
+
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="backup-index") as executor:
+            infos = list(executor.map(self.read_backup_info, backup_files))
+
+        entries = {}
+        for info in infos:
+            if "error" not in info:
+                entries[info["path"].name] = self._catalog_entry(info["path"], info)
+
+        self.save_catalog(entries)
+        return len(entries)
+
+    def _catalog_entry(self, backup_path: Path, info: Dict[str, Any]) -> Dict[str, Any]:
+        """Build a catalog entry from backup info"""
+        st = backup_path.stat()
+        metadata = info.get("metadata", {})
+        return {
+            "size": info["size"],
+            "mtime_ns": st.st_mtime_ns,
+            "created": datetime.fromtimestamp(st.st_mtime).isoformat(),
+            "files": info.get("files"),
+            "type": "incremental" if self.is_manifest(backup_path) else "archive",
+            "components": metadata.get("components", {}),
+            "framework_version": metadata.get("framework_version", "unknown")
+        }
+
+    def _info_from_entry(self, backup_path: Path, entry: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert a catalog entry to the read_backup_info format"""
+        return {
+            "path": backup_path,
+            "exists": True,
+            "size": entry["size"],
+            "created": datetime.fromisoformat(entry["created"]),
+            "files": entry.get("files"),
+            "metadata": {
+                "components": entry.get("components", {}),
+                "framework_version": entry.get("framework_version", "unknown"),
+                "type": entry.get("type")
+            }
+        }
+
+    def _latest_manifest_files(self) -> Dict[str, Dict[str, Any]]:
+        """Get file entries of the most recent readable manifest"""
+        manifests = sorted(self.list_manifests(), key=lambda p: p.stat().st_mtime, reverse=True)
+        for manifest_path in manifests:
+            try:
+                return self.load_manifest(manifest_path)["files"]
+            except ValueError:
+                continue
+        return {}
+
+    def _restore_filter(self, backup_path: Path, manifest: Optional[Dict[str, Any]],
+                        components: Optional[List[str]], patterns: Optional[List[str]]) -> Callable[[str], bool]:
+        """Build a predicate selecting which relative paths to restore"""
+        if not components and not patterns:
+            return lambda rel_path: True
+
+        allowed = None
+        if components:
+            if manifest is not None:
+                metadata = manifest["metadata"]
+            else:
+                metadata = self._read_archive_metadata(backup_path)
+
+            # Backups made before file ownership was recorded use the live install manifest
+            file_components = metadata.get("file_components") or self._current_file_components()
+            wanted = set(components)
+            allowed = {path for path, component in file_components.items() if component in wanted}
+
+        def selected(rel_path: str) -> bool:
+            if allowed is not None and rel_path not in allowed:
+                return False
+            if patterns and not any(fnmatch.fnmatch(rel_path, pattern) for pattern in patterns):
+                return False
+            return True
+
+        return selected
+
+    def _read_archive_metadata(self, backup_path: Path) -> Dict[str, Any]:
+        """Read the metadata member of an archive (empty dict if missing)"""
+        with self.open_archive(backup_path) as tar:
+            for member in tar:
+                if member.name == self.METADATA_NAME:
+                    return json.loads(tar.extractfile(member).read().decode())
+        return {}
+
+    def _current_file_components(self) -> Dict[str, str]:
+        """Get relative path -> component from the install manifest"""
+        manifest = ManifestManager(self.install_dir).load_manifest()
+        return {path: entry["component"] for path, entry in manifest["files"].items()}
+
+    def _check_restore_target(self, rel_path: str, overwrite: bool) -> Optional[str]:
+        """
+        Decide whether a file may be restored
+
+        Returns:
+            "failed" for paths escaping the installation, "existing" for files
+            kept because overwrite is off, None if the file should be restored
+        """
+        target = self.install_dir / rel_path
+        if Path(rel_path).is_absolute() or self.install_dir.resolve() not in target.resolve().parents:
+            return "failed"
+        if not overwrite and (target.exists() or target.is_symlink()):
+            return "existing"
+        return None
+
+    def _restore_object_if_changed(self, rel_path: str, entry: Dict[str, Any]) -> Tuple[str, str]:
+        """Restore an object unless the target already has its content"""
+        target = self.install_dir / rel_path
+        try:
+            if self._matches(target, entry["size"], lambda: entry["sha256"]):
+                return rel_path, "unchanged"
+            self._restore_object(entry, target)
+            return rel_path, "restored"
+        except OSError:
+            return rel_path, "failed"
+
+    def _write_if_changed(self, rel_path: str, data: bytes, mode: int, mtime: float) -> Tuple[str, str]:
+        """Write archive member data unless the target already has that content"""
+        target = self.install_dir / rel_path
+        try:
+            if self._matches(target, len(data), lambda: hashlib.sha256(data).hexdigest()):
+                return rel_path, "unchanged"
+
+            target.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = target.with_name(f".{target.name}.{os.getpid()}.tmp")
+            try:
+                with open(temp_path, 'wb') as f:
+                    f.write(data)
+                os.chmod(temp_path, mode)
+                os.utime(temp_path, (mtime, mtime))
+                os.replace(temp_path, target)
+            finally:
+                if temp_path.exists():
+                    temp_path.unlink()
+            return rel_path, "restored"
+        except OSError:
+            return rel_path, "failed"
+
+    def _matches(self, target: Path, size: int, digest: Callable[[], str]) -> bool:
+        """Check whether target is a regular file with the given size and sha256"""
+        try:
+            st = target.lstat()
+        except OSError:
+            return False
+
+        if not stat.S_ISREG(st.st_mode) or st.st_size != size:
+            return False
+
+        return self.file_manager.get_file_hash(target) == digest()
+
+    def _new_backup_path(self, name: Optional[str], suffix: str) -> Path:
+        """Get a timestamped backup path that doesn't exist yet"""
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        backup_name = f"{name or 'superclaude_backup'}_{timestamp}"
+
+        backup_path = self.backup_dir / f"{backup_name}{suffix}"
+        counter = 1
+        while backup_path.exists():
+            backup_path = self.backup_dir / f"{backup_name}_{counter}{suffix}"
+            counter += 1
+        return backup_path
+
+    def _object_path(self, digest: str) -> Path:
+        """Get object store path for a sha256 digest"""
+        return self.objects_dir / digest[:2] / digest[2:]
+
+    def _store_object(self, path: Path) -> Tuple[str, bool]:
+        """
+        Add a file to the object store
+
+        Returns:
+            Tuple of (sha256 digest, whether a new object was written)
+
+        Raises:
+            OSError: If the file can't be read
+        """
+        digest = self.file_manager.get_file_hash(path)
+        if digest is None:
+            raise OSError(f"Could not read {path}")
+
+        object_path = self._object_path(digest)
+        if object_path.exists():
+            return digest, False
+
+        object_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = object_path.with_name(f".{object_path.name}.{os.getpid()}.tmp")
+        try:
+            shutil.copyfile(path, temp_path)
+            os.replace(temp_path, object_path)
+        finally:
+            if temp_path.exists():
+                temp_path.unlink()
+
+        return digest, True
+
+    def _restore_object(self, entry: Dict[str, Any], target: Path) -> None:
+        """Copy an object back to its target, restoring mode and mtime"""
+        target.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = target.with_name(f".{target.name}.{os.getpid()}.tmp")
+        try:
+            shutil.copyfile(self._object_path(entry["sha256"]), temp_path)
+            os.chmod(temp_path, entry["mode"])
+            os.utime(temp_path, ns=(entry["mtime_ns"], entry["mtime_ns"]))
+            os.replace(temp_path, target)
+        finally:
+            if temp_path.exists():
+                temp_path.unlink()
+
+    def _write_json(self, path: Path, data: Dict[str, Any]) -> None:
+        """Write JSON through a temporary file and rename it into place"""
+        temp_path = path.with_name(f".{path.name}.tmp")
+        try:
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2)
+            os.replace(temp_path, path)
+        finally:
+            if temp_path.exists():
+                temp_path.unlink()
+
+    @staticmethod
+    @contextmanager
+    def open_archive(backup_path: Path) -> Iterator["tarfile.TarFile"]:
+        """
+        Open a backup archive for sequential reading
+
+        Members must be consumed in order (``for member in tar``), which works
+        for every supported compression including zstd streams.
+
+        Args:
+            backup_path: Path to backup archive
+        """
+        import tarfile
+
+        if backup_path.suffix != ".zst":
+            with tarfile.open(backup_path, "r:*") as tar:
+                yield tar
+            return
+
+        zstandard = _load_zstandard()
+        with open(backup_path, 'rb') as raw:
+            if zstandard is not None:
+                with zstandard.ZstdDecompressor().stream_reader(raw) as reader:
+                    with tarfile.open(fileobj=reader, mode="r|") as tar:
+                        yield tar
+                return
+
+            tool = shutil.which("zstd")
+            if not tool:
+                raise IOError("Reading zstd backups requires the 'zstandard' package or the zstd command")
+
+            import subprocess
+
+            proc = subprocess.Popen([tool, "-dcq"], stdin=raw, stdout=subprocess.PIPE)
+            try:
+                with tarfile.open(fileobj=proc.stdout, mode="r|") as tar:
+                    yield tar
+            finally:
+                proc.stdout.close()
+                proc.wait()
+
+    @contextmanager
+    def _open_compressed_writer(self, path: Path, compression: str,
+                                level: Optional[int], threads: Optional[int]) -> Iterator[BinaryIO]:
+        """
+        Open a writable stream that compresses into path
+
+        Args:
+            path: Output file
+            compression: Compression method
+            level: Compression level or None
+            threads: Compression threads or None
+        """
+        with open(path, 'wb') as raw:
+            if compression == "none":
+                yield raw
+                return
+
+            # zstandard handles threads itself
+            zstandard = _load_zstandard() if compression == "zstd" else None
+            if zstandard is not None:
+                compressor = zstandard.ZstdCompressor(
+                    level=level if level is not None else 3,
+                    threads=threads or 0
+                )
+                with compressor.stream_writer(raw, closefd=False) as stream:
+                    yield stream
+                return
+
+            command = self._parallel_command(compression, level, threads)
+            if command:
+                import subprocess
+                proc = subprocess.Popen(command, stdin=subprocess.PIPE, stdout=raw)
+                try:
+                    yield proc.stdin
+                finally:
+                    proc.stdin.close()
+                    returncode = proc.wait()
+                if returncode != 0:
+                    raise IOError(f"{command[0]} exited with status {returncode}")
+                return
+
+            if compression == "gzip":
+                import gzip
+                stream = gzip.GzipFile(fileobj=raw, mode='wb',
+                                       compresslevel=level if level is not None else 6)
+            elif compression == "bzip2":
+                import bz2
+                stream = bz2.BZ2File(raw, 'wb', compresslevel=level if level is not None else 9)
+            elif compression == "xz":
+                import lzma
+                stream = lzma.LZMAFile(raw, 'wb', preset=level)
+            else:
+                raise ValueError("zstd compression requires the 'zstandard' package or the zstd command")
+
+            with stream:
+                yield stream
+
+    def _parallel_command(self, compression: str, level: Optional[int],
+                          threads: Optional[int]) -> Optional[List[str]]:
+        """Get external compressor command line (None if not applicable)"""
+        template = self.PARALLEL_COMPRESSORS.get(compression)
+        if not template:
+            return None
+
+        # zstd has no in-process fallback without the zstandard package
+        if (not threads or threads < 2) and compression != "zstd":
+            return None
+
+        tool = shutil.which(template[0])
+        if not tool:
+            return None
+
+        command = [tool] + [arg.format(threads=threads or 1) for arg in template[1:]] + ["-c"]
+        if level is not None:
+            command.append(f"-{level}")
+        return command
+
+    def _add_bytes(self, tar: "tarfile.TarFile", arcname: str, data: bytes) -> None:
+        """Add an in-memory member to the archive"""
+        import tarfile
+
+        tarinfo = tarfile.TarInfo(arcname)
+        tarinfo.size = len(data)
+        tarinfo.mtime = int(time.time())
+        tarinfo.mode = 0o644
+        tar.addfile(tarinfo, io.BytesIO(data))
+
+    def _add_file(self, tar: "tarfile.TarFile", path: Path, arcname: str) -> int:
+        """
+        Add a file to the archive from an open handle
+
+        Returns:
+            Bytes read
+
+        Raises:
+            OSError: If the file can't be read or isn't a regular file
+        """
+        if path.is_symlink():
+            tar.addfile(tar.gettarinfo(str(path), arcname))
+            return 0
+
+        with open(path, 'rb') as f:
+            tarinfo = tar.gettarinfo(arcname=arcname, fileobj=f)
+            if not tarinfo.isreg():
+                raise OSError(f"Not a regular file: {path}")
+            tar.addfile(tarinfo, f)
+            return tarinfo.size
@@ -6,34 +6,45 @@ import json
 from typing import Dict, Any, List, Optional
 from pathlib import Path
 
-# Handle jsonschema import - if not available, use basic validation
-try:
-    import jsonschema
-    from jsonschema import validate, ValidationError
-    JSONSCHEMA_AVAILABLE = True
-except ImportError:
-    JSONSCHEMA_AVAILABLE = False
-    
-    class ValidationError(Exception):
-        """Simple validation error for when jsonschema is not available"""
-        def __init__(self, message):
-            self.message = message
-            super().__init__(message)
-    
-    def validate(instance, schema):
-        """Dummy validation function"""
-        # Basic type checking only
-        if "type" in schema:
-            expected_type = schema["type"]
-            if expected_type == "object" and not isinstance(instance, dict):
-                raise ValidationError(f"Expected object, got {type(instance).__name__}")
-            elif expected_type == "array" and not isinstance(instance, list):
-                raise ValidationError(f"Expected array, got {type(instance).__name__}")
-            elif expected_type == "string" and not isinstance(instance, str):
-                raise ValidationError(f"Expected string, got {type(instance).__name__}")
-            elif expected_type == "integer" and not isinstance(instance, int):
-                raise ValidationError(f"Expected integer, got {type(instance).__name__}")
-        # Skip detailed validation if jsonschema not available
+
+class ValidationError(Exception):
+    """Configuration validation error"""
+    def __init__(self, message):
+        self.message = message
+        super().__init__(message)
+
+
+def _basic_validate(instance, schema):
+    """Basic type checking used when jsonschema is not available"""
+    if "type" in schema:
+        expected_type = schema["type"]
+        if expected_type == "object" and not isinstance(instance, dict):
+            raise ValidationError(f"Expected object, got {type(instance).__name__}")
+        elif expected_type == "array" and not isinstance(instance, list):
+            raise ValidationError(f"Expected array, got {type(instance).__name__}")
+        elif expected_type == "string" and not isinstance(instance, str):
+            raise ValidationError(f"Expected string, got {type(instance).__name__}")
+        elif expected_type == "integer" and not isinstance(instance, int):
+            raise ValidationError(f"Expected integer, got {type(instance).__name__}")
+    # Skip detailed validation if jsonschema not available
+
+
+def validate(instance, schema):
+    """
+    Validate instance against schema
+
+    jsonschema is imported on first use since it is slow to import and
+    most CLI invocations never validate configuration.
+    """
+    try:
+        import jsonschema
+    except ImportError:
+        return _basic_validate(instance, schema)
+
+    try:
+        jsonschema.validate(instance=instance, schema=schema)
+    except jsonschema.ValidationError as e:
+        raise ValidationError(e.message)
 
 
 class ConfigManager:
@@ -2,28 +2,54 @@
 Cross-platform file management for SuperClaude installation system
 """
 
+import os
 import shutil
 import stat
+import sys
+import tempfile
+import threading
 from typing import List, Optional, Callable, Dict, Any
 from pathlib import Path
-import fnmatch
 import hashlib
 
+from .journal_manager import JournalManager
+from ..utils.walker import walk
+from ..utils.ignore import IgnoreMatcher
+from ..utils.profiling import timed
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+# ioctl request for copy-on-write clones (btrfs, XFS, bcachefs); Linux only
+FICLONE = getattr(fcntl, "FICLONE", 0x40049409) if fcntl is not None and sys.platform.startswith("linux") else None
+
 
 class FileManager:
     """Cross-platform file operations manager"""
     
-    def __init__(self, dry_run: bool = False):
+    # Always skipped by copy_directory (gitignore syntax)
+    DEFAULT_IGNORE_PATTERNS = ['.git', '.gitignore', '__pycache__/', '*.pyc', '.DS_Store']
+    
+    def __init__(self, dry_run: bool = False, incremental: bool = False):
         """
         Initialize file manager
         
         Args:
             dry_run: If True, only simulate file operations
+            incremental: If True, copy_file skips targets identical to their source
         """
         self.dry_run = dry_run
+        self.incremental = incremental
         self.copied_files: List[Path] = []
         self.created_dirs: List[Path] = []
+        self.skipped_files: List[Path] = []
+        self.install_methods: Dict[Path, str] = {}
+        self.bytes_written = 0
+        self.bytes_linked = 0
         
+    @timed("file.copy", "file")
     def copy_file(self, source: Path, target: Path, preserve_permissions: bool = True) -> bool:
         """
         Copy single file with permission preservation
@@ -42,14 +68,23 @@ class FileManager:
         if not source.is_file():
             raise ValueError(f"Source is not a file: {source}")
         
+        if self.incremental:
+            return self.sync_file(source, target, preserve_permissions)
+        
         if self.dry_run:
             print(f"[DRY RUN] Would copy {source} -> {target}")
             return True
         
         try:
+            JournalManager.record_write(target)
+            
             # Ensure target directory exists
             target.parent.mkdir(parents=True, exist_ok=True)
             
+            # Never write through a hard link into the file it shares storage with
+            if self._is_hard_link(target):
+                target.unlink()
+            
             # Copy file
             if preserve_permissions:
                 shutil.copy2(source, target)
@@ -57,12 +92,245 @@ class FileManager:
                 shutil.copy(source, target)
             
             self.copied_files.append(target)
+            self.install_methods[target] = "copy"
+            self.bytes_written += source.stat().st_size
             return True
             
         except Exception as e:
             print(f"Error copying {source} to {target}: {e}")
             return False
     
+    def needs_update(self, source: Path, target: Path) -> bool:
+        """
+        Check whether target differs from source
+        
+        Compares size and mtime first and only hashes both files when the
+        sizes match but the mtimes do not.
+        
+        Args:
+            source: Source file path
+            target: Target file path
+            
+        Returns:
+            True if target is missing or its content differs from source
+        """
+        try:
+            source_stat = source.stat()
+            target_stat = target.stat()
+        except OSError:
+            return True
+        
+        if not stat.S_ISREG(target_stat.st_mode) or source_stat.st_size != target_stat.st_size:
+            return True
+        
+        if source_stat.st_mtime_ns == target_stat.st_mtime_ns:
+            return False
+        
+        source_hash = self.get_file_hash(source)
+        if source_hash is None or source_hash != self.get_file_hash(target):
+            return True
+        
+        # Same content - align mtime so the next check stops at stat()
+        if not self.dry_run:
+            try:
+                os.utime(target, ns=(target_stat.st_atime_ns, source_stat.st_mtime_ns))
+            except OSError:
+                pass
+        
+        return False
+    
+    @timed("file.sync", "file")
+    def sync_file(self, source: Path, target: Path, preserve_permissions: bool = True) -> bool:
+        """
+        Copy file only if its content changed, writing atomically
+        
+        Unchanged targets are skipped. Changed files are written to a
+        temporary file next to the target and renamed into place, so readers
+        never observe a partially written file.
+        
+        Args:
+            source: Source file path
+            target: Target file path
+            preserve_permissions: Whether to preserve file permissions
+            
+        Returns:
+            True if target is up to date afterwards, False otherwise
+        """
+        if not source.exists():
+            raise FileNotFoundError(f"Source file not found: {source}")
+        
+        if not source.is_file():
+            raise ValueError(f"Source is not a file: {source}")
+        
+        # A hard link to the source is "up to date" but must become a real copy
+        if not self.needs_update(source, target) and not self._shares_storage(source, target):
+            self.skipped_files.append(target)
+            return True
+        
+        if self.dry_run:
+            print(f"[DRY RUN] Would copy {source} -> {target}")
+            return True
+        
+        temp_path = None
+        try:
+            JournalManager.record_write(target)
+            
+            # Ensure target directory exists
+            target.parent.mkdir(parents=True, exist_ok=True)
+            
+            fd, temp_name = tempfile.mkstemp(prefix=f".{target.name}.", suffix=".tmp", dir=target.parent)
+            os.close(fd)
+            temp_path = Path(temp_name)
+            
+            if preserve_permissions:
+                shutil.copy2(source, temp_path)
+            else:
+                shutil.copyfile(source, temp_path)
+            
+            os.replace(temp_path, target)
+            temp_path = None
+            
+            self.copied_files.append(target)
+            self.install_methods[target] = "copy"
+            self.bytes_written += source.stat().st_size
+            return True
+            
+        except Exception as e:
+            print(f"Error copying {source} to {target}: {e}")
+            return False
+        finally:
+            if temp_path is not None:
+                try:
+                    temp_path.unlink()
+                except OSError:
+                    pass
+    
+    @timed("file.link", "file")
+    def link_file(self, source: Path, target: Path, previous_method: Optional[str] = None) -> bool:
+        """
+        Place a file so it shares storage with its source instead of copying it
+        
+        Tries a copy-on-write reflink (FICLONE) first, then a hard link when
+        source and target are on the same filesystem, and falls back to a
+        copy. The method used is recorded in install_methods. Targets already
+        hard linked to the source, or reflinked with unchanged content, are
+        skipped.
+        
+        Args:
+            source: Source file path
+            target: Target file path
+            previous_method: Method recorded for target by an earlier install, if any
+            
+        Returns:
+            True if target is up to date afterwards, False otherwise
+        """
+        if not source.exists():
+            raise FileNotFoundError(f"Source file not found: {source}")
+        
+        if not source.is_file():
+            raise ValueError(f"Source is not a file: {source}")
+        
+        if self._shares_storage(source, target):
+            self.skipped_files.append(target)
+            self.install_methods[target] = "hardlink"
+            return True
+        
+        if previous_method == "reflink" and not self.needs_update(source, target):
+            self.skipped_files.append(target)
+            self.install_methods[target] = "reflink"
+            return True
+        
+        if self.dry_run:
+            print(f"[DRY RUN] Would link {source} -> {target}")
+            return True
+        
+        temp_path = target.parent / f".{target.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            JournalManager.record_write(target)
+            
+            # Ensure target directory exists
+            target.parent.mkdir(parents=True, exist_ok=True)
+            
+            # Build the new file next to the target, then rename it into place
+            if temp_path.exists():
+                temp_path.unlink()
+            method = self._place_linked(source, temp_path)
+            os.replace(temp_path, target)
+            
+            self.copied_files.append(target)
+            self.install_methods[target] = method
+            if method == "copy":
+                self.bytes_written += source.stat().st_size
+            else:
+                self.bytes_linked += source.stat().st_size
+            return True
+            
+        except Exception as e:
+            print(f"Error linking {source} to {target}: {e}")
+            return False
+        finally:
+            try:
+                temp_path.unlink()
+            except OSError:
+                pass
+    
+    def _place_linked(self, source: Path, target: Path) -> str:
+        """
+        Create target from source with the cheapest available method
+        
+        Args:
+            source: Source file path
+            target: New file path (must not exist)
+            
+        Returns:
+            Method used ("reflink", "hardlink" or "copy")
+        """
+        if self._reflink(source, target):
+            return "reflink"
+        
+        try:
+            os.link(source, target)
+            return "hardlink"
+        except (OSError, NotImplementedError):
+            pass  # Other filesystem, or hard links not permitted
+        
+        shutil.copy2(source, target)
+        return "copy"
+    
+    def _reflink(self, source: Path, target: Path) -> bool:
+        """Clone source into a new target file (False if the filesystem cannot)"""
+        if FICLONE is None:
+            return False
+        
+        try:
+            with open(source, 'rb') as src, open(target, 'wb') as dst:
+                fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+        except OSError:
+            try:
+                target.unlink()
+            except OSError:
+                pass
+            return False
+        
+        shutil.copystat(source, target)
+        return True
+    
+    def _shares_storage(self, source: Path, target: Path) -> bool:
+        """Check whether target is a hard link to source"""
+        try:
+            return os.path.samefile(source, target)
+        except OSError:
+            return False
+    
+    def _is_hard_link(self, path: Path) -> bool:
+        """Check whether a file has other hard links"""
+        try:
+            st = path.lstat()
+        except OSError:
+            return False
+        return stat.S_ISREG(st.st_mode) and st.st_nlink > 1
+    
+    @timed("file.copy_directory", "file")
     def copy_directory(self, source: Path, target: Path, ignore_patterns: Optional[List[str]] = None) -> bool:
         """
         Recursively copy directory with gitignore-style patterns
@@ -70,7 +338,7 @@ class FileManager:
         Args:
             source: Source directory path
             target: Target directory path
-            ignore_patterns: List of patterns to ignore (gitignore style)
+            ignore_patterns: Patterns to ignore (gitignore syntax, added after DEFAULT_IGNORE_PATTERNS)
             
         Returns:
             True if successful, False otherwise
@@ -81,39 +349,29 @@ class FileManager:
         if not source.is_dir():
             raise ValueError(f"Source is not a directory: {source}")
         
-        ignore_patterns = ignore_patterns or []
-        default_ignores = ['.git', '.gitignore', '__pycache__', '*.pyc', '.DS_Store']
-        all_ignores = ignore_patterns + default_ignores
+        matcher = IgnoreMatcher(self.DEFAULT_IGNORE_PATTERNS + list(ignore_patterns or []))
         
         if self.dry_run:
             print(f"[DRY RUN] Would copy directory {source} -> {target}")
             return True
         
         try:
-            # Create ignore function
-            def ignore_func(directory: str, contents: List[str]) -> List[str]:
-                ignored = []
-                for item in contents:
-                    item_path = Path(directory) / item
-                    rel_path = item_path.relative_to(source)
-                    
-                    # Check against ignore patterns
-                    for pattern in all_ignores:
-                        if fnmatch.fnmatch(item, pattern) or fnmatch.fnmatch(str(rel_path), pattern):
-                            ignored.append(item)
-                            break
-                
-                return ignored
-            
-            # Copy tree
-            shutil.copytree(source, target, ignore=ignore_func, dirs_exist_ok=True)
-            
-            # Track created directories and files
-            for item in target.rglob('*'):
-                if item.is_dir():
-                    self.created_dirs.append(item)
-                else:
-                    self.copied_files.append(item)
+            # One pass over the source; ignored subtrees are never entered and
+            # symlinked directories are copied as directories, like copytree
+            tree = walk(source, ignore=matcher, follow_symlinks=True)
+            
+            for directory in [source] + tree.directories:
+                target_dir = target / directory.relative_to(source)
+                JournalManager.record_mkdir(target_dir)
+                target_dir.mkdir(parents=True, exist_ok=True)
+                self.created_dirs.append(target_dir)
+            
+            for path, rel_path, st in tree.files:
+                target_file = target / rel_path
+                JournalManager.record_write(target_file)
+                shutil.copy2(path, target_file)
+                self.copied_files.append(target_file)
+                self.bytes_written += st.st_size
             
             return True
             
@@ -137,6 +395,7 @@ class FileManager:
             return True
         
         try:
+            JournalManager.record_mkdir(directory)
             directory.mkdir(parents=True, exist_ok=True, mode=mode)
             
             if directory not in self.created_dirs:
@@ -167,6 +426,7 @@ class FileManager:
         
         try:
             if file_path.is_file():
+                JournalManager.record_remove(file_path)
                 file_path.unlink()
             else:
                 print(f"Warning: {file_path} is not a file, skipping")
@@ -202,6 +462,7 @@ class FileManager:
             return True
         
         try:
+            JournalManager.record_rmdir(directory, recursive)
             if recursive:
                 shutil.rmtree(directory)
             else:
@@ -247,6 +508,13 @@ class FileManager:
             return True
         
         try:
+            # Permissions live on the inode, so give a hard-linked file its own copy first
+            if self._is_hard_link(file_path):
+                temp_path = file_path.with_name(f".{file_path.name}.{os.getpid()}.tmp")
+                shutil.copy2(file_path, temp_path)
+                os.replace(temp_path, file_path)
+                self.install_methods[file_path] = "copy"
+            
             # Get current permissions
             current_mode = file_path.stat().st_mode
             
@@ -279,7 +547,7 @@ class FileManager:
             
             with open(file_path, 'rb') as f:
                 # Read in chunks for large files
-                for chunk in iter(lambda: f.read(8192), b""):
+                for chunk in iter(lambda: f.read(65536), b""):
                     hasher.update(chunk)
             
             return hasher.hexdigest()
@@ -312,18 +580,8 @@ class FileManager:
         Returns:
             Total size in bytes
         """
-        if not directory.exists() or not directory.is_dir():
-            return 0
-        
-        total_size = 0
-        try:
-            for file_path in directory.rglob('*'):
-                if file_path.is_file():
-                    total_size += file_path.stat().st_size
-        except Exception:
-            pass  # Skip files we can't access
-        
-        return total_size
+        # Unreadable directories and files are skipped
+        return walk(directory, collect=False).total_size
     
     def find_files(self, directory: Path, pattern: str = '*', recursive: bool = True) -> List[Path]:
         """
@@ -342,7 +600,7 @@ class FileManager:
         
         try:
             if recursive:
-                return list(directory.rglob(pattern))
+                return [path for path, rel_path, _ in walk(directory).files if Path(rel_path).match(pattern)]
             else:
                 return list(directory.glob(pattern))
         except Exception:
@@ -411,6 +669,8 @@ class FileManager:
         
         self.copied_files.clear()
         self.created_dirs.clear()
+        self.skipped_files.clear()
+        self.install_methods.clear()
     
     def get_operation_summary(self) -> Dict[str, Any]:
         """
@@ -421,8 +681,14 @@ class FileManager:
         """
         return {
             'files_copied': len(self.copied_files),
+            'files_skipped': len(self.skipped_files),
+            'bytes_written': self.bytes_written,
+            'bytes_linked': self.bytes_linked,
             'directories_created': len(self.created_dirs),
             'dry_run': self.dry_run,
+            'incremental': self.incremental,
             'copied_files': [str(f) for f in self.copied_files],
+            'skipped_files': [str(f) for f in self.skipped_files],
+            'install_methods': {str(f): method for f, method in self.install_methods.items()},
             'created_directories': [str(d) for d in self.created_dirs]
         }
\ No newline at end of file
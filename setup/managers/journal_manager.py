@@ -0,0 +1,661 @@
+"""
+Write-ahead install journal for SuperClaude installation system
+Records every file write, directory change and metadata update before it
+happens, so a failed or interrupted operation can be undone file by file
+"""
+
+import json
+import os
+import shutil
+import threading
+from contextlib import contextmanager, nullcontext
+from typing import Callable, Dict, Any, List, Optional, Iterator, Tuple
+from pathlib import Path
+from datetime import datetime
+
+from ..utils.walker import walk
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+# Marks a key that is absent from a JSON document
+_MISSING = object()
+
+
+class JournalManager:
+    """Manages the .superclaude-journal write-ahead log of an operation"""
+
+    JOURNAL_DIR = ".superclaude-journal"
+    JOURNAL_FILE = "journal.jsonl"
+    # Held (exclusive, non-blocking) by the process running the operation
+    LOCK_FILE = "journal.lock"
+
+    # Journals currently open in this process, by install dir; FileManager and
+    # the settings/manifest managers find the active journal through this
+    _active: Dict[str, "JournalManager"] = {}
+    _active_lock = threading.Lock()
+
+    def __init__(self, install_dir: Path):
+        """
+        Initialize journal manager
+
+        Args:
+            install_dir: Installation directory the journal protects
+        """
+        self.install_dir = install_dir
+        self.journal_dir = install_dir / self.JOURNAL_DIR
+        self.journal_file = self.journal_dir / self.JOURNAL_FILE
+        self.undo_dir = self.journal_dir / "undo"
+        self.lock_file = self.journal_dir / self.LOCK_FILE
+
+        self.entries: List[Dict[str, Any]] = []
+        self._journaled: Dict[Tuple, int] = {}
+        self._json_locks: Dict[str, Any] = {}
+        self._handle = None
+        self._lock_handle = None
+        self._lock = threading.RLock()
+        self._scope = threading.local()
+
+    @classmethod
+    def get_active(cls, path: Path) -> Optional["JournalManager"]:
+        """
+        Get the open journal covering a path
+
+        Args:
+            path: File or directory about to be changed
+
+        Returns:
+            Active journal whose install dir contains path, or None
+        """
+        if not cls._active:
+            return None
+
+        absolute = os.path.abspath(path)
+        with cls._active_lock:
+            for root, journal in cls._active.items():
+                if absolute == root or absolute.startswith(root + os.sep):
+                    return journal
+        return None
+
+    @classmethod
+    def record_write(cls, path: Path) -> None:
+        """Journal a file that is about to be created or overwritten (no-op without an active journal)"""
+        journal = cls.get_active(path)
+        if journal is not None:
+            journal._record_file("write", path)
+
+    @classmethod
+    def record_remove(cls, path: Path) -> None:
+        """Journal a file that is about to be removed (no-op without an active journal)"""
+        journal = cls.get_active(path)
+        if journal is not None:
+            journal._record_file("remove", path)
+
+    @classmethod
+    def record_json_update(cls, path: Path, load_before: Callable[[], Dict[str, Any]],
+                           after: Dict[str, Any], lock: Any = None) -> None:
+        """
+        Journal the keys a component changes in a shared JSON file (no-op without an active journal)
+
+        Shared files (metadata, manifest, settings.json) get written by every
+        component, so a single component's rollback restores only the keys it
+        changed instead of the whole file.
+
+        Args:
+            path: JSON file about to be written
+            load_before: Returns the file's current content (only called when journaling)
+            after: Content about to be written
+            lock: Lock the file's manager holds while writing it (taken again for rollback)
+        """
+        journal = cls.get_active(path)
+        if journal is not None:
+            try:
+                before = load_before()
+            except ValueError:
+                before = {}
+            journal._record_json(path, before, after, lock)
+
+    @classmethod
+    def record_mkdir(cls, path: Path) -> None:
+        """Journal a directory that is about to be created (no-op without an active journal)"""
+        journal = cls.get_active(path)
+        if journal is not None:
+            with journal._lock:
+                journal._record_missing_dirs(path)
+
+    @classmethod
+    def record_rmdir(cls, path: Path, recursive: bool = False) -> None:
+        """
+        Journal a directory that is about to be removed (no-op without an active journal)
+
+        Args:
+            path: Directory to be removed
+            recursive: Whether its contents are removed too (each file is journaled)
+        """
+        journal = cls.get_active(path)
+        if journal is None:
+            return
+
+        with journal._lock:
+            if recursive:
+                tree = walk(path)
+                for file_path, _, _ in tree.files:
+                    journal._record_file("remove", file_path)
+                # Subdirectories deepest first, so undo recreates parents before children
+                for directory in reversed(tree.directories):
+                    journal._append({"op": "rmdir", "path": journal._relative(directory)})
+            journal._append({"op": "rmdir", "path": journal._relative(path)})
+
+    def has_pending(self) -> bool:
+        """
+        Check for a journal left behind by an interrupted operation
+
+        Returns:
+            True if an uncommitted journal exists on disk and no running
+            operation (in this or another process) still owns it
+        """
+        return self.journal_file.exists() and self._key() not in self._active and not self.is_live()
+
+    def is_live(self) -> bool:
+        """
+        Check whether another operation is running on this install dir
+
+        Returns:
+            True if some process holds the journal lock
+        """
+        if self._lock_handle is not None or not self.lock_file.exists():
+            return False
+
+        try:
+            handle = open(self.lock_file, 'a+', encoding='utf-8')
+        except OSError:
+            return False
+
+        try:
+            if not self._try_lock(handle):
+                return True
+            self._unlock(handle)
+            return False
+        finally:
+            handle.close()
+
+    def pending_info(self) -> Optional[Dict[str, Any]]:
+        """
+        Describe the interrupted operation
+
+        Returns:
+            Dict with operation, components, started_at and entries, or None
+        """
+        if not self.journal_file.exists():
+            return None
+
+        header, entries = self._read_journal()
+        return {
+            "operation": header.get("operation"),
+            "components": header.get("components", []),
+            "started_at": header.get("started_at"),
+            "entries": len(entries)
+        }
+
+    def begin(self, operation: str, components: List[str]) -> None:
+        """
+        Start journaling an operation
+
+        Args:
+            operation: Operation name (install, update, uninstall)
+            components: Components the operation touches
+
+        Raises:
+            ValueError: If another operation is running, an interrupted journal
+                is pending, or a journal is already open
+        """
+        self._acquire_lock()
+        if self.journal_file.exists():
+            self._release_lock()
+            raise ValueError(f"An interrupted operation is pending in {self.journal_dir}; recover or resume it first")
+
+        self.undo_dir.mkdir(parents=True, exist_ok=True)
+        self._open()
+        self._append({
+            "op": "begin",
+            "operation": operation,
+            "components": list(components),
+            "started_at": datetime.now().isoformat(),
+            "pid": os.getpid()
+        }, track=False)
+
+    def resume(self) -> Dict[str, Any]:
+        """
+        Reopen an interrupted journal and keep appending to it
+
+        Files first touched by the interrupted run keep their original
+        pre-images, so a later rollback still restores the pre-operation state.
+
+        Returns:
+            Header of the resumed journal (operation, components, ...)
+
+        Raises:
+            ValueError: If the operation that wrote the journal is still running
+        """
+        self._acquire_lock()
+        header, entries = self._read_journal()
+        self.entries = entries
+        self._journaled = {
+            self._entry_key(entry): position for position, entry in enumerate(entries)
+            if entry["op"] in ("write", "remove", "mkdir", "json") and not entry.get("undone")
+        }
+        self._open()
+        return header
+
+    def recover(self) -> int:
+        """
+        Roll back an interrupted operation found on disk
+
+        Returns:
+            Number of journal entries undone
+
+        Raises:
+            ValueError: If the operation that wrote the journal is still running
+        """
+        self._acquire_lock()
+        _, self.entries = self._read_journal()
+        undone = self._undo_entries([entry for entry in self.entries if not entry.get("undone")], self.entries)
+        self._discard()
+        return undone
+
+    @contextmanager
+    def component(self, name: str) -> Iterator[None]:
+        """
+        Tag journal entries recorded by this thread with a component name
+
+        Args:
+            name: Component name (lets rollback() undo a single component)
+        """
+        previous = getattr(self._scope, "component", None)
+        self._scope.component = name
+        try:
+            yield
+        finally:
+            self._scope.component = previous
+
+    def rollback(self, component: Optional[str] = None) -> int:
+        """
+        Undo journaled changes, newest first
+
+        Args:
+            component: Only undo entries recorded for this component (default: all)
+
+        Returns:
+            Number of entries undone
+        """
+        with self._lock:
+            recorded = list(self.entries)
+            selected = [
+                entry for entry in recorded
+                if not entry.get("undone") and (component is None or entry.get("component") == component)
+            ]
+
+        # Undo without holding _lock: restoring a shared JSON file takes its
+        # manager's lock, and the managers record into the journal under it
+        undone = self._undo_entries(selected, recorded)
+
+        with self._lock:
+            if selected:
+                self._append({"op": "undone", "seq": [entry["seq"] for entry in selected]}, track=False)
+            for entry in selected:
+                self._journaled.pop(self._entry_key(entry), None)
+
+        return undone
+
+    def commit(self) -> None:
+        """Finish the operation and discard the journal and its pre-images"""
+        with self._lock:
+            self._discard()
+
+    def is_open(self) -> bool:
+        """Check whether this journal is currently recording"""
+        return self._handle is not None
+
+    def _record_file(self, op: str, path: Path) -> None:
+        """Save the pre-image of a file and journal the change before it happens"""
+        with self._lock:
+            key = (self._current_component(), self._relative(path))
+            if key in self._journaled:
+                return  # The component's first pre-image is the one to restore
+
+            self._record_missing_dirs(path.parent)
+
+            link = os.readlink(path) if path.is_symlink() else None
+            existed = link is not None or path.is_file()
+            entry = {"op": op, "path": key[1], "existed": existed}
+            if link is not None:
+                entry["link"] = link  # Restored as the link itself, never its target
+            elif existed:
+                undo_name = f"{len(self.entries):06d}"
+                shutil.copy2(path, self.undo_dir / undo_name)
+                entry["undo"] = undo_name
+
+            self._append(entry)
+            self._journaled[key] = len(self.entries) - 1
+
+    def _record_json(self, path: Path, before: Dict[str, Any], after: Dict[str, Any], lock: Any) -> None:
+        """Journal the pre-image of every top-level or second-level key that changes"""
+        with self._lock:
+            rel_path = self._relative(path)
+            if lock is not None:
+                self._json_locks[rel_path] = lock
+
+            component = self._current_component()
+            for key_path in self._changed_keys(before, after):
+                key = (component, rel_path, tuple(key_path))
+                if key in self._journaled:
+                    continue  # The component's first value is the one to restore
+
+                value = before
+                for part in key_path:
+                    value = value.get(part, _MISSING) if isinstance(value, dict) else _MISSING
+                entry = {"op": "json", "path": rel_path, "key": key_path, "existed": value is not _MISSING}
+                if value is not _MISSING:
+                    entry["value"] = value
+
+                self._append(entry)
+                self._journaled[key] = len(self.entries) - 1
+
+    @staticmethod
+    def _changed_keys(before: Dict[str, Any], after: Dict[str, Any]) -> List[List[str]]:
+        """Get key paths (one or two levels deep) whose values differ"""
+        changed = []
+        for key in sorted(set(before) | set(after)):
+            old, new = before.get(key, _MISSING), after.get(key, _MISSING)
+            if old == new:
+                continue
+            if isinstance(old, dict) and isinstance(new, dict):
+                changed.extend([key, sub] for sub in sorted(set(old) | set(new))
+                               if old.get(sub, _MISSING) != new.get(sub, _MISSING))
+            else:
+                changed.append([key])
+        return changed
+
+    def _undo_entries(self, entries: List[Dict[str, Any]], recorded: List[Dict[str, Any]]) -> int:
+        """
+        Undo entries, restoring shared JSON files key by key
+
+        Whole-file pre-images of shared files are never restored: they hold
+        other components' changes made in the meantime.
+
+        Args:
+            entries: Entries to undo
+            recorded: Every entry of the journal (tells which files are shared)
+        """
+        shared = {entry["path"] for entry in recorded if entry["op"] == "json"}
+        undone = self._undo([
+            entry for entry in entries
+            if entry["op"] != "json" and (entry["path"] not in shared or entry["op"] not in ("write", "remove"))
+        ])
+        undone += self._undo_json([entry for entry in entries if entry["op"] == "json"], recorded)
+
+        for entry in entries:
+            entry["undone"] = True
+        return undone
+
+    def _undo_json(self, entries: List[Dict[str, Any]], recorded: List[Dict[str, Any]]) -> int:
+        """Restore journaled keys of shared JSON files, newest first, under each file's lock"""
+        by_path: Dict[str, List[Dict[str, Any]]] = {}
+        for entry in entries:
+            by_path.setdefault(entry["path"], []).append(entry)
+
+        undone = 0
+        for rel_path, path_entries in by_path.items():
+            target = self.install_dir / rel_path
+            with self._json_locks.get(rel_path) or nullcontext():
+                try:
+                    with open(target, 'r', encoding='utf-8') as f:
+                        data = json.load(f)
+                except (OSError, json.JSONDecodeError):
+                    data = {}
+
+                for entry in reversed(path_entries):
+                    *parents, last = entry["key"]
+                    container = data
+                    for part in parents:
+                        if not isinstance(container.get(part), dict):
+                            if not entry["existed"]:
+                                break
+                            container[part] = {}
+                        container = container[part]
+                    else:
+                        if entry["existed"]:
+                            container[last] = entry["value"]
+                        else:
+                            container.pop(last, None)
+                    undone += 1
+
+                # A file the operation created is removed once nothing is left in it
+                first_write = next((entry for entry in recorded
+                                    if entry["path"] == rel_path and entry["op"] in ("write", "remove")), None)
+                if not data and first_write is not None and not first_write.get("existed"):
+                    try:
+                        target.unlink()
+                    except OSError:
+                        pass
+                    continue
+
+                temp_path = target.with_name(f".{target.name}.{os.getpid()}.undo")
+                try:
+                    with open(temp_path, 'w', encoding='utf-8') as f:
+                        json.dump(data, f, indent=2, ensure_ascii=False, sort_keys=True)
+                    os.replace(temp_path, target)
+                except OSError as e:
+                    print(f"Warning: Could not restore {rel_path}: {e}")
+                finally:
+                    if temp_path.exists():
+                        temp_path.unlink()
+        return undone
+
+    def _record_missing_dirs(self, directory: Path) -> None:
+        """Journal directories (inside the install dir) that do not exist yet, outermost first"""
+        missing = []
+        current = Path(os.path.abspath(directory))
+        root = Path(self._key())
+        while current != root and root in current.parents and not current.exists():
+            missing.append(current)
+            current = current.parent
+
+        for path in reversed(missing):
+            key = (self._current_component(), self._relative(path))
+            if key not in self._journaled:
+                self._append({"op": "mkdir", "path": key[1]})
+                self._journaled[key] = len(self.entries) - 1
+
+    def _undo(self, entries: List[Dict[str, Any]]) -> int:
+        """Undo entries in reverse order; failures are skipped so the rest still gets restored"""
+        undone = 0
+        for entry in reversed(entries):
+            target = self.install_dir / entry["path"]
+            try:
+                if entry["op"] in ("write", "remove"):
+                    if "link" in entry:
+                        target.parent.mkdir(parents=True, exist_ok=True)
+                        if target.is_symlink() or target.is_file():
+                            target.unlink()
+                        os.symlink(entry["link"], target)
+                    elif entry.get("existed"):
+                        # Restore into a fresh inode so a hard-linked source is never written through
+                        target.parent.mkdir(parents=True, exist_ok=True)
+                        temp_path = target.with_name(f".{target.name}.{os.getpid()}.undo")
+                        shutil.copy2(self.undo_dir / entry["undo"], temp_path)
+                        os.replace(temp_path, target)
+                    elif target.is_file():
+                        target.unlink()
+                elif entry["op"] == "mkdir":
+                    if target.is_dir() and not any(target.iterdir()):
+                        target.rmdir()
+                elif entry["op"] == "rmdir":
+                    target.mkdir(parents=True, exist_ok=True)
+                entry["undone"] = True
+                undone += 1
+            except OSError as e:
+                print(f"Warning: Could not undo {entry['op']} of {entry['path']}: {e}")
+        return undone
+
+    def _append(self, entry: Dict[str, Any], track: bool = True) -> None:
+        """Append an entry to the journal and fsync it before the change is made"""
+        with self._lock:
+            if track:
+                entry["seq"] = len(self.entries)
+                entry["component"] = self._current_component()
+                self.entries.append(entry)
+
+            self._handle.write(json.dumps(entry) + "\n")
+            self._handle.flush()
+            os.fsync(self._handle.fileno())
+
+    def _read_journal(self):
+        """Read header and change entries from disk (a torn last line is ignored)"""
+        header: Dict[str, Any] = {}
+        entries: List[Dict[str, Any]] = []
+        undone = set()
+
+        try:
+            with open(self.journal_file, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        break
+                    if record["op"] == "begin":
+                        header = record
+                    elif record["op"] == "undone":
+                        undone.update(record["seq"])
+                    else:
+                        entries.append(record)
+        except OSError:
+            pass
+
+        for entry in entries:
+            if entry.get("seq") in undone:
+                entry["undone"] = True
+        return header, entries
+
+    def _open(self) -> None:
+        """Open the journal file for appending and register it as active"""
+        self._handle = open(self.journal_file, 'a', encoding='utf-8')
+        with self._active_lock:
+            self._active[self._key()] = self
+
+    def _discard(self) -> None:
+        """Close, unregister and delete the journal"""
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+        with self._active_lock:
+            if self._active.get(self._key()) is self:
+                del self._active[self._key()]
+        # Delete before unlocking so a waiting process never locks a stale file
+        shutil.rmtree(self.journal_dir, ignore_errors=True)
+        self._release_lock()
+        self.entries = []
+        self._journaled = {}
+        self._json_locks = {}
+
+    def _acquire_lock(self) -> None:
+        """
+        Take the journal lock for the rest of the operation
+
+        Raises:
+            ValueError: If another process holds it
+        """
+        if self._lock_handle is not None:
+            return
+
+        self.journal_dir.mkdir(parents=True, exist_ok=True)
+        while True:
+            handle = open(self.lock_file, 'a+', encoding='utf-8')
+            if not self._try_lock(handle):
+                handle.close()
+                owner = self._lock_owner()
+                raise ValueError(
+                    f"Another SuperClaude operation{f' (pid {owner})' if owner else ''} "
+                    f"is in progress in {self.install_dir}; wait for it to finish"
+                )
+
+            # The previous owner may have deleted the file between our open and lock
+            try:
+                current = os.stat(self.lock_file)
+            except FileNotFoundError:
+                current = None
+            locked = os.fstat(handle.fileno())
+            if current is not None and (current.st_dev, current.st_ino) == (locked.st_dev, locked.st_ino):
+                break
+            self._unlock(handle)
+            handle.close()
+            self.journal_dir.mkdir(parents=True, exist_ok=True)
+
+        if fcntl is not None:
+            handle.seek(0)
+            handle.truncate()
+            handle.write(str(os.getpid()))
+            handle.flush()
+        self._lock_handle = handle
+
+    def _release_lock(self) -> None:
+        """Give up the journal lock"""
+        if self._lock_handle is not None:
+            self._unlock(self._lock_handle)
+            self._lock_handle.close()
+            self._lock_handle = None
+
+    def _lock_owner(self) -> Optional[int]:
+        """Get the pid recorded by the lock holder, if readable"""
+        try:
+            return int(self.lock_file.read_text(encoding='utf-8').strip())
+        except (OSError, ValueError):
+            return None
+
+    @staticmethod
+    def _try_lock(handle) -> bool:
+        """Try to lock an open file exclusively without blocking"""
+        try:
+            if fcntl is not None:
+                fcntl.flock(handle.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            else:
+                handle.seek(0)
+                msvcrt.locking(handle.fileno(), msvcrt.LK_NBLCK, 1)
+        except OSError:
+            return False
+        return True
+
+    @staticmethod
+    def _unlock(handle) -> None:
+        """Release a lock taken by _try_lock"""
+        try:
+            if fcntl is not None:
+                fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+            else:
+                handle.seek(0)
+                msvcrt.locking(handle.fileno(), msvcrt.LK_UNLCK, 1)
+        except OSError:
+            pass
+
+    @staticmethod
+    def _entry_key(entry: Dict[str, Any]) -> Tuple:
+        """Key identifying the first pre-image of an entry (per component)"""
+        if entry["op"] == "json":
+            return (entry.get("component"), entry["path"], tuple(entry["key"]))
+        return (entry.get("component"), entry.get("path"))
+
+    def _current_component(self) -> Optional[str]:
+        """Component the calling thread is journaling for (None outside a component scope)"""
+        return getattr(self._scope, "component", None)
+
+    def _relative(self, path: Path) -> str:
+        """Get journal key (posix path relative to install dir) for a path"""
+        return Path(os.path.relpath(os.path.abspath(path), self._key())).as_posix()
+
+    def _key(self) -> str:
+        """Absolute install dir path (key of the active journal registry)"""
+        return os.path.abspath(self.install_dir)
@@ -0,0 +1,247 @@
+"""
+Install manifest management for SuperClaude installation system
+Records size, mtime and sha256 of every installed file so installations
+can be validated with a stat() per file instead of a full rescan
+"""
+
+import json
+import os
+import threading
+from typing import Dict, Any, List, Optional, Tuple
+from pathlib import Path
+from datetime import datetime
+
+from .file_manager import FileManager
+from .journal_manager import JournalManager
+from ..utils.profiling import timed
+
+
+class ManifestManager:
+    """Manages the .superclaude-manifest.json sidecar file"""
+
+    MANIFEST_VERSION = 1
+
+    # Locks shared by every manager pointing at the same manifest file
+    _locks: Dict[str, threading.RLock] = {}
+    _locks_guard = threading.Lock()
+
+    def __init__(self, install_dir: Path):
+        """
+        Initialize manifest manager
+
+        Args:
+            install_dir: Installation directory containing the manifest
+        """
+        self.install_dir = install_dir
+        self.manifest_file = install_dir / ".superclaude-manifest.json"
+        self.file_manager = FileManager()
+
+        key = str(self.manifest_file.absolute())
+        with self._locks_guard:
+            if key not in self._locks:
+                self._locks[key] = threading.RLock()
+            self.lock = self._locks[key]
+
+    def load_manifest(self) -> Dict[str, Any]:
+        """
+        Load manifest from disk
+
+        Returns:
+            Manifest dict (empty structure if file doesn't exist or is unreadable)
+        """
+        empty = {"manifest_version": self.MANIFEST_VERSION, "components": {}, "files": {}}
+
+        if not self.manifest_file.exists():
+            return empty
+
+        try:
+            with self.lock:
+                with open(self.manifest_file, 'r', encoding='utf-8') as f:
+                    manifest = json.load(f)
+        except (json.JSONDecodeError, IOError):
+            return empty
+
+        if manifest.get("manifest_version") != self.MANIFEST_VERSION:
+            return empty
+
+        manifest.setdefault("components", {})
+        manifest.setdefault("files", {})
+        return manifest
+
+    @timed("metadata.save_manifest", "metadata")
+    def save_manifest(self, manifest: Dict[str, Any]) -> None:
+        """
+        Save manifest to disk atomically (temp file, fsync, rename)
+
+        Args:
+            manifest: Manifest dict to save
+        """
+        self.manifest_file.parent.mkdir(parents=True, exist_ok=True)
+        temp_file = self.manifest_file.with_name(f"{self.manifest_file.name}.{os.getpid()}.tmp")
+
+        try:
+            with self.lock:
+                with open(temp_file, 'w', encoding='utf-8') as f:
+                    json.dump(manifest, f, indent=2, sort_keys=True)
+                    f.flush()
+                    os.fsync(f.fileno())
+                JournalManager.record_json_update(
+                    self.manifest_file,
+                    lambda: self.load_manifest() if self.manifest_file.exists() else {},
+                    manifest, self.lock
+                )
+                JournalManager.record_write(self.manifest_file)
+                os.replace(temp_file, self.manifest_file)
+        except IOError as e:
+            raise ValueError(f"Could not save manifest to {self.manifest_file}: {e}")
+        finally:
+            if temp_file.exists():
+                temp_file.unlink()
+
+    def record_component(self, component_name: str, version: str, files: List[Path],
+                         methods: Optional[Dict[Path, str]] = None) -> None:
+        """
+        Record installed files of a component, replacing its previous entries
+
+        Files whose size and mtime match the previous entry are not rehashed.
+
+        Args:
+            component_name: Name of component
+            version: Installed component version
+            files: Installed file paths (inside the installation directory)
+            methods: How each file was placed ("copy", "hardlink", "reflink");
+                files not listed keep their previously recorded method
+        """
+        methods = methods or {}
+        with self.lock:
+            manifest = self.load_manifest()
+            previous = manifest["files"]
+
+            entries = {}
+            for file_path in files:
+                rel_path = self._relative_key(file_path)
+                try:
+                    st = file_path.stat()
+                except OSError:
+                    continue
+
+                old = previous.get(rel_path)
+                if old and old.get("size") == st.st_size and old.get("mtime_ns") == st.st_mtime_ns:
+                    sha256 = old["sha256"]
+                else:
+                    sha256 = self.file_manager.get_file_hash(file_path)
+                    if sha256 is None:
+                        continue
+
+                entries[rel_path] = {
+                    "component": component_name,
+                    "version": version,
+                    "size": st.st_size,
+                    "mtime_ns": st.st_mtime_ns,
+                    "sha256": sha256,
+                    "method": methods.get(file_path) or (old or {}).get("method", "copy")
+                }
+
+            manifest["files"] = {
+                path: entry for path, entry in previous.items()
+                if entry.get("component") != component_name
+            }
+            manifest["files"].update(entries)
+            manifest["components"][component_name] = {
+                "version": version,
+                "files_count": len(entries),
+                "recorded_at": datetime.now().isoformat()
+            }
+
+            self.save_manifest(manifest)
+
+    def remove_component(self, component_name: str) -> bool:
+        """
+        Remove a component and its files from the manifest
+
+        Args:
+            component_name: Name of component
+
+        Returns:
+            True if the component was recorded, False otherwise
+        """
+        with self.lock:
+            manifest = self.load_manifest()
+            if component_name not in manifest["components"]:
+                return False
+
+            del manifest["components"][component_name]
+            manifest["files"] = {
+                path: entry for path, entry in manifest["files"].items()
+                if entry.get("component") != component_name
+            }
+            self.save_manifest(manifest)
+            return True
+
+    def get_component_files(self, component_name: str) -> Dict[str, Dict[str, Any]]:
+        """
+        Get manifest entries for a component
+
+        Args:
+            component_name: Name of component
+
+        Returns:
+            Dict of relative path -> entry
+        """
+        manifest = self.load_manifest()
+        return {
+            path: entry for path, entry in manifest["files"].items()
+            if entry.get("component") == component_name
+        }
+
+    def verify_component(self, component_name: str, expected_version: Optional[str] = None,
+                         manifest: Optional[Dict[str, Any]] = None) -> Tuple[bool, List[str]]:
+        """
+        Verify installed files of a component against the manifest
+
+        Each file costs one stat(); a file is only hashed when its size
+        matches but its mtime changed since it was recorded.
+
+        Args:
+            component_name: Name of component
+            expected_version: Version the component should be at (optional)
+            manifest: Already loaded manifest (loaded from disk if None)
+
+        Returns:
+            Tuple of (success: bool, error_messages: List[str])
+        """
+        if manifest is None:
+            manifest = self.load_manifest()
+
+        errors = []
+        component_info = manifest["components"].get(component_name)
+        if component_info is None:
+            return False, [f"Component {component_name} not recorded in install manifest"]
+
+        if expected_version and component_info.get("version") != expected_version:
+            errors.append(f"Version mismatch: installed {component_info.get('version')}, expected {expected_version}")
+
+        for rel_path, entry in manifest["files"].items():
+            if entry.get("component") != component_name:
+                continue
+
+            file_path = self.install_dir / rel_path
+            try:
+                st = file_path.stat()
+            except OSError:
+                errors.append(f"Missing file: {rel_path}")
+                continue
+
+            if st.st_size != entry["size"]:
+                errors.append(f"Modified file: {rel_path}")
+            elif st.st_mtime_ns != entry["mtime_ns"] and self.file_manager.get_file_hash(file_path) != entry["sha256"]:
+                errors.append(f"Modified file: {rel_path}")
+
+        return len(errors) == 0, errors
+
+    def _relative_key(self, file_path: Path) -> str:
+        """Get manifest key (posix path relative to install dir) for a file"""
+        try:
+            return file_path.relative_to(self.install_dir).as_posix()
+        except ValueError:
+            return file_path.as_posix()
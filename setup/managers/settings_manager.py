@@ -4,17 +4,50 @@ Handles settings.json migration to the new SuperClaude metadata json file
 Allows for manipulation of these json files with deep merge and backup
 """
 
+import hashlib
 import json
+import os
 import shutil
-from typing import Dict, Any, Optional, List
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Any, Optional, List, Iterator
 from pathlib import Path
 from datetime import datetime
 import copy
 
+from .journal_manager import JournalManager
+from ..utils.profiling import timed
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
 
 class SettingsManager:
     """Manages settings.json file operations"""
     
+    # Metadata locks shared by every manager pointing at the same file, so
+    # components installed in parallel serialize their read-modify-write cycles
+    _metadata_locks: Dict[str, threading.RLock] = {}
+    _metadata_locks_guard = threading.Lock()
+    
+    # Open metadata batches per file; only touched while holding that file's lock
+    _metadata_batches: Dict[str, Dict[str, Any]] = {}
+    
+    # Settings backup retention: a backup is dropped once it falls outside any limit
+    # (the newest backup is always kept)
+    BACKUP_KEEP_COUNT = 10
+    BACKUP_MAX_TOTAL_SIZE = 10 * 1024 * 1024
+    BACKUP_MAX_AGE_DAYS = 90
+    
+    # In-memory index of settings backups per backup directory (newest first),
+    # built with one directory scan and then maintained as backups come and go
+    _backup_indexes: Dict[str, List[Dict[str, Any]]] = {}
+    _backup_indexes_lock = threading.RLock()
+    
     def __init__(self, install_dir: Path):
         """
         Initialize settings manager
@@ -26,6 +59,18 @@ class SettingsManager:
         self.settings_file = install_dir / "settings.json"
         self.metadata_file = install_dir / ".superclaude-metadata.json"
         self.backup_dir = install_dir / "backups" / "settings"
+        self.metadata_lock = self._get_metadata_lock(self.metadata_file)
+        self.settings_lock = self._get_metadata_lock(self.settings_file)
+        self._metadata_key = str(self.metadata_file.absolute())
+    
+    @classmethod
+    def _get_metadata_lock(cls, metadata_file: Path) -> threading.RLock:
+        """Get the process-wide lock guarding a metadata file"""
+        key = str(metadata_file.absolute())
+        with cls._metadata_locks_guard:
+            if key not in cls._metadata_locks:
+                cls._metadata_locks[key] = threading.RLock()
+            return cls._metadata_locks[key]
         
     def load_settings(self) -> Dict[str, Any]:
         """
@@ -43,60 +88,125 @@ class SettingsManager:
         except (json.JSONDecodeError, IOError) as e:
             raise ValueError(f"Could not load settings from {self.settings_file}: {e}")
     
+    @timed("metadata.save_settings", "metadata")
     def save_settings(self, settings: Dict[str, Any], create_backup: bool = True) -> None:
         """
         Save settings to settings.json with optional backup
         
+        Nothing is written (and no backup is made) if the file already has
+        exactly this content.
+        
         Args:
             settings: Settings dict to save
             create_backup: Whether to create backup before saving
         """
-        # Create backup if requested and file exists
-        if create_backup and self.settings_file.exists():
-            self._create_settings_backup()
-        
-        # Ensure directory exists
-        self.settings_file.parent.mkdir(parents=True, exist_ok=True)
-        
-        # Save with pretty formatting
-        try:
-            with open(self.settings_file, 'w', encoding='utf-8') as f:
-                json.dump(settings, f, indent=2, ensure_ascii=False, sort_keys=True)
-        except IOError as e:
-            raise ValueError(f"Could not save settings to {self.settings_file}: {e}")
+        with self.settings_lock:
+            # Save with pretty formatting; written as bytes so the comparison
+            # below sees exactly what is on disk (no newline translation)
+            content = json.dumps(settings, indent=2, ensure_ascii=False, sort_keys=True).encode('utf-8')
+            
+            current = None
+            if self.settings_file.exists():
+                try:
+                    current = self.settings_file.read_bytes()
+                except OSError:
+                    current = None
+            
+            if current is not None and current == content:
+                return
+            
+            # Create backup if requested and file exists
+            if create_backup and current is not None:
+                self._create_settings_backup(current)
+            
+            # Ensure directory exists
+            self.settings_file.parent.mkdir(parents=True, exist_ok=True)
+            temp_file = self.settings_file.with_name(f".{self.settings_file.name}.{os.getpid()}.tmp")
+            
+            try:
+                with open(temp_file, 'wb') as f:
+                    f.write(content)
+                    f.flush()
+                    os.fsync(f.fileno())
+                JournalManager.record_json_update(
+                    self.settings_file, lambda: json.loads(current) if current else {}, settings, self.settings_lock
+                )
+                JournalManager.record_write(self.settings_file)
+                os.replace(temp_file, self.settings_file)
+            except IOError as e:
+                raise ValueError(f"Could not save settings to {self.settings_file}: {e}")
+            finally:
+                if temp_file.exists():
+                    temp_file.unlink()
     
     def load_metadata(self) -> Dict[str, Any]:
         """
         Load SuperClaude metadata from .superclaude-metadata.json
         
+        Inside a batch() this returns the batch's working copy.
+        
         Returns:
             Metadata dict (empty if file doesn't exist)
         """
-        if not self.metadata_file.exists():
-            return {}
-        
-        try:
-            with open(self.metadata_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except (json.JSONDecodeError, IOError) as e:
-            raise ValueError(f"Could not load metadata from {self.metadata_file}: {e}")
+        with self.metadata_lock:
+            batch = self._metadata_batches.get(self._metadata_key)
+            if batch is not None:
+                return batch["metadata"]
+            return self._read_metadata()
     
     def save_metadata(self, metadata: Dict[str, Any]) -> None:
         """
         Save SuperClaude metadata to .superclaude-metadata.json
         
+        Inside a batch() the write is deferred until the batch exits.
+        
         Args:
             metadata: Metadata dict to save
         """
-        # Ensure directory exists
-        self.metadata_file.parent.mkdir(parents=True, exist_ok=True)
-        
-        # Save with pretty formatting
-        try:
-            with open(self.metadata_file, 'w', encoding='utf-8') as f:
-                json.dump(metadata, f, indent=2, ensure_ascii=False, sort_keys=True)
-        except IOError as e:
-            raise ValueError(f"Could not save metadata to {self.metadata_file}: {e}")
+        with self.metadata_lock:
+            batch = self._metadata_batches.get(self._metadata_key)
+            if batch is not None:
+                batch["metadata"] = metadata
+                batch["dirty"] = True
+                return
+            
+            with self._metadata_file_lock():
+                self._write_metadata(metadata)
+    
+    @contextmanager
+    def batch(self) -> Iterator[Dict[str, Any]]:
+        """
+        Group metadata changes into a single read and a single write
+        
+        The metadata file is loaded once on entry. Every metadata call made
+        inside the block (from any SettingsManager on the same file) works on
+        that copy, and it is written back atomically on exit if anything
+        changed. Changes are discarded if the block raises. Batches nest; the
+        outermost one writes.
+        
+        Usage:
+            with settings_manager.batch():
+                settings_manager.update_metadata(...)
+                settings_manager.add_component_registration(...)
+        
+        Yields:
+            The metadata dict being modified
+        """
+        with self.metadata_lock:
+            batch = self._metadata_batches.get(self._metadata_key)
+            if batch is not None:
+                yield batch["metadata"]
+                return
+            
+            with self._metadata_file_lock():
+                batch = {"metadata": self._read_metadata(), "dirty": False}
+                self._metadata_batches[self._metadata_key] = batch
+                try:
+                    yield batch["metadata"]
+                    if batch["dirty"]:
+                        self._write_metadata(batch["metadata"])
+                finally:
+                    del self._metadata_batches[self._metadata_key]
 
     def merge_metadata(self, modifications: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -117,10 +227,10 @@ class SettingsManager:
 
         Args:
             modifications: Settings modifications to apply
-            create_backup: Whether to create backup before updating
         """
-        merged = self.merge_metadata(modifications)
-        self.save_metadata(merged)
+        with self.batch() as metadata:
+            if self._merge_into(metadata, modifications):
+                self.save_metadata(metadata)
 
     def migrate_superclaude_data(self) -> bool:
         """
@@ -145,12 +255,8 @@ class SettingsManager:
         if not fields_found:
             return False
         
-        # Load existing metadata (if any) and merge
-        existing_metadata = self.load_metadata()
-        merged_metadata = self._deep_merge(existing_metadata, data_to_migrate)
-        
-        # Save to metadata file
-        self.save_metadata(merged_metadata)
+        # Merge into existing metadata (if any)
+        self.update_metadata(data_to_migrate)
         
         # Remove SuperClaude fields from settings
         clean_settings = {k: v for k, v in settings.items() if k not in superclaude_fields}
@@ -173,16 +279,27 @@ class SettingsManager:
         existing = self.load_settings()
         return self._deep_merge(existing, modifications)
     
-    def update_settings(self, modifications: Dict[str, Any], create_backup: bool = True) -> None:
+    def update_settings(self, modifications: Dict[str, Any], create_backup: bool = True) -> bool:
         """
         Update settings with modifications
         
+        Nothing is written (and no backup is made) when the modifications
+        are already present.
+        
         Args:
             modifications: Settings modifications to apply
             create_backup: Whether to create backup before updating
+            
+        Returns:
+            True if settings.json changed, False if it was already up to date
         """
-        merged = self.merge_settings(modifications)
+        changes: List[str] = []
+        merged = self._deep_merge(self.load_settings(), modifications, changes)
+        if not changes:
+            return False
+        
         self.save_settings(merged, create_backup)
+        return True
     
     def get_setting(self, key_path: str, default: Any = None) -> Any:
         """
@@ -266,16 +383,16 @@ class SettingsManager:
             component_name: Name of component
             component_info: Component metadata dict
         """
-        metadata = self.load_metadata()
-        if "components" not in metadata:
-            metadata["components"] = {}
-        
-        metadata["components"][component_name] = {
-            **component_info,
-            "installed_at": datetime.now().isoformat()
-        }
-        
-        self.save_metadata(metadata)
+        with self.batch() as metadata:
+            if "components" not in metadata:
+                metadata["components"] = {}
+            
+            metadata["components"][component_name] = {
+                **component_info,
+                "installed_at": datetime.now().isoformat()
+            }
+            
+            self.save_metadata(metadata)
     
     def remove_component_registration(self, component_name: str) -> bool:
         """
@@ -287,11 +404,11 @@ class SettingsManager:
         Returns:
             True if component was removed, False if not found
         """
-        metadata = self.load_metadata()
-        if "components" in metadata and component_name in metadata["components"]:
-            del metadata["components"][component_name]
-            self.save_metadata(metadata)
-            return True
+        with self.batch() as metadata:
+            if "components" in metadata and component_name in metadata["components"]:
+                del metadata["components"][component_name]
+                self.save_metadata(metadata)
+                return True
         return False
     
     def get_installed_components(self) -> Dict[str, Dict[str, Any]]:
@@ -338,14 +455,14 @@ class SettingsManager:
         Args:
             version: Framework version string
         """
-        metadata = self.load_metadata()
-        if "framework" not in metadata:
-            metadata["framework"] = {}
-        
-        metadata["framework"]["version"] = version
-        metadata["framework"]["updated_at"] = datetime.now().isoformat()
-        
-        self.save_metadata(metadata)
+        with self.batch() as metadata:
+            if "framework" not in metadata:
+                metadata["framework"] = {}
+            
+            metadata["framework"]["version"] = version
+            metadata["framework"]["updated_at"] = datetime.now().isoformat()
+            
+            self.save_metadata(metadata)
     
     def check_installation_exists(self) -> bool:
         """
@@ -386,74 +503,244 @@ class SettingsManager:
         except (KeyError, TypeError):
             return default
     
-    def _deep_merge(self, base: Dict[str, Any], overlay: Dict[str, Any]) -> Dict[str, Any]:
+    def _deep_merge(self, base: Dict[str, Any], overlay: Dict[str, Any],
+                    changes: Optional[List[str]] = None, _prefix: str = "") -> Dict[str, Any]:
         """
-        Deep merge two dictionaries
+        Deep merge two dictionaries without modifying either
+        
+        Copy-on-write: only the dicts on the path to a changed key are
+        copied. Unchanged subtrees are shared with base (and base itself is
+        returned when nothing changed), so the cost follows the size of the
+        overlay, not of the whole settings tree. Do not mutate the result in
+        place if base must stay untouched.
         
         Args:
             base: Base dictionary
             overlay: Dictionary to merge on top
+            changes: If given, dot-separated paths of changed keys are appended
             
         Returns:
             Merged dictionary
         """
-        result = copy.deepcopy(base)
+        result = base
         
         for key, value in overlay.items():
-            if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-                result[key] = self._deep_merge(result[key], value)
+            key_path = f"{_prefix}{key}"
+            current = base.get(key)
+            
+            if key in base and isinstance(current, dict) and isinstance(value, dict):
+                merged = self._deep_merge(current, value, changes, f"{key_path}.")
+                if merged is current:
+                    continue
+            elif key in base and current == value:
+                continue
             else:
-                result[key] = copy.deepcopy(value)
+                merged = copy.deepcopy(value)
+                if changes is not None:
+                    changes.append(key_path)
+            
+            if result is base:
+                result = dict(base)
+            result[key] = merged
         
         return result
     
-    def _create_settings_backup(self) -> Path:
+    def _merge_into(self, target: Dict[str, Any], overlay: Dict[str, Any], _prefix: str = "") -> List[str]:
+        """
+        Deep merge overlay into target in place
+        
+        Only the overlay's changed values are copied; target is never duplicated.
+        
+        Args:
+            target: Dictionary to modify
+            overlay: Dictionary to merge on top
+            
+        Returns:
+            Dot-separated paths of the keys that changed
+        """
+        changes = []
+        for key, value in overlay.items():
+            key_path = f"{_prefix}{key}"
+            if key in target and isinstance(target[key], dict) and isinstance(value, dict):
+                changes.extend(self._merge_into(target[key], value, f"{key_path}."))
+            elif key not in target or target[key] != value:
+                target[key] = copy.deepcopy(value)
+                changes.append(key_path)
+        return changes
+    
+    def _read_metadata(self) -> Dict[str, Any]:
+        """Read the metadata file from disk (empty if it doesn't exist)"""
+        if not self.metadata_file.exists():
+            return {}
+        
+        try:
+            with open(self.metadata_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (json.JSONDecodeError, IOError) as e:
+            raise ValueError(f"Could not load metadata from {self.metadata_file}: {e}")
+    
+    @timed("metadata.write", "metadata")
+    def _write_metadata(self, metadata: Dict[str, Any]) -> None:
+        """Write the metadata file atomically (temp file, fsync, rename)"""
+        self.metadata_file.parent.mkdir(parents=True, exist_ok=True)
+        temp_file = self.metadata_file.with_name(f"{self.metadata_file.name}.{os.getpid()}.tmp")
+        
+        try:
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                json.dump(metadata, f, indent=2, ensure_ascii=False, sort_keys=True)
+                f.flush()
+                os.fsync(f.fileno())
+            JournalManager.record_json_update(self.metadata_file, self._read_metadata, metadata, self.metadata_lock)
+            JournalManager.record_write(self.metadata_file)
+            os.replace(temp_file, self.metadata_file)
+        except IOError as e:
+            raise ValueError(f"Could not save metadata to {self.metadata_file}: {e}")
+        finally:
+            if temp_file.exists():
+                temp_file.unlink()
+    
+    @contextmanager
+    def _metadata_file_lock(self) -> Iterator[None]:
+        """Hold an exclusive lock on the metadata lock file (guards against other installer processes)"""
+        lock_file = self.metadata_file.with_name(f"{self.metadata_file.name}.lock")
+        lock_file.parent.mkdir(parents=True, exist_ok=True)
+        
+        with open(lock_file, 'a+b') as handle:
+            if fcntl is not None:
+                fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+            else:
+                handle.seek(0)
+                msvcrt.locking(handle.fileno(), msvcrt.LK_LOCK, 1)
+            
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+                else:
+                    handle.seek(0)
+                    msvcrt.locking(handle.fileno(), msvcrt.LK_UNLCK, 1)
+    
+    def _create_settings_backup(self, content: Optional[bytes] = None) -> Path:
         """
         Create timestamped backup of settings.json
         
+        If the newest backup already holds identical content it is reused
+        instead of writing another copy.
+        
+        Args:
+            content: Current settings.json bytes (read from disk if None)
+            
         Returns:
             Path to backup file
         """
         if not self.settings_file.exists():
             raise ValueError("Cannot backup non-existent settings file")
         
-        # Create backup directory
-        self.backup_dir.mkdir(parents=True, exist_ok=True)
+        if content is None:
+            content = self.settings_file.read_bytes()
+        digest = hashlib.sha256(content).hexdigest()
         
-        # Create timestamped backup
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        backup_file = self.backup_dir / f"settings_{timestamp}.json"
-        
-        shutil.copy2(self.settings_file, backup_file)
-        
-        # Keep only last 10 backups
-        self._cleanup_old_backups()
+        with self._backup_indexes_lock:
+            index = self._get_backup_index()
+            
+            # Skip no-op backups
+            if index and self._backup_digest(index[0]) == digest:
+                return index[0]["path"]
+            
+            # Create backup directory
+            self.backup_dir.mkdir(parents=True, exist_ok=True)
+            
+            # Microsecond timestamp plus content hash; exclusive create guards against collisions
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+            backup_file = self.backup_dir / f"settings_{timestamp}_{digest[:12]}.json"
+            counter = 1
+            while True:
+                try:
+                    with open(backup_file, 'xb') as f:
+                        f.write(content)
+                    break
+                except FileExistsError:
+                    backup_file = self.backup_dir / f"settings_{timestamp}_{digest[:12]}_{counter}.json"
+                    counter += 1
+            
+            index.insert(0, {
+                "path": backup_file,
+                "size": len(content),
+                "mtime": time.time(),
+                "sha256": digest
+            })
+            
+            # Apply retention policy
+            self._cleanup_old_backups()
         
         return backup_file
     
-    def _cleanup_old_backups(self, keep_count: int = 10) -> None:
+    def _cleanup_old_backups(self, keep_count: Optional[int] = None, max_total_size: Optional[int] = None,
+                             max_age_days: Optional[int] = None) -> None:
         """
-        Remove old backup files, keeping only the most recent
+        Remove old backup files by count, total size and age
+        
+        Works from the in-memory backup index, so no directory scan is needed.
+        The newest backup is always kept.
         
         Args:
-            keep_count: Number of backups to keep
+            keep_count: Number of backups to keep (default: BACKUP_KEEP_COUNT)
+            max_total_size: Total bytes of backups to keep (default: BACKUP_MAX_TOTAL_SIZE)
+            max_age_days: Age in days after which backups are removed (default: BACKUP_MAX_AGE_DAYS)
         """
-        if not self.backup_dir.exists():
-            return
-        
-        # Get all backup files sorted by modification time
-        backup_files = []
-        for file in self.backup_dir.glob("settings_*.json"):
-            backup_files.append((file.stat().st_mtime, file))
+        keep_count = self.BACKUP_KEEP_COUNT if keep_count is None else keep_count
+        max_total_size = self.BACKUP_MAX_TOTAL_SIZE if max_total_size is None else max_total_size
+        max_age_days = self.BACKUP_MAX_AGE_DAYS if max_age_days is None else max_age_days
         
-        backup_files.sort(reverse=True)  # Most recent first
+        with self._backup_indexes_lock:
+            index = self._get_backup_index()
+            cutoff = time.time() - max_age_days * 24 * 60 * 60
+            
+            kept = []
+            total_size = 0
+            for position, entry in enumerate(index):
+                total_size += entry["size"]
+                if position > 0 and (position >= keep_count or total_size > max_total_size or entry["mtime"] < cutoff):
+                    try:
+                        entry["path"].unlink()
+                    except OSError:
+                        pass  # Ignore errors when cleaning up
+                    continue
+                kept.append(entry)
+            
+            index[:] = kept
+    
+    def _get_backup_index(self) -> List[Dict[str, Any]]:
+        """
+        Get the in-memory index of settings backups, newest first
         
-        # Remove old backups
-        for _, file in backup_files[keep_count:]:
+        Returns:
+            List of dicts with path, size, mtime and sha256 (None until computed)
+        """
+        key = str(self.backup_dir.absolute())
+        with self._backup_indexes_lock:
+            if key not in self._backup_indexes:
+                index = []
+                if self.backup_dir.exists():
+                    for file in self.backup_dir.glob("settings_*.json"):
+                        try:
+                            stat = file.stat()
+                        except OSError:
+                            continue
+                        index.append({"path": file, "size": stat.st_size, "mtime": stat.st_mtime, "sha256": None})
+                index.sort(key=lambda entry: entry["mtime"], reverse=True)
+                self._backup_indexes[key] = index
+            return self._backup_indexes[key]
+    
+    def _backup_digest(self, entry: Dict[str, Any]) -> Optional[str]:
+        """Get (and remember) the sha256 of an indexed backup"""
+        if entry["sha256"] is None:
             try:
-                file.unlink()
+                entry["sha256"] = hashlib.sha256(entry["path"].read_bytes()).hexdigest()
             except OSError:
-                pass  # Ignore errors when cleaning up
+                return None
+        return entry["sha256"]
     
     def list_backups(self) -> List[Dict[str, Any]]:
         """
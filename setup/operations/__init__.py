@@ -74,6 +74,10 @@ class OperationBase:
             if args.verbose and args.quiet:
                 errors.append("Cannot specify both --verbose and --quiet")
         
+        # Check worker count for parallel operations
+        if getattr(args, 'workers', None) is not None and args.workers < 1:
+            errors.append("--workers must be at least 1")
+        
         return len(errors) == 0, errors
     
     def handle_operation_error(self, operation: str, error: Exception):
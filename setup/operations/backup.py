@@ -5,14 +5,13 @@ Refactored from backup.py for unified CLI hub
 
 import sys
 import time
-import tarfile
-import json
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import List, Optional, Dict, Any, Tuple
 import argparse
 
 from ..managers.settings_manager import SettingsManager
+from ..managers.backup_manager import BackupManager
 from ..utils.ui import (
     display_header, display_info, display_success, display_error, 
     display_warning, Menu, confirm, ProgressBar, Colors, format_size
@@ -40,11 +39,14 @@ def register_parser(subparsers, global_parser=None) -> argparse.ArgumentParser:
         epilog="""
 Examples:
   SuperClaude backup --create               # Create new backup
+  SuperClaude backup --create --incremental # Store only changed files
   SuperClaude backup --list --verbose       # List available backups (verbose)
   SuperClaude backup --restore              # Interactive restore
   SuperClaude backup --restore backup.tar.gz  # Restore specific backup
+  SuperClaude backup --restore backup.tar.gz --components commands --overwrite
   SuperClaude backup --info backup.tar.gz   # Show backup information
   SuperClaude backup --cleanup --force      # Clean up old backups (forced)
+  SuperClaude backup --rebuild-index        # Rebuild the backup catalog
         """,
         formatter_class=argparse.RawDescriptionHelpFormatter,
         parents=parents
@@ -84,6 +86,12 @@ Examples:
         help="Clean up old backup files"
     )
     
+    operation_group.add_argument(
+        "--rebuild-index",
+        action="store_true",
+        help="Rebuild the backup catalog by scanning all backups"
+    )
+    
     # Backup options
     parser.add_argument(
         "--backup-dir",
@@ -97,13 +105,38 @@ Examples:
         help="Custom backup name (for --create)"
     )
     
+    parser.add_argument(
+        "--exclude",
+        type=str,
+        nargs="+",
+        help="Leave out files matching these gitignore-style patterns (for --create, e.g. '*.log' 'cache/')"
+    )
+    
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Store files in the deduplicating object store (backups/objects) instead of an archive"
+    )
+    
     parser.add_argument(
         "--compress",
-        choices=["none", "gzip", "bzip2"],
+        choices=list(BackupManager.COMPRESSION_SUFFIXES),
         default="gzip",
         help="Compression method (default: gzip)"
     )
     
+    parser.add_argument(
+        "--level",
+        type=int,
+        help="Compression level (default: compressor default)"
+    )
+    
+    parser.add_argument(
+        "--threads",
+        type=int,
+        help="Compression threads (gzip uses pigz, xz uses xz -T when > 1)"
+    )
+    
     # Restore options
     parser.add_argument(
         "--overwrite",
@@ -111,6 +144,26 @@ Examples:
         help="Overwrite existing files during restore"
     )
     
+    parser.add_argument(
+        "--components",
+        type=str,
+        nargs="+",
+        help="Only restore files belonging to these components"
+    )
+    
+    parser.add_argument(
+        "--paths",
+        type=str,
+        nargs="+",
+        help="Only restore files matching these glob patterns (e.g. 'commands/*')"
+    )
+    
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="Writer threads used during restore (default: 4)"
+    )
+    
     # Cleanup options
     parser.add_argument(
         "--keep",
@@ -145,67 +198,12 @@ def check_installation_exists(install_dir: Path) -> bool:
 
 def get_backup_info(backup_path: Path) -> Dict[str, Any]:
     """Get information about a backup file"""
-    info = {
-        "path": backup_path,
-        "exists": backup_path.exists(),
-        "size": 0,
-        "created": None,
-        "metadata": {}
-    }
-    
-    if not backup_path.exists():
-        return info
-    
-    try:
-        # Get file stats
-        stats = backup_path.stat()
-        info["size"] = stats.st_size
-        info["created"] = datetime.fromtimestamp(stats.st_mtime)
-        
-        # Try to read metadata from backup
-        if backup_path.suffix == ".gz":
-            mode = "r:gz"
-        elif backup_path.suffix == ".bz2":
-            mode = "r:bz2"
-        else:
-            mode = "r"
-        
-        with tarfile.open(backup_path, mode) as tar:
-            # Look for metadata file
-            try:
-                metadata_member = tar.getmember("backup_metadata.json")
-                metadata_file = tar.extractfile(metadata_member)
-                if metadata_file:
-                    info["metadata"] = json.loads(metadata_file.read().decode())
-            except KeyError:
-                pass  # No metadata file
-            
-            # Get list of files in backup
-            info["files"] = len(tar.getnames())
-            
-    except Exception as e:
-        info["error"] = str(e)
-    
-    return info
+    return BackupManager.read_backup_info(backup_path)
 
 
 def list_backups(backup_dir: Path) -> List[Dict[str, Any]]:
-    """List all available backups"""
-    backups = []
-    
-    if not backup_dir.exists():
-        return backups
-    
-    # Find all backup files
-    for backup_file in backup_dir.glob("*.tar*"):
-        if backup_file.is_file():
-            info = get_backup_info(backup_file)
-            backups.append(info)
-    
-    # Sort by creation date (newest first)
-    backups.sort(key=lambda x: x.get("created", datetime.min), reverse=True)
-    
-    return backups
+    """List all available backups (served from the backup catalog)"""
+    return BackupManager(backup_dir.parent, backup_dir).list_backups()
 
 
 def display_backup_list(backups: List[Dict[str, Any]]) -> None:
@@ -233,31 +231,7 @@ def display_backup_list(backups: List[Dict[str, Any]]) -> None:
 
 def create_backup_metadata(install_dir: Path) -> Dict[str, Any]:
     """Create metadata for the backup"""
-    metadata = {
-        "backup_version": "3.0.0",
-        "created": datetime.now().isoformat(),
-        "install_dir": str(install_dir),
-        "components": {},
-        "framework_version": "unknown"
-    }
-    
-    try:
-        # Get installed components from metadata
-        settings_manager = SettingsManager(install_dir)
-        framework_config = settings_manager.get_metadata_setting("framework")
-        
-        if framework_config:
-            metadata["framework_version"] = framework_config.get("version", "unknown")
-            
-            if "components" in framework_config:
-                for component_name in framework_config["components"]:
-                    version = settings_manager.get_component_version(component_name)
-                    if version:
-                        metadata["components"][component_name] = version
-    except Exception:
-        pass  # Continue without metadata
-    
-    return metadata
+    return BackupManager(install_dir).build_metadata()
 
 
 def create_backup(args: argparse.Namespace) -> bool:
@@ -274,64 +248,32 @@ def create_backup(args: argparse.Namespace) -> bool:
         backup_dir = get_backup_directory(args)
         backup_dir.mkdir(parents=True, exist_ok=True)
         
-        # Generate backup filename
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        if args.name:
-            backup_name = f"{args.name}_{timestamp}"
-        else:
-            backup_name = f"superclaude_backup_{timestamp}"
-        
-        # Determine compression
-        if args.compress == "gzip":
-            backup_file = backup_dir / f"{backup_name}.tar.gz"
-            mode = "w:gz"
-        elif args.compress == "bzip2":
-            backup_file = backup_dir / f"{backup_name}.tar.bz2"
-            mode = "w:bz2"
-        else:
-            backup_file = backup_dir / f"{backup_name}.tar"
-            mode = "w"
+        logger.info(f"Creating backup in: {backup_dir}")
         
-        logger.info(f"Creating backup: {backup_file}")
+        backup_manager = BackupManager(args.install_dir, backup_dir, ignore_patterns=args.exclude)
         
-        # Create metadata
-        metadata = create_backup_metadata(args.install_dir)
-        
-        # Create backup
-        start_time = time.time()
+        if args.incremental:
+            # Only content not already in the object store is written
+            result = backup_manager.create_incremental_backup(name=args.name)
+        else:
+            # Stream installation files straight into the archive
+            result = backup_manager.create_backup(
+                name=args.name,
+                compression=args.compress,
+                level=args.level,
+                threads=args.threads
+            )
         
-        with tarfile.open(backup_file, mode) as tar:
-            # Add metadata file
-            import tempfile
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as temp_file:
-                json.dump(metadata, temp_file, indent=2)
-                temp_file.flush()
-                tar.add(temp_file.name, arcname="backup_metadata.json")
-                Path(temp_file.name).unlink()  # Clean up temp file
-            
-            # Add installation directory contents
-            files_added = 0
-            for item in args.install_dir.rglob("*"):
-                if item.is_file() and item != backup_file:
-                    try:
-                        # Create relative path for archive
-                        rel_path = item.relative_to(args.install_dir)
-                        tar.add(item, arcname=str(rel_path))
-                        files_added += 1
-                        
-                        if files_added % 10 == 0:
-                            logger.debug(f"Added {files_added} files to backup")
-                            
-                    except Exception as e:
-                        logger.warning(f"Could not add {item} to backup: {e}")
+        for skipped in result["skipped"]:
+            logger.warning(f"Could not add {skipped} to backup")
         
-        duration = time.time() - start_time
-        file_size = backup_file.stat().st_size
+        logger.success(f"Backup created successfully in {result['duration']:.1f} seconds")
+        logger.info(f"Backup file: {result['path']}")
+        logger.info(f"Files archived: {result['files']}")
+        logger.info(f"Backup size: {format_size(result['size'])}")
         
-        logger.success(f"Backup created successfully in {duration:.1f} seconds")
-        logger.info(f"Backup file: {backup_file}")
-        logger.info(f"Files archived: {files_added}")
-        logger.info(f"Backup size: {format_size(file_size)}")
+        if args.incremental:
+            logger.info(f"New objects stored: {result['new_objects']} ({format_size(result['bytes_stored'])})")
         
         return True
         
@@ -357,51 +299,42 @@ def restore_backup(backup_path: Path, args: argparse.Namespace) -> bool:
         
         logger.info(f"Restoring from backup: {backup_path}")
         
-        # Determine compression
-        if backup_path.suffix == ".gz":
-            mode = "r:gz"
-        elif backup_path.suffix == ".bz2":
-            mode = "r:bz2"
-        else:
-            mode = "r"
+        backup_manager = BackupManager(args.install_dir, backup_path.parent)
         
-        # Create backup of current installation if it exists
+        # Snapshot current installation first (incremental, so only changed files are stored)
         if check_installation_exists(args.install_dir) and not args.dry_run:
             logger.info("Creating backup of current installation before restore")
-            # This would call create_backup internally
+            snapshot = BackupManager(args.install_dir, get_backup_directory(args)).create_incremental_backup(name="pre_restore")
+            logger.info(f"Pre-restore snapshot: {snapshot['path'].name}")
+        
+        if args.components:
+            logger.info(f"Restoring components: {', '.join(args.components)}")
+        if args.paths:
+            logger.info(f"Restoring paths matching: {', '.join(args.paths)}")
         
         # Extract backup
         start_time = time.time()
-        files_restored = 0
+        result = backup_manager.restore_backup(
+            backup_path,
+            components=args.components,
+            patterns=args.paths,
+            overwrite=args.overwrite,
+            max_workers=args.workers
+        )
         
-        with tarfile.open(backup_path, mode) as tar:
-            # Extract all files except metadata
-            for member in tar.getmembers():
-                if member.name == "backup_metadata.json":
-                    continue
-                
-                try:
-                    target_path = args.install_dir / member.name
-                    
-                    # Check if file exists and overwrite flag
-                    if target_path.exists() and not args.overwrite:
-                        logger.warning(f"Skipping existing file: {target_path}")
-                        continue
-                    
-                    # Extract file
-                    tar.extract(member, args.install_dir)
-                    files_restored += 1
-                    
-                    if files_restored % 10 == 0:
-                        logger.debug(f"Restored {files_restored} files")
-                        
-                except Exception as e:
-                    logger.warning(f"Could not restore {member.name}: {e}")
+        for rel_path in result["existing"]:
+            logger.warning(f"Skipping existing file: {args.install_dir / rel_path}")
+        for rel_path in result["failed"]:
+            logger.warning(f"Could not restore {rel_path}")
+        
+        backup_manager.mark_restored(backup_path)
         
         duration = time.time() - start_time
         
         logger.success(f"Restore completed successfully in {duration:.1f} seconds")
-        logger.info(f"Files restored: {files_restored}")
+        logger.info(f"Files restored: {len(result['restored'])}")
+        if result["unchanged"]:
+            logger.info(f"Files already up to date: {len(result['unchanged'])}")
         
         return True
         
@@ -435,6 +368,22 @@ def interactive_restore_selection(backups: List[Dict[str, Any]]) -> Optional[Pat
     return backups[choice]["path"]
 
 
+def collect_backup_garbage(backup_dir: Path) -> bool:
+    """Remove incremental backup objects no longer referenced by any manifest"""
+    logger = get_logger()
+    
+    try:
+        removed, freed = BackupManager(backup_dir.parent, backup_dir).collect_garbage()
+    except ValueError as e:
+        logger.warning(f"Skipping object garbage collection: {e}")
+        return True
+    
+    if removed:
+        logger.info(f"Removed {removed} unreferenced backup objects ({format_size(freed)})")
+    
+    return True
+
+
 def cleanup_old_backups(backup_dir: Path, args: argparse.Namespace) -> bool:
     """Clean up old backup files"""
     logger = get_logger()
@@ -465,18 +414,22 @@ def cleanup_old_backups(backup_dir: Path, args: argparse.Namespace) -> bool:
         
         if not to_remove:
             logger.info("No backups need to be cleaned up")
-            return True
+            return collect_backup_garbage(backup_dir)
         
         logger.info(f"Cleaning up {len(to_remove)} old backups")
         
+        removed = []
         for backup in to_remove:
             try:
                 backup["path"].unlink()
+                removed.append(backup["path"])
                 logger.info(f"Removed backup: {backup['path'].name}")
             except Exception as e:
                 logger.warning(f"Could not remove {backup['path'].name}: {e}")
         
-        return True
+        BackupManager(backup_dir.parent, backup_dir).remove_from_catalog(removed)
+        
+        return collect_backup_garbage(backup_dir)
         
     except Exception as e:
         logger.exception(f"Failed to cleanup backups: {e}")
@@ -568,6 +521,12 @@ def run(args: argparse.Namespace) -> int:
         elif args.cleanup:
             success = cleanup_old_backups(backup_dir, args)
         
+        elif args.rebuild_index:
+            start_time = time.time()
+            indexed = BackupManager(args.install_dir, backup_dir).rebuild_catalog()
+            logger.success(f"Indexed {indexed} backups in {time.time() - start_time:.1f} seconds")
+            success = True
+        
         else:
             logger.error("No backup operation specified")
             success = False
@@ -12,12 +12,14 @@ import argparse
 from ..base.installer import Installer
 from ..core.registry import ComponentRegistry
 from ..managers.config_manager import ConfigManager
+from ..managers.journal_manager import JournalManager
 from ..core.validator import Validator
 from ..utils.ui import (
     display_header, display_info, display_success, display_error, 
-    display_warning, Menu, confirm, ProgressBar, Colors, format_size
+    display_warning, Menu, confirm, Colors, format_size
 )
 from ..utils.logger import get_logger
+from ..utils.progress import create_progress
 from .. import DEFAULT_INSTALL_DIR, PROJECT_ROOT
 from . import OperationBase
 
@@ -76,10 +78,47 @@ Examples:
     )
     
     # Installation options
+    parser.add_argument(
+        "--backup",
+        action="store_true",
+        help="Create a full backup before installing (changes are journaled and rolled back on failure either way)"
+    )
+    
     parser.add_argument(
         "--no-backup",
         action="store_true",
-        help="Skip backup creation"
+        help="Skip backup creation (default)"
+    )
+    
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Resume an interrupted installation instead of rolling it back"
+    )
+    
+    parser.add_argument(
+        "--no-incremental",
+        action="store_true",
+        help="Rewrite every file instead of skipping files that are already up to date"
+    )
+    
+    parser.add_argument(
+        "--link",
+        action="store_true",
+        help="Reflink or hard link framework files from the source tree instead of copying them (falls back to copy)"
+    )
+    
+    parser.add_argument(
+        "--parallel",
+        action="store_true",
+        help="Install independent components concurrently, level by level"
+    )
+    
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Maximum concurrent component installs with --parallel (default: level size)"
     )
     
     parser.add_argument(
@@ -338,14 +377,33 @@ def perform_installation(components: List[str], args: argparse.Namespace) -> boo
     
     try:
         # Create installer
-        installer = Installer(args.install_dir, dry_run=args.dry_run)
+        # Progress is driven by installer events as each component finishes
+        progress = create_progress(args, total=0, prefix="Installing: ")
+        installer = Installer(
+            args.install_dir,
+            dry_run=args.dry_run,
+            parallel=args.parallel,
+            max_workers=args.workers,
+            progress_callback=progress
+        )
         
         # Create component registry
         registry = ComponentRegistry(PROJECT_ROOT / "setup" / "components")
         registry.discover_components()
         
-        # Create component instances
-        component_instances = registry.create_component_instances(components, args.install_dir)
+        # A resumed installation also finishes the components of the interrupted run
+        if args.resume and not args.dry_run:
+            pending = JournalManager(args.install_dir).pending_info()
+            if pending:
+                components = list(dict.fromkeys(components + [
+                    name for name in pending["components"] if name in registry.list_components()
+                ]))
+        
+        # Resolve dependencies
+        ordered_components = registry.resolve_dependencies(components)
+        
+        # Create component instances (dependencies included, the installer resolves them too)
+        component_instances = registry.create_component_instances(ordered_components, args.install_dir)
         
         if not component_instances:
             logger.error("No valid component instances created")
@@ -354,35 +412,20 @@ def perform_installation(components: List[str], args: argparse.Namespace) -> boo
         # Register components with installer
         installer.register_components(list(component_instances.values()))
         
-        # Resolve dependencies
-        ordered_components = registry.resolve_dependencies(components)
-        
-        # Setup progress tracking
-        progress = ProgressBar(
-            total=len(ordered_components),
-            prefix="Installing: ",
-            suffix=""
-        )
-        
         # Install components
         logger.info(f"Installing {len(ordered_components)} components...")
         
         config = {
             "force": args.force,
-            "backup": not args.no_backup,
-            "dry_run": args.dry_run
+            "backup": args.backup and not args.no_backup,
+            "resume": args.resume,
+            "dry_run": args.dry_run,
+            "incremental": not args.no_incremental,
+            "link": args.link
         }
         
         success = installer.install_components(ordered_components, config)
         
-        # Update progress
-        for i, component_name in enumerate(ordered_components):
-            if component_name in installer.installed_components:
-                progress.update(i + 1, f"Installed {component_name}")
-            else:
-                progress.update(i + 1, f"Failed {component_name}")
-            time.sleep(0.1)  # Brief pause for visual effect
-        
         progress.finish("Installation complete")
         
         # Show results
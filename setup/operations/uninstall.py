@@ -12,11 +12,14 @@ import argparse
 from ..core.registry import ComponentRegistry
 from ..managers.settings_manager import SettingsManager
 from ..managers.file_manager import FileManager
+from ..managers.journal_manager import JournalManager
+from ..utils.walker import walk
 from ..utils.ui import (
     display_header, display_info, display_success, display_error, 
-    display_warning, Menu, confirm, ProgressBar, Colors
+    display_warning, Menu, confirm, Colors
 )
 from ..utils.logger import get_logger
+from ..utils.progress import create_progress, make_event
 from .. import DEFAULT_INSTALL_DIR, PROJECT_ROOT
 from . import OperationBase
 
@@ -116,15 +119,10 @@ def get_installation_info(install_dir: Path) -> Dict[str, Any]:
     info["components"] = get_installed_components(install_dir)
     
     # Scan installation directory
-    try:
-        for item in install_dir.rglob("*"):
-            if item.is_file():
-                info["files"].append(item)
-                info["total_size"] += item.stat().st_size
-            elif item.is_dir():
-                info["directories"].append(item)
-    except Exception:
-        pass
+    tree = walk(install_dir, workers=4)
+    info["files"] = tree.paths()
+    info["directories"] = tree.directories
+    info["total_size"] = tree.total_size
     
     return info
 
@@ -293,11 +291,9 @@ def perform_uninstall(components: List[str], args: argparse.Namespace, info: Dic
         component_instances = registry.create_component_instances(components, args.install_dir)
         
         # Setup progress tracking
-        progress = ProgressBar(
-            total=len(components),
-            prefix="Uninstalling: ",
-            suffix=""
-        )
+        progress = create_progress(args, total=len(components), prefix="Uninstalling: ")
+        progress(make_event("operation_start", operation="uninstall",
+                            components=components, total=len(components)))
         
         # Uninstall components
         logger.info(f"Uninstalling {len(components)} components...")
@@ -305,29 +301,55 @@ def perform_uninstall(components: List[str], args: argparse.Namespace, info: Dic
         uninstalled_components = []
         failed_components = []
         
-        for i, component_name in enumerate(components):
-            progress.update(i, f"Uninstalling {component_name}")
+        # Journal removals so a component that fails halfway is restored intact
+        journal = JournalManager(args.install_dir)
+        if journal.has_pending():
+            logger.warning("Rolling back an interrupted operation before uninstalling...")
+            journal.recover()
+        journal.begin("uninstall", components)
+        
+        for component_name in components:
+            progress(make_event("component_start", component=component_name, action="uninstalling"))
+            started = time.time()
+            errors = []
             
             try:
                 if component_name in component_instances:
                     instance = component_instances[component_name]
-                    if instance.uninstall():
+                    with journal.component(component_name):
+                        removed = instance.uninstall()
+                    if removed:
                         uninstalled_components.append(component_name)
                         logger.debug(f"Successfully uninstalled {component_name}")
                     else:
+                        journal.rollback(component_name)
                         failed_components.append(component_name)
-                        logger.error(f"Failed to uninstall {component_name}")
+                        logger.error(f"Failed to uninstall {component_name}, changes were rolled back")
+                        errors.append("uninstall returned failure")
                 else:
                     logger.warning(f"Component {component_name} not found, skipping")
                     
             except Exception as e:
+                journal.rollback(component_name)
                 logger.error(f"Error uninstalling {component_name}: {e}")
                 failed_components.append(component_name)
+                errors.append(str(e))
             
-            progress.update(i + 1, f"Processed {component_name}")
-            time.sleep(0.1)  # Brief pause for visual effect
-        
+            progress(make_event(
+                "component_end",
+                component=component_name,
+                status="failed" if errors else "removed",
+                files_copied=0,
+                files_skipped=0,
+                bytes_written=0,
+                duration=time.time() - started,
+                errors=errors
+            ))
+        
+        progress(make_event("operation_end", success=not failed_components,
+                            duration=time.time() - start_time))
         progress.finish("Uninstall complete")
+        journal.commit()
         
         # Handle complete uninstall cleanup
         if args.complete:
@@ -15,9 +15,10 @@ from ..managers.settings_manager import SettingsManager
 from ..core.validator import Validator
 from ..utils.ui import (
     display_header, display_info, display_success, display_error, 
-    display_warning, Menu, confirm, ProgressBar, Colors, format_size
+    display_warning, Menu, confirm, Colors, format_size
 )
 from ..utils.logger import get_logger
+from ..utils.progress import create_progress
 from .. import DEFAULT_INSTALL_DIR, PROJECT_ROOT
 from . import OperationBase
 
@@ -41,6 +42,7 @@ def register_parser(subparsers, global_parser=None) -> argparse.ArgumentParser:
 Examples:
   SuperClaude update                       # Interactive update
   SuperClaude update --check --verbose     # Check for updates (verbose)
+  SuperClaude update --verify --quiet      # Health check against install manifest
   SuperClaude update --components core mcp # Update specific components
   SuperClaude update --backup --force      # Create backup before update (forced)
         """,
@@ -55,6 +57,12 @@ Examples:
         help="Check for available updates without installing"
     )
     
+    parser.add_argument(
+        "--verify",
+        action="store_true",
+        help="Verify installed files against the install manifest without updating"
+    )
+    
     parser.add_argument(
         "--components",
         type=str,
@@ -66,13 +74,13 @@ Examples:
     parser.add_argument(
         "--backup",
         action="store_true",
-        help="Create backup before update"
+        help="Create a full backup before update (changes are journaled and rolled back on failure either way)"
     )
     
     parser.add_argument(
         "--no-backup",
         action="store_true",
-        help="Skip backup creation"
+        help="Skip backup creation (default)"
     )
     
     # Update options
@@ -82,6 +90,31 @@ Examples:
         help="Reinstall components even if versions match"
     )
     
+    parser.add_argument(
+        "--no-incremental",
+        action="store_true",
+        help="Rewrite every file instead of skipping files that are already up to date"
+    )
+    
+    parser.add_argument(
+        "--link",
+        action="store_true",
+        help="Reflink or hard link framework files from the source tree instead of copying them (falls back to copy)"
+    )
+    
+    parser.add_argument(
+        "--parallel",
+        action="store_true",
+        help="Update independent components concurrently, level by level"
+    )
+    
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Maximum concurrent component updates with --parallel (default: level size)"
+    )
+    
     return parser
 
 def check_installation_exists(install_dir: Path) -> bool:
@@ -120,6 +153,32 @@ def get_available_updates(installed_components: Dict[str, str], registry: Compon
     return updates
 
 
+def verify_installation(installed_components: Dict[str, str], registry: ComponentRegistry,
+                        install_dir: Path) -> bool:
+    """Verify installed components against the install manifest"""
+    logger = get_logger()
+    all_valid = True
+    
+    component_instances = registry.create_component_instances(list(installed_components.keys()), install_dir)
+    
+    for component_name in installed_components:
+        component = component_instances.get(component_name)
+        if component is None:
+            logger.warning(f"Unknown component: {component_name}")
+            continue
+        
+        success, errors = component.validate_installation_fast()
+        if success:
+            logger.info(f"{component_name}: Valid")
+        else:
+            all_valid = False
+            logger.error(f"{component_name}: Invalid")
+            for error in errors:
+                logger.error(f"  - {error}")
+    
+    return all_valid
+
+
 def display_update_check(installed_components: Dict[str, str], available_updates: Dict[str, Dict[str, str]]) -> None:
     """Display update check results"""
     print(f"\n{Colors.CYAN}{Colors.BRIGHT}Update Check Results{Colors.RESET}")
@@ -242,7 +301,15 @@ def perform_update(components: List[str], args: argparse.Namespace) -> bool:
     
     try:
         # Create installer
-        installer = Installer(args.install_dir, dry_run=args.dry_run)
+        # Progress is driven by installer events as each component finishes
+        progress = create_progress(args, total=0, prefix="Updating: ")
+        installer = Installer(
+            args.install_dir,
+            dry_run=args.dry_run,
+            parallel=args.parallel,
+            max_workers=args.workers,
+            progress_callback=progress
+        )
         
         # Create component registry
         registry = ComponentRegistry(PROJECT_ROOT / "setup" / "components")
@@ -258,36 +325,24 @@ def perform_update(components: List[str], args: argparse.Namespace) -> bool:
         # Register components with installer
         installer.register_components(list(component_instances.values()))
         
-        # Setup progress tracking
-        progress = ProgressBar(
-            total=len(components),
-            prefix="Updating: ",
-            suffix=""
-        )
-        
         # Update components
         logger.info(f"Updating {len(components)} components...")
         
-        # Determine backup strategy
-        backup = args.backup or (not args.no_backup and not args.dry_run)
+        # Full backups are opt-in; the install journal covers rollback
+        backup = args.backup and not args.no_backup and not args.dry_run
         
         config = {
             "force": args.force,
             "backup": backup,
             "dry_run": args.dry_run,
+            "incremental": not args.no_incremental,
+            "link": args.link,
+            "operation": "update",
             "update_mode": True
         }
         
         success = installer.update_components(components, config)
         
-        # Update progress
-        for i, component_name in enumerate(components):
-            if component_name in installer.updated_components:
-                progress.update(i + 1, f"Updated {component_name}")
-            else:
-                progress.update(i + 1, f"Failed {component_name}")
-            time.sleep(0.1)  # Brief pause for visual effect
-        
         progress.finish("Update complete")
         
         # Show results
@@ -366,6 +421,14 @@ def run(args: argparse.Namespace) -> int:
             logger.error("Could not determine installed components")
             return 1
         
+        # Health check only
+        if args.verify:
+            if verify_installation(installed_components, registry, args.install_dir):
+                logger.success("Installation verified against manifest")
+                return 0
+            logger.error("Installation verification failed")
+            return 1
+        
         # Check for available updates
         available_updates = get_available_updates(installed_components, registry)
         
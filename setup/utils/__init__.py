@@ -3,6 +3,9 @@
 from .ui import ProgressBar, Menu, confirm, Colors
 from .logger import Logger
 from .security import SecurityValidator
+from .walker import walk, WalkResult
+from .ignore import IgnoreMatcher
+from .progress import create_progress, make_event
 
 __all__ = [
     'ProgressBar',
@@ -10,5 +13,10 @@ __all__ = [
     'confirm',
     'Colors',
     'Logger',
-    'SecurityValidator'
+    'SecurityValidator',
+    'walk',
+    'WalkResult',
+    'IgnoreMatcher',
+    'create_progress',
+    'make_event'
 ]
\ No newline at end of file
@@ -0,0 +1,232 @@
+"""
+Gitignore-style pattern matching for SuperClaude installation system
+All patterns are compiled into one regex per entry type, so checking a path
+costs a single regex match no matter how many patterns there are
+"""
+
+import os
+import re
+from pathlib import Path
+from typing import Callable, Iterable, List, Optional, Tuple
+
+
+class IgnoreMatcher:
+    """
+    Matches relative paths against gitignore-style patterns
+
+    Supported syntax: blank lines and # comments, ! negation, trailing /
+    for directory-only rules, leading or inner / to anchor a rule to the
+    root, *, ?, [...] and ** (leading, trailing and inner). The last
+    matching rule wins. A matcher is meant to be used while walking, where
+    an ignored directory is never entered, so files below it stay ignored
+    even if a later rule re-includes them (as with git).
+    """
+
+    def __init__(self, patterns: Iterable[str] = ()):
+        """
+        Compile patterns
+
+        Args:
+            patterns: Gitignore-style pattern lines
+        """
+        self.patterns: List[str] = []
+        file_rules: List[Tuple[str, bool]] = []
+        dir_rules: List[Tuple[str, bool]] = []
+
+        for line in patterns:
+            rule = self._parse(line)
+            if rule is None:
+                continue
+
+            file_regex, dir_regex, negated = rule
+            self.patterns.append(line.strip())
+            if file_regex is not None:
+                file_rules.append((file_regex, negated))
+            dir_rules.append((dir_regex, negated))
+
+        self._file_regex, self._file_negated = self._compile(file_rules)
+        self._dir_regex, self._dir_negated = self._compile(dir_rules)
+
+    @classmethod
+    def from_file(cls, ignore_file: Path, extra_patterns: Iterable[str] = ()) -> "IgnoreMatcher":
+        """
+        Build a matcher from an ignore file plus extra patterns
+
+        Args:
+            ignore_file: File with one pattern per line (missing file = no patterns)
+            extra_patterns: Patterns applied before the file's own
+
+        Returns:
+            IgnoreMatcher
+        """
+        lines = list(extra_patterns)
+        try:
+            with open(ignore_file, 'r', encoding='utf-8') as f:
+                lines.extend(f.read().splitlines())
+        except OSError:
+            pass
+        return cls(lines)
+
+    def __bool__(self) -> bool:
+        return bool(self.patterns)
+
+    def __call__(self, rel_path: str, is_dir: bool = False) -> bool:
+        """
+        Check whether a path is ignored by its own rules (parents are not checked)
+
+        Args:
+            rel_path: Posix path relative to the matcher's root
+            is_dir: Whether the path is a directory
+
+        Returns:
+            True if the last matching rule ignores the path
+        """
+        if is_dir:
+            regex, negated = self._dir_regex, self._dir_negated
+        else:
+            regex, negated = self._file_regex, self._file_negated
+
+        if regex is None:
+            return False
+
+        match = regex.fullmatch(rel_path)
+        return match is not None and not negated[match.lastindex - 1]
+
+    def is_ignored(self, rel_path: str, is_dir: bool = False) -> bool:
+        """
+        Check whether a path is ignored, including through an ignored parent directory
+
+        Args:
+            rel_path: Posix path relative to the matcher's root
+            is_dir: Whether the path is a directory
+
+        Returns:
+            True if the path or one of its parent directories is ignored
+        """
+        parts = rel_path.split("/")
+        for depth in range(1, len(parts)):
+            if self("/".join(parts[:depth]), True):
+                return True
+        return self(rel_path, is_dir)
+
+    def copytree_ignore(self, root: Path) -> Callable[[str, List[str]], List[str]]:
+        """
+        Get an ignore callback for shutil.copytree rooted at root
+
+        Entries are only stat()ed when file and directory rules disagree.
+
+        Args:
+            root: Directory being copied
+
+        Returns:
+            Callable(directory, names) -> names to skip
+        """
+        root_str = os.path.abspath(root)
+
+        def ignore(directory: str, names: List[str]) -> List[str]:
+            rel_dir = os.path.relpath(os.path.abspath(directory), root_str)
+            prefix = "" if rel_dir == "." else rel_dir.replace(os.sep, "/") + "/"
+
+            ignored = []
+            for name in names:
+                rel_path = prefix + name
+                as_file = self(rel_path, False)
+                if as_file == self(rel_path, True):
+                    skip = as_file
+                else:
+                    skip = self(rel_path, os.path.isdir(os.path.join(directory, name)))
+                if skip:
+                    ignored.append(name)
+            return ignored
+
+        return ignore
+
+    def _parse(self, line: str) -> Optional[Tuple[Optional[str], str, bool]]:
+        """
+        Turn a pattern line into (file regex, directory regex, negated)
+
+        The file regex is None for directory-only rules; None is returned
+        for blank lines and comments.
+        """
+        line = line.rstrip("\n")
+        if line.endswith("\\ "):
+            line = line[:-2].rstrip() + " "
+        else:
+            line = line.rstrip()
+
+        if not line or line.startswith("#"):
+            return None
+
+        negated = line.startswith("!")
+        if negated:
+            line = line[1:]
+        elif line.startswith("\\#") or line.startswith("\\!"):
+            line = line[1:]
+
+        directory_only = line.endswith("/")
+        line = line.rstrip("/")
+        if not line:
+            return None
+
+        # A slash anywhere but the end anchors the rule to the root
+        anchored = "/" in line
+        line = line.lstrip("/")
+
+        prefix = "" if anchored or line.startswith("**/") else "(?:.*/)?"
+        file_regex = prefix + self._translate(line)
+
+        # Like git, "dir/**" also matches the directory itself (but not a file named dir)
+        dir_regex = file_regex
+        if line.endswith("/**"):
+            dir_regex = prefix + self._translate(line[:-3]) + "(?:/.*)?"
+
+        return (None if directory_only else file_regex), dir_regex, negated
+
+    def _translate(self, pattern: str) -> str:
+        """Translate a glob pattern (without leading/trailing slashes) to a regex"""
+        parts = []
+        i = 0
+        n = len(pattern)
+
+        while i < n:
+            if pattern.startswith("**/", i) and (i == 0 or pattern[i - 1] == "/"):
+                parts.append("(?:.*/)?")
+                i += 3
+            elif pattern.startswith("**", i) and (i == 0 or pattern[i - 1] == "/") and i + 2 == n:
+                parts.append(".*")
+                i += 2
+            elif pattern[i] == "*":
+                parts.append("[^/]*")
+                i += 1
+            elif pattern[i] == "?":
+                parts.append("[^/]")
+                i += 1
+            elif pattern[i] == "[":
+                end = pattern.find("]", i + 2)
+                if end == -1:
+                    parts.append(re.escape("["))
+                    i += 1
+                    continue
+                members = pattern[i + 1:end]
+                if members[0] in "!^":
+                    members = "^" + members[1:]
+                parts.append("[" + members.replace("\\", "\\\\") + "]")
+                i = end + 1
+            elif pattern[i] == "\\" and i + 1 < n:
+                parts.append(re.escape(pattern[i + 1]))
+                i += 2
+            else:
+                parts.append(re.escape(pattern[i]))
+                i += 1
+
+        return "".join(parts)
+
+    def _compile(self, rules: List[Tuple[str, bool]]):
+        """Combine rules into one regex whose matching group identifies the last matching rule"""
+        if not rules:
+            return None, []
+
+        # Alternatives are tried in reverse so the first one to match is the last rule
+        ordered = list(reversed(rules))
+        regex = re.compile("|".join(f"({rule_regex})" for rule_regex, _ in ordered), re.DOTALL)
+        return regex, [negated for _, negated in ordered]
@@ -2,13 +2,20 @@
 Logging system for SuperClaude installation suite
 """
 
+import atexit
 import logging
+import os
+import queue
 import sys
+import threading
+import time
 from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Callable, List, Optional, Dict, Any, Union
 from enum import Enum
 
+from .profiling import get_profiler
 from .ui import Colors
 
 
@@ -21,10 +28,156 @@ class LogLevel(Enum):
     CRITICAL = logging.CRITICAL
 
 
+class ColorFormatter(logging.Formatter):
+    """Console formatter with a colored prefix per level"""
+    
+    # Color and prefix per level name, built once
+    TEMPLATES = {
+        'DEBUG': Colors.WHITE + '[DEBUG] ',
+        'INFO': Colors.BLUE + '[INFO] ',
+        'WARNING': Colors.YELLOW + '[!] ',
+        'ERROR': Colors.RED + '[✗] ',
+        'CRITICAL': Colors.RED + Colors.BRIGHT + '[CRITICAL] '
+    }
+    SUCCESS_TEMPLATE = Colors.GREEN + '[✓] '
+    DEFAULT_TEMPLATE = Colors.WHITE + '[LOG] '
+    
+    def format(self, record: logging.LogRecord) -> str:
+        if getattr(record, 'success', False):
+            template = self.SUCCESS_TEMPLATE
+        else:
+            template = self.TEMPLATES.get(record.levelname, self.DEFAULT_TEMPLATE)
+        return f"{template}{record.getMessage()}{Colors.RESET}"
+
+
+class BufferedRotatingFileHandler(logging.Handler):
+    """
+    File handler that buffers formatted records and rotates by size
+    
+    Records are written once the buffer holds buffer_size bytes, immediately
+    for records at flush_level or above, and on flush/close. Meant to run on a
+    QueueListener thread so disk I/O never blocks the thread doing the work.
+    """
+    
+    def __init__(self, filename: Path, max_bytes: int = 5 * 1024 * 1024, backup_count: int = 3,
+                 buffer_size: int = 64 * 1024, flush_level: int = logging.ERROR,
+                 on_open: Optional[Callable[[], None]] = None):
+        """
+        Initialize buffered file handler
+        
+        Args:
+            filename: Log file path
+            max_bytes: Rotate once the file would grow past this size (0 disables rotation)
+            backup_count: Number of rotated files to keep (filename.1 ... filename.N)
+            buffer_size: Bytes to buffer before writing
+            flush_level: Records at or above this level are written immediately
+            on_open: Called once when the file is first opened (log housekeeping)
+        """
+        super().__init__()
+        self.filename = Path(filename)
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.buffer_size = buffer_size
+        self.flush_level = flush_level
+        self.on_open = on_open
+        self._buffer: List[str] = []
+        self._buffered = 0
+        self._stream = None
+        self._size = 0
+    
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            line = self.format(record) + "\n"
+        except Exception:
+            self.handleError(record)
+            return
+        
+        self._buffer.append(line)
+        self._buffered += len(line)
+        if self._buffered >= self.buffer_size or record.levelno >= self.flush_level:
+            self.flush()
+    
+    def flush(self) -> None:
+        """Write buffered records to disk"""
+        self.acquire()
+        try:
+            if not self._buffer:
+                return
+            data = "".join(self._buffer)
+            self._buffer.clear()
+            self._buffered = 0
+            
+            try:
+                if self._stream is None:
+                    self._open()
+                if self.max_bytes and self._size and self._size + len(data) > self.max_bytes:
+                    self._rotate()
+                self._stream.write(data)
+                self._stream.flush()
+                self._size += len(data.encode('utf-8'))
+            except Exception:
+                pass  # Losing log lines must never fail the installation
+        finally:
+            self.release()
+    
+    def close(self) -> None:
+        """Flush and close the log file"""
+        self.acquire()
+        try:
+            self.flush()
+            if self._stream is not None:
+                self._stream.close()
+                self._stream = None
+        finally:
+            self.release()
+        super().close()
+    
+    def _open(self) -> None:
+        """Open the log file for appending"""
+        self._stream = open(self.filename, 'a', encoding='utf-8')
+        self._size = self._stream.tell()
+        if self.on_open is not None:
+            on_open, self.on_open = self.on_open, None
+            on_open()
+    
+    def _rotate(self) -> None:
+        """Shift filename -> filename.1 -> ... and start a new file"""
+        self._stream.close()
+        self._stream = None
+        
+        if self.backup_count > 0:
+            for i in range(self.backup_count - 1, 0, -1):
+                source = f"{self.filename}.{i}"
+                if os.path.exists(source):
+                    os.replace(source, f"{self.filename}.{i + 1}")
+            os.replace(self.filename, f"{self.filename}.1")
+        else:
+            os.remove(self.filename)
+        
+        self._open()
+
+
+class _LogListener(QueueListener):
+    """QueueListener that also services flush requests"""
+    
+    def handle(self, record) -> None:
+        # A flush request is an Event the caller waits on
+        if isinstance(record, threading.Event):
+            for handler in self.handlers:
+                handler.flush()
+            record.set()
+            return
+        super().handle(record)
+
+
 class Logger:
     """Enhanced logger with console and file output"""
     
-    def __init__(self, name: str = "superclaude", log_dir: Optional[Path] = None, console_level: LogLevel = LogLevel.INFO, file_level: LogLevel = LogLevel.DEBUG):
+    # Seconds Logger.flush() waits for the listener thread
+    FLUSH_TIMEOUT = 5.0
+    
+    def __init__(self, name: str = "superclaude", log_dir: Optional[Path] = None, console_level: LogLevel = LogLevel.INFO, file_level: LogLevel = LogLevel.DEBUG,
+                 queued: bool = True, max_bytes: int = 5 * 1024 * 1024, backup_count: int = 3):
         """
         Initialize logger
         
@@ -33,16 +186,26 @@ class Logger:
             log_dir: Directory for log files (defaults to ~/.claude/logs)
             console_level: Minimum level for console output
             file_level: Minimum level for file output
+            queued: Write the log file from a background thread instead of inline
+            max_bytes: Rotate the log file once it reaches this size
+            backup_count: Number of rotated log files to keep
         """
         self.name = name
         self.log_dir = log_dir or (Path.home() / ".claude" / "logs")
         self.console_level = console_level
         self.file_level = file_level
+        self.queued = queued
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
         self.session_start = datetime.now()
+        self.log_file: Optional[Path] = None
+        self.file_handler: Optional[BufferedRotatingFileHandler] = None
+        self._queue_handler: Optional[QueueHandler] = None
+        self._listener: Optional[_LogListener] = None
         
         # Create logger
         self.logger = logging.getLogger(name)
-        self.logger.setLevel(logging.DEBUG)  # Accept all levels, handlers will filter
+        self.logger.setLevel(logging.DEBUG)  # Lowered to the handlers' minimum once they exist
         
         # Remove existing handlers to avoid duplicates
         self.logger.handlers.clear()
@@ -50,6 +213,7 @@ class Logger:
         # Setup handlers
         self._setup_console_handler()
         self._setup_file_handler()
+        self._update_logger_level()
         
         self.log_counts: Dict[str, int] = {
             'debug': 0,
@@ -63,33 +227,6 @@ class Logger:
         """Setup colorized console handler"""
         handler = logging.StreamHandler(sys.stdout)
         handler.setLevel(self.console_level.value)
-        
-        # Custom formatter with colors
-        class ColorFormatter(logging.Formatter):
-            def format(self, record):
-                # Color mapping
-                colors = {
-                    'DEBUG': Colors.WHITE,
-                    'INFO': Colors.BLUE,
-                    'WARNING': Colors.YELLOW,
-                    'ERROR': Colors.RED,
-                    'CRITICAL': Colors.RED + Colors.BRIGHT
-                }
-                
-                # Prefix mapping
-                prefixes = {
-                    'DEBUG': '[DEBUG]',
-                    'INFO': '[INFO]',
-                    'WARNING': '[!]',
-                    'ERROR': '[✗]',
-                    'CRITICAL': '[CRITICAL]'
-                }
-                
-                color = colors.get(record.levelname, Colors.WHITE)
-                prefix = prefixes.get(record.levelname, '[LOG]')
-                
-                return f"{color}{prefix} {record.getMessage()}{Colors.RESET}"
-        
         handler.setFormatter(ColorFormatter())
         self.logger.addHandler(handler)
     
@@ -103,7 +240,14 @@ class Logger:
             timestamp = self.session_start.strftime("%Y%m%d_%H%M%S")
             log_file = self.log_dir / f"{self.name}_{timestamp}.log"
             
-            handler = logging.FileHandler(log_file, encoding='utf-8')
+            # Clean up old log files (keep last 10) once the file is first written
+            handler = BufferedRotatingFileHandler(
+                log_file,
+                max_bytes=self.max_bytes,
+                backup_count=self.backup_count,
+                buffer_size=64 * 1024 if self.queued else 0,
+                on_open=self._cleanup_old_logs
+            )
             handler.setLevel(self.file_level.value)
             
             # Detailed formatter for files
@@ -112,17 +256,26 @@ class Logger:
                 datefmt='%Y-%m-%d %H:%M:%S'
             )
             handler.setFormatter(formatter)
-            
-            self.logger.addHandler(handler)
+            self.file_handler = handler
             self.log_file = log_file
             
-            # Clean up old log files (keep last 10)
-            self._cleanup_old_logs()
+            if self.queued:
+                # Callers only enqueue; the listener thread formats, buffers, writes and rotates
+                log_queue: queue.SimpleQueue = queue.SimpleQueue()
+                self._queue_handler = QueueHandler(log_queue)
+                self._queue_handler.setLevel(self.file_level.value)
+                self._listener = _LogListener(log_queue, handler, respect_handler_level=True)
+                self._listener.start()
+                self.logger.addHandler(self._queue_handler)
+                atexit.register(self.shutdown)
+            else:
+                self.logger.addHandler(handler)
             
         except Exception as e:
             # If file logging fails, continue with console only
             print(f"{Colors.YELLOW}[!] Could not setup file logging: {e}{Colors.RESET}")
             self.log_file = None
+            self.file_handler = None
     
     def _cleanup_old_logs(self, keep_count: int = 10) -> None:
         """Clean up old log files"""
@@ -143,51 +296,58 @@ class Logger:
         except Exception:
             pass  # Ignore cleanup errors
     
-    def debug(self, message: str, **kwargs) -> None:
-        """Log debug message"""
-        self.logger.debug(message, **kwargs)
-        self.log_counts['debug'] += 1
+    def _update_logger_level(self) -> None:
+        """Set the logger's level to the lowest handler level so filtered calls return early"""
+        level = self.console_level.value
+        if self.file_handler is not None:
+            level = min(level, self.file_level.value)
+        self.logger.setLevel(level)
     
-    def info(self, message: str, **kwargs) -> None:
+    def _log(self, level: int, count_key: str, message: Union[str, Callable[[], str]],
+             args: tuple, kwargs: Dict[str, Any]) -> None:
+        """
+        Count a record and emit it if any handler accepts its level
+        
+        The message is only built when the record is emitted: %-style args
+        are merged by logging, and a callable message is called.
+        """
+        self.log_counts[count_key] += 1
+        if not self.logger.isEnabledFor(level):
+            return
+        if callable(message):
+            message = message()
+        self.logger.log(level, message, *args, **kwargs)
+    
+    def is_enabled(self, level: LogLevel) -> bool:
+        """Check whether a message at level would be emitted (guards costly log arguments)"""
+        return self.logger.isEnabledFor(level.value)
+    
+    def debug(self, message: Union[str, Callable[[], str]], *args, **kwargs) -> None:
+        """Log debug message (lazy: use %-style args or a callable)"""
+        self._log(logging.DEBUG, 'debug', message, args, kwargs)
+    
+    def info(self, message: Union[str, Callable[[], str]], *args, **kwargs) -> None:
         """Log info message"""
-        self.logger.info(message, **kwargs)
-        self.log_counts['info'] += 1
+        self._log(logging.INFO, 'info', message, args, kwargs)
     
-    def warning(self, message: str, **kwargs) -> None:
+    def warning(self, message: Union[str, Callable[[], str]], *args, **kwargs) -> None:
         """Log warning message"""
-        self.logger.warning(message, **kwargs)
-        self.log_counts['warning'] += 1
+        self._log(logging.WARNING, 'warning', message, args, kwargs)
     
-    def error(self, message: str, **kwargs) -> None:
+    def error(self, message: Union[str, Callable[[], str]], *args, **kwargs) -> None:
         """Log error message"""
-        self.logger.error(message, **kwargs)
-        self.log_counts['error'] += 1
+        self._log(logging.ERROR, 'error', message, args, kwargs)
     
-    def critical(self, message: str, **kwargs) -> None:
+    def critical(self, message: Union[str, Callable[[], str]], *args, **kwargs) -> None:
         """Log critical message"""
-        self.logger.critical(message, **kwargs)
-        self.log_counts['critical'] += 1
+        self._log(logging.CRITICAL, 'critical', message, args, kwargs)
     
-    def success(self, message: str, **kwargs) -> None:
-        """Log success message (info level with special formatting)"""
-        # Use a custom success formatter for console
-        if self.logger.handlers:
-            console_handler = self.logger.handlers[0]
-            if hasattr(console_handler, 'formatter'):
-                original_format = console_handler.formatter.format
-                
-                def success_format(record):
-                    return f"{Colors.GREEN}[✓] {record.getMessage()}{Colors.RESET}"
-                
-                console_handler.formatter.format = success_format
-                self.logger.info(message, **kwargs)
-                console_handler.formatter.format = original_format
-            else:
-                self.logger.info(f"SUCCESS: {message}", **kwargs)
-        else:
-            self.logger.info(f"SUCCESS: {message}", **kwargs)
-        
-        self.log_counts['info'] += 1
+    def success(self, message: Union[str, Callable[[], str]], *args, **kwargs) -> None:
+        """Log success message (info level, shown with a check mark on the console)"""
+        extra = dict(kwargs.pop('extra', None) or {})
+        extra['success'] = True
+        kwargs['extra'] = extra
+        self._log(logging.INFO, 'info', message, args, kwargs)
     
     def step(self, step: int, total: int, message: str, **kwargs) -> None:
         """Log step progress"""
@@ -220,10 +380,15 @@ class Logger:
                 self.info(f"{key}: {value}")
     
     def log_operation_end(self, operation: str, success: bool, duration: float, details: Optional[Dict[str, Any]] = None) -> None:
-        """Log end of operation"""
+        """Log end of operation (also recorded as a span when profiling is enabled)"""
         status = "SUCCESS" if success else "FAILED"
         self.info(f"Operation {operation} completed: {status} (Duration: {duration:.2f}s)")
         
+        profiler = get_profiler()
+        if profiler is not None:
+            profiler.record(f"operation.{operation}", "operation", time.perf_counter() - duration,
+                            duration, success=success, **(details or {}))
+        
         if details:
             for key, value in details.items():
                 self.info(f"{key}: {value}")
@@ -237,7 +402,7 @@ class Logger:
             'runtime_seconds': runtime.total_seconds(),
             'log_counts': self.log_counts.copy(),
             'total_messages': sum(self.log_counts.values()),
-            'log_file': str(self.log_file) if hasattr(self, 'log_file') and self.log_file else None,
+            'log_file': str(self.log_file) if self.log_file else None,
             'has_errors': self.log_counts['error'] + self.log_counts['critical'] > 0
         }
     
@@ -246,18 +411,45 @@ class Logger:
         self.console_level = level
         if self.logger.handlers:
             self.logger.handlers[0].setLevel(level.value)
+        self._update_logger_level()
     
     def set_file_level(self, level: LogLevel) -> None:
         """Change file logging level"""
         self.file_level = level
-        if len(self.logger.handlers) > 1:
-            self.logger.handlers[1].setLevel(level.value)
+        if self._queue_handler is not None:
+            self._queue_handler.setLevel(level.value)
+        if self.file_handler is not None:
+            self.file_handler.setLevel(level.value)
+        self._update_logger_level()
     
     def flush(self) -> None:
-        """Flush all handlers"""
+        """Flush all handlers, waiting for queued records to reach the log file"""
         for handler in self.logger.handlers:
             if hasattr(handler, 'flush'):
                 handler.flush()
+        
+        if self._listener is not None and self._listener._thread is not None:
+            done = threading.Event()
+            self._listener.queue.put_nowait(done)
+            done.wait(self.FLUSH_TIMEOUT)
+    
+    def shutdown(self) -> None:
+        """Drain the log queue and close the log file (safe to call more than once)"""
+        if self._listener is not None:
+            if self._listener._thread is not None:
+                self._listener.stop()
+            self._listener = None
+            atexit.unregister(self.shutdown)
+        
+        if self._queue_handler is not None:
+            self.logger.removeHandler(self._queue_handler)
+            self._queue_handler = None
+        
+        if self.file_handler is not None:
+            self.logger.removeHandler(self.file_handler)
+            self.file_handler.close()
+            self.file_handler = None
+            self._update_logger_level()
     
     def close(self) -> None:
         """Close logger and handlers"""
@@ -273,6 +465,7 @@ class Logger:
             self.info(f"Full log saved to: {stats['log_file']}")
         
         # Close all handlers
+        self.shutdown()
         for handler in self.logger.handlers[:]:
             handler.close()
             self.logger.removeHandler(handler)
@@ -287,6 +480,8 @@ def get_logger(name: str = "superclaude") -> Logger:
     global _global_logger
     
     if _global_logger is None or _global_logger.name != name:
+        if _global_logger is not None:
+            _global_logger.shutdown()
         _global_logger = Logger(name)
     
     return _global_logger
@@ -295,36 +490,38 @@ def get_logger(name: str = "superclaude") -> Logger:
 def setup_logging(name: str = "superclaude", log_dir: Optional[Path] = None, console_level: LogLevel = LogLevel.INFO, file_level: LogLevel = LogLevel.DEBUG) -> Logger:
     """Setup logging with specified configuration"""
     global _global_logger
+    if _global_logger is not None:
+        _global_logger.shutdown()
     _global_logger = Logger(name, log_dir, console_level, file_level)
     return _global_logger
 
 
 # Convenience functions using global logger
-def debug(message: str, **kwargs) -> None:
+def debug(message: Union[str, Callable[[], str]], *args, **kwargs) -> None:
     """Log debug message using global logger"""
-    get_logger().debug(message, **kwargs)
+    get_logger().debug(message, *args, **kwargs)
 
 
-def info(message: str, **kwargs) -> None:
+def info(message: Union[str, Callable[[], str]], *args, **kwargs) -> None:
     """Log info message using global logger"""
-    get_logger().info(message, **kwargs)
+    get_logger().info(message, *args, **kwargs)
 
 
-def warning(message: str, **kwargs) -> None:
+def warning(message: Union[str, Callable[[], str]], *args, **kwargs) -> None:
     """Log warning message using global logger"""
-    get_logger().warning(message, **kwargs)
+    get_logger().warning(message, *args, **kwargs)
 
 
-def error(message: str, **kwargs) -> None:
+def error(message: Union[str, Callable[[], str]], *args, **kwargs) -> None:
     """Log error message using global logger"""
-    get_logger().error(message, **kwargs)
+    get_logger().error(message, *args, **kwargs)
 
 
-def critical(message: str, **kwargs) -> None:
+def critical(message: Union[str, Callable[[], str]], *args, **kwargs) -> None:
     """Log critical message using global logger"""
-    get_logger().critical(message, **kwargs)
+    get_logger().critical(message, *args, **kwargs)
 
 
-def success(message: str, **kwargs) -> None:
+def success(message: Union[str, Callable[[], str]], *args, **kwargs) -> None:
     """Log success message using global logger"""
-    get_logger().success(message, **kwargs)
\ No newline at end of file
+    get_logger().success(message, *args, **kwargs)
\ No newline at end of file
@@ -0,0 +1,259 @@
+"""
+Timing spans and profiling for SuperClaude installation system
+Instrumented code calls span()/timed(); nothing is recorded unless a
+Profiler has been enabled (e.g. by --profile-out), so the hooks cost one
+global lookup when profiling is off
+"""
+
+import cProfile
+import functools
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+
+class Span:
+    """One timed region"""
+
+    __slots__ = ("name", "category", "start", "duration", "thread_id", "thread_name", "args")
+
+    def __init__(self, name: str, category: str, start: float, duration: float,
+                 args: Optional[Dict[str, Any]] = None):
+        thread = threading.current_thread()
+        self.name = name
+        self.category = category
+        self.start = start
+        self.duration = duration
+        self.thread_id = thread.ident or 0
+        self.thread_name = thread.name
+        self.args = args or {}
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Get span as a JSON-serializable dict (times in seconds)"""
+        return {
+            "name": self.name,
+            "category": self.category,
+            "start": self.start,
+            "duration": self.duration,
+            "thread": self.thread_name,
+            "args": self.args
+        }
+
+
+class Profiler:
+    """Collects spans from any thread and exports them as JSON or Chrome trace events"""
+
+    def __init__(self, capture_cprofile: bool = False):
+        """
+        Initialize profiler
+
+        Args:
+            capture_cprofile: Also run cProfile on the thread that enables it
+        """
+        self.spans: List[Span] = []
+        self.origin = time.perf_counter()
+        self.started_at = time.time()
+        self._lock = threading.Lock()
+        self.cprofile: Optional[cProfile.Profile] = cProfile.Profile() if capture_cprofile else None
+
+    def record(self, name: str, category: str, start: float, duration: float, **args: Any) -> None:
+        """
+        Record a finished span
+
+        Args:
+            name: Span name (e.g. "component.install")
+            category: Span category (e.g. "component", "file", "backup")
+            start: perf_counter() value when the span started
+            duration: Span duration in seconds
+            **args: Extra span details
+        """
+        span = Span(name, category, start - self.origin, duration, args)
+        with self._lock:
+            self.spans.append(span)
+
+    @contextmanager
+    def span(self, name: str, category: str = "", **args: Any) -> Iterator[Dict[str, Any]]:
+        """
+        Time the enclosed block
+
+        Yields the span's args dict so the block can add results to it.
+        """
+        start = time.perf_counter()
+        try:
+            yield args
+        finally:
+            self.record(name, category, start, time.perf_counter() - start, **args)
+
+    def summary(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Aggregate spans by name
+
+        Returns:
+            Dict of span name -> count, total, mean and max duration (seconds)
+        """
+        summary: Dict[str, Dict[str, Any]] = {}
+        with self._lock:
+            spans = list(self.spans)
+
+        for span in spans:
+            entry = summary.setdefault(span.name, {"category": span.category, "count": 0,
+                                                   "total": 0.0, "max": 0.0})
+            entry["count"] += 1
+            entry["total"] += span.duration
+            entry["max"] = max(entry["max"], span.duration)
+
+        for entry in summary.values():
+            entry["mean"] = entry["total"] / entry["count"]
+
+        return dict(sorted(summary.items(), key=lambda item: item[1]["total"], reverse=True))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Get all spans plus a per-name summary"""
+        with self._lock:
+            spans = [span.to_dict() for span in self.spans]
+        return {
+            "started_at": self.started_at,
+            "pid": os.getpid(),
+            "summary": self.summary(),
+            "spans": spans
+        }
+
+    def to_chrome_trace(self) -> Dict[str, Any]:
+        """Get spans in Chrome trace-event format (chrome://tracing, Perfetto)"""
+        pid = os.getpid()
+        events: List[Dict[str, Any]] = []
+        threads: Dict[int, str] = {}
+
+        with self._lock:
+            spans = list(self.spans)
+
+        for span in spans:
+            threads[span.thread_id] = span.thread_name
+            events.append({
+                "name": span.name,
+                "cat": span.category,
+                "ph": "X",
+                "ts": round(span.start * 1e6, 3),
+                "dur": round(span.duration * 1e6, 3),
+                "pid": pid,
+                "tid": span.thread_id,
+                "args": span.args
+            })
+
+        for thread_id, thread_name in threads.items():
+            events.append({"name": "thread_name", "ph": "M", "pid": pid, "tid": thread_id,
+                           "args": {"name": thread_name}})
+
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def write(self, output: Path, trace_format: str = "chrome") -> List[Path]:
+        """
+        Write the profile
+
+        Args:
+            output: Output file
+            trace_format: "chrome" for trace events, "json" for spans plus summary
+
+        Returns:
+            Files written (the cProfile stats go next to output as .prof)
+        """
+        output = Path(output)
+        output.parent.mkdir(parents=True, exist_ok=True)
+
+        data = self.to_chrome_trace() if trace_format == "chrome" else self.to_dict()
+        with open(output, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=None if trace_format == "chrome" else 2, default=str)
+        written = [output]
+
+        if self.cprofile is not None:
+            stats_file = output.with_suffix(".prof")
+            self.cprofile.dump_stats(str(stats_file))
+            written.append(stats_file)
+
+        return written
+
+
+# Active profiler (None = profiling off)
+_profiler: Optional[Profiler] = None
+
+
+def enable_profiling(capture_cprofile: bool = False) -> Profiler:
+    """
+    Start collecting spans (and optionally cProfile data) for this process
+
+    Args:
+        capture_cprofile: Also run cProfile on the calling thread
+
+    Returns:
+        The active Profiler
+    """
+    global _profiler
+    _profiler = Profiler(capture_cprofile)
+    if _profiler.cprofile is not None:
+        _profiler.cprofile.enable()
+    return _profiler
+
+
+def disable_profiling() -> Optional[Profiler]:
+    """
+    Stop collecting
+
+    Returns:
+        The profiler that was active, with everything it recorded
+    """
+    global _profiler
+    profiler, _profiler = _profiler, None
+    if profiler is not None and profiler.cprofile is not None:
+        profiler.cprofile.disable()
+    return profiler
+
+
+def get_profiler() -> Optional[Profiler]:
+    """Get the active profiler, if any"""
+    return _profiler
+
+
+@contextmanager
+def span(name: str, category: str = "", **args: Any) -> Iterator[Dict[str, Any]]:
+    """
+    Time the enclosed block if profiling is enabled
+
+    Yields a dict the block may add results to (ignored when profiling is off).
+    """
+    profiler = _profiler
+    if profiler is None:
+        yield args
+        return
+
+    with profiler.span(name, category, **args) as span_args:
+        yield span_args
+
+
+def timed(name: str, category: str = "") -> Callable[[Callable], Callable]:
+    """
+    Decorator that records a span for every call while profiling is enabled
+
+    Args:
+        name: Span name
+        category: Span category
+    """
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            profiler = _profiler
+            if profiler is None:
+                return func(*args, **kwargs)
+
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                profiler.record(name, category, start, time.perf_counter() - start)
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,112 @@
+"""
+Structured progress events for install, update and uninstall
+
+The installer reports progress by calling a sink with event dicts:
+
+    operation_start  operation, components, total
+    component_start  component, action
+    component_end    component, status (installed/updated/removed/failed),
+                     files_copied, files_skipped, bytes_written, duration, errors
+    operation_end    success, duration
+
+Every event also carries "event" and "time". Sinks are plain callables, so a
+ProgressBar, a JSON-lines writer or queue.Queue().put can all consume them.
+JSON lines go to stderr (or --progress-file), never to stdout, which carries
+the human-readable log output.
+"""
+
+import json
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, TextIO
+
+from .ui import ProgressBar
+
+
+ProgressCallback = Callable[[Dict[str, Any]], None]
+
+
+def make_event(event: str, **data: Any) -> Dict[str, Any]:
+    """
+    Build a progress event
+
+    Args:
+        event: Event type
+        **data: Event fields
+
+    Returns:
+        Event dict
+    """
+    data["event"] = event
+    data["time"] = time.time()
+    return data
+
+
+class JsonLinesProgress:
+    """Writes each progress event as one JSON line (for CI and fleet tooling)"""
+
+    def __init__(self, stream: Optional[TextIO] = None, path: Optional[Path] = None):
+        """
+        Initialize JSON-lines progress writer
+
+        Args:
+            stream: Output stream (default: stderr)
+            path: Write to this file instead of a stream (closed by finish())
+        """
+        self._owned = path is not None
+        if path is not None:
+            path = Path(path)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            stream = open(path, 'w', encoding='utf-8')
+        self.stream = stream or sys.stderr
+        self._lock = threading.Lock()
+
+    def __call__(self, event: Dict[str, Any]) -> None:
+        line = json.dumps(event, default=str)
+        with self._lock:
+            if self.stream.closed:
+                return
+            self.stream.write(line + "\n")
+            self.stream.flush()
+
+    def finish(self, message: str = '') -> None:
+        """Close the progress file, if one was opened; operation_end is the last event"""
+        if self._owned:
+            with self._lock:
+                self.stream.close()
+            self._owned = False
+
+
+class NullProgress:
+    """Discards progress events (--no-progress and --quiet)"""
+
+    def __call__(self, event: Dict[str, Any]) -> None:
+        pass
+
+    def finish(self, message: str = '') -> None:
+        pass
+
+
+def create_progress(args: Any, total: int, prefix: str = ''):
+    """
+    Create the progress sink selected on the command line
+
+    Args:
+        args: Parsed arguments (progress, progress_file, no_progress and quiet are honored)
+        total: Number of components
+        prefix: Progress bar prefix
+
+    Returns:
+        Callable progress sink with a finish(message) method
+    """
+    mode = getattr(args, "progress", "bar")
+    if getattr(args, "no_progress", False) or (mode == "bar" and getattr(args, "quiet", False)):
+        mode = "none"
+
+    if mode == "jsonl":
+        return JsonLinesProgress(path=getattr(args, "progress_file", None))
+    if mode == "none":
+        return NullProgress()
+    return ProgressBar(total=total, prefix=prefix)
@@ -29,11 +29,23 @@ Architecture:
 
 import re
 import os
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional, Tuple, Set
+from typing import List, Optional, Tuple, Set, Iterable, Pattern
 import urllib.parse
 
 
+def _compile_alternation(patterns: List[str]) -> Pattern:
+    """Compile a pattern family into a single case-insensitive alternation"""
+    return re.compile("|".join(f"(?:{pattern})" for pattern in patterns), re.IGNORECASE)
+
+
+@lru_cache(maxsize=64)
+def _resolve_base_dir(base_dir: Path) -> Path:
+    """Resolve a base directory once; batches validate many paths against the same few bases"""
+    return base_dir.resolve()
+
+
 class SecurityValidator:
     """Security validation utilities"""
     
@@ -105,6 +117,20 @@ class SecurityValidator:
     MAX_PATH_LENGTH = 4096
     MAX_FILENAME_LENGTH = 255
     
+    # Windows reserved device names
+    WINDOWS_RESERVED_NAMES = frozenset([
+        'CON', 'PRN', 'AUX', 'NUL',
+        'COM1', 'COM2', 'COM3', 'COM4', 'COM5', 'COM6', 'COM7', 'COM8', 'COM9',
+        'LPT1', 'LPT2', 'LPT3', 'LPT4', 'LPT5', 'LPT6', 'LPT7', 'LPT8', 'LPT9'
+    ])
+    
+    # Each pattern family compiled once into a single alternation, so a path
+    # is scanned once per family instead of once per pattern
+    _TRAVERSAL_RE = _compile_alternation(TRAVERSAL_PATTERNS)
+    _WINDOWS_SYSTEM_RE = _compile_alternation(WINDOWS_SYSTEM_PATTERNS)
+    _UNIX_SYSTEM_RE = _compile_alternation(UNIX_SYSTEM_PATTERNS)
+    _DANGEROUS_FILENAME_RE = _compile_alternation(DANGEROUS_FILENAMES)
+    
     @classmethod
     def validate_path(cls, path: Path, base_dir: Optional[Path] = None) -> Tuple[bool, str]:
         """
@@ -132,6 +158,47 @@ class SecurityValidator:
             - is_safe: True if path passes all security checks
             - error_message: Detailed error message with suggestions if validation fails
         """
+        try:
+            base_abs = _resolve_base_dir(base_dir) if base_dir else None
+        except Exception as e:
+            return False, f"Path validation error: {e}"
+        
+        return cls._check_path(path, base_abs)
+    
+    @classmethod
+    def validate_paths(cls, paths: Iterable[Path], base_dir: Optional[Path] = None) -> List[Tuple[bool, str]]:
+        """
+        Validate many paths against the same base directory
+        
+        The base directory is resolved once for the whole batch; each path
+        gets the same checks and messages as validate_path.
+        
+        Args:
+            paths: Paths to validate
+            base_dir: Base directory the paths should be within (optional)
+            
+        Returns:
+            List of (is_safe: bool, error_message: str), in the order of paths
+        """
+        try:
+            base_abs = _resolve_base_dir(base_dir) if base_dir else None
+        except Exception as e:
+            return [(False, f"Path validation error: {e}") for _ in paths]
+        
+        return [cls._check_path(path, base_abs) for path in paths]
+    
+    @classmethod
+    def _check_path(cls, path: Path, base_abs: Optional[Path]) -> Tuple[bool, str]:
+        """
+        Run validate_path checks against an already resolved base directory
+        
+        Args:
+            path: Path to validate
+            base_abs: Resolved base directory (optional)
+            
+        Returns:
+            Tuple of (is_safe: bool, error_message: str)
+        """
         try:
             # Convert to absolute path
             abs_path = path.resolve()
@@ -153,33 +220,34 @@ class SecurityValidator:
             # Always check traversal patterns (platform independent) - use original path string
             # to detect patterns before normalization removes them
             original_str = str(path).lower()
-            for pattern in cls.TRAVERSAL_PATTERNS:
-                if re.search(pattern, original_str, re.IGNORECASE):
-                    return False, cls._get_user_friendly_error_message("traversal", pattern, abs_path)
+            if cls._TRAVERSAL_RE.search(original_str):
+                pattern = cls._first_matching_pattern(cls.TRAVERSAL_PATTERNS, original_str)
+                return False, cls._get_user_friendly_error_message("traversal", pattern, abs_path)
             
-            # Check platform-specific system directory patterns - use original path first, then resolved
-            # Always check both Windows and Unix patterns to handle cross-platform scenarios
+            # Check platform-specific system directory patterns against the original and
+            # resolved path; always check both Windows and Unix patterns to handle
+            # cross-platform scenarios
+            candidates = [original_path_str]
+            if resolved_path_str != original_path_str:
+                candidates.append(resolved_path_str)
             
             # Check Windows system directory patterns
-            for pattern in cls.WINDOWS_SYSTEM_PATTERNS:
-                if (re.search(pattern, original_path_str, re.IGNORECASE) or 
-                    re.search(pattern, resolved_path_str, re.IGNORECASE)):
-                    return False, cls._get_user_friendly_error_message("windows_system", pattern, abs_path)
+            if any(cls._WINDOWS_SYSTEM_RE.search(candidate) for candidate in candidates):
+                pattern = cls._first_matching_pattern(cls.WINDOWS_SYSTEM_PATTERNS, *candidates)
+                return False, cls._get_user_friendly_error_message("windows_system", pattern, abs_path)
             
             # Check Unix system directory patterns
-            for pattern in cls.UNIX_SYSTEM_PATTERNS:
-                if (re.search(pattern, original_path_str, re.IGNORECASE) or 
-                    re.search(pattern, resolved_path_str, re.IGNORECASE)):
-                    return False, cls._get_user_friendly_error_message("unix_system", pattern, abs_path)
+            if any(cls._UNIX_SYSTEM_RE.search(candidate) for candidate in candidates):
+                pattern = cls._first_matching_pattern(cls.UNIX_SYSTEM_PATTERNS, *candidates)
+                return False, cls._get_user_friendly_error_message("unix_system", pattern, abs_path)
             
             # Check for dangerous filenames
-            for pattern in cls.DANGEROUS_FILENAMES:
-                if re.search(pattern, abs_path.name, re.IGNORECASE):
-                    return False, f"Dangerous filename pattern detected: {pattern}"
+            if cls._DANGEROUS_FILENAME_RE.search(abs_path.name):
+                pattern = cls._first_matching_pattern(cls.DANGEROUS_FILENAMES, abs_path.name)
+                return False, f"Dangerous filename pattern detected: {pattern}"
             
             # Check if path is within base directory
-            if base_dir:
-                base_abs = base_dir.resolve()
+            if base_abs:
                 try:
                     abs_path.relative_to(base_abs)
                 except ValueError:
@@ -191,14 +259,8 @@ class SecurityValidator:
             
             # Check for Windows reserved names
             if os.name == 'nt':
-                reserved_names = [
-                    'CON', 'PRN', 'AUX', 'NUL',
-                    'COM1', 'COM2', 'COM3', 'COM4', 'COM5', 'COM6', 'COM7', 'COM8', 'COM9',
-                    'LPT1', 'LPT2', 'LPT3', 'LPT4', 'LPT5', 'LPT6', 'LPT7', 'LPT8', 'LPT9'
-                ]
-                
                 name_without_ext = abs_path.stem.upper()
-                if name_without_ext in reserved_names:
+                if name_without_ext in cls.WINDOWS_RESERVED_NAMES:
                     return False, f"Reserved Windows filename: {name_without_ext}"
             
             return True, "Path is safe"
@@ -206,6 +268,26 @@ class SecurityValidator:
         except Exception as e:
             return False, f"Path validation error: {e}"
     
+    @classmethod
+    def _first_matching_pattern(cls, patterns: List[str], *values: str) -> str:
+        """
+        Find which pattern of a family matched, for error messages
+        
+        Only called after the combined regex matched, so the per-pattern
+        scan is limited to the failure path.
+        
+        Args:
+            patterns: Pattern family, in priority order
+            values: Strings that were checked
+            
+        Returns:
+            First pattern (in family order) matching any of the values
+        """
+        for pattern in patterns:
+            if any(re.search(pattern, value, re.IGNORECASE) for value in values):
+                return pattern
+        return patterns[0]
+    
     @classmethod
     def validate_file_extension(cls, path: Path) -> Tuple[bool, str]:
         """
@@ -261,13 +343,7 @@ class SecurityValidator:
         # Check for Windows reserved names
         if os.name == 'nt':
             name_without_ext = os.path.splitext(filename)[0].upper()
-            reserved_names = [
-                'CON', 'PRN', 'AUX', 'NUL',
-                'COM1', 'COM2', 'COM3', 'COM4', 'COM5', 'COM6', 'COM7', 'COM8', 'COM9',
-                'LPT1', 'LPT2', 'LPT3', 'LPT4', 'LPT5', 'LPT6', 'LPT7', 'LPT8', 'LPT9'
-            ]
-            
-            if name_without_ext in reserved_names:
+            if name_without_ext in cls.WINDOWS_RESERVED_NAMES:
                 filename = f"safe_{filename}"
         
         return filename
@@ -532,16 +608,21 @@ class SecurityValidator:
         """
         errors = []
         
-        for source, target in file_list:
+        # Resolve both base directories once for the whole list
+        sources = [source for source, _ in file_list]
+        targets = [target for _, target in file_list]
+        source_results = cls.validate_paths(sources, base_source_dir)
+        target_results = cls.validate_paths(targets, base_target_dir)
+        
+        for source, target, (source_safe, source_msg), (target_safe, target_msg) in zip(
+                sources, targets, source_results, target_results):
             # Validate source path
-            is_safe, msg = cls.validate_path(source, base_source_dir)
-            if not is_safe:
-                errors.append(f"Invalid source path {source}: {msg}")
+            if not source_safe:
+                errors.append(f"Invalid source path {source}: {source_msg}")
             
             # Validate target path
-            is_safe, msg = cls.validate_path(target, base_target_dir)
-            if not is_safe:
-                errors.append(f"Invalid target path {target}: {msg}")
+            if not target_safe:
+                errors.append(f"Invalid target path {target}: {target_msg}")
             
             # Validate file extension
             is_allowed, msg = cls.validate_file_extension(source)
@@ -6,6 +6,7 @@ Cross-platform console UI with colors and progress indication
 import sys
 import time
 import shutil
+import threading
 from typing import List, Optional, Any, Dict, Union
 from enum import Enum
 
@@ -51,7 +52,11 @@ class Colors:
 class ProgressBar:
     """Cross-platform progress bar with customizable display"""
     
-    def __init__(self, total: int, width: int = 50, prefix: str = '', suffix: str = ''):
+    # Redraws per second; updates in between are coalesced into the next frame
+    MAX_FPS = 15
+    
+    def __init__(self, total: int, width: int = 50, prefix: str = '', suffix: str = '',
+                 max_fps: float = MAX_FPS):
         """
         Initialize progress bar
         
@@ -60,6 +65,7 @@ class ProgressBar:
             width: Width of progress bar in characters
             prefix: Text to display before progress bar
             suffix: Text to display after progress bar
+            max_fps: Maximum redraws per second (0 redraws on every update)
         """
         self.total = total
         self.width = width
@@ -67,6 +73,9 @@ class ProgressBar:
         self.suffix = suffix
         self.current = 0
         self.start_time = time.time()
+        self.min_interval = 1.0 / max_fps if max_fps > 0 else 0.0
+        self._last_draw = 0.0
+        self._lock = threading.RLock()
         
         # Get terminal width for responsive display
         try:
@@ -74,15 +83,45 @@ class ProgressBar:
         except OSError:
             self.terminal_width = 80
     
-    def update(self, current: int, message: str = '') -> None:
+    def __call__(self, event: Dict[str, Any]) -> None:
+        """
+        Consume a progress event from the installer (see setup.utils.progress)
+        
+        Args:
+            event: Event dict with at least an "event" key
+        """
+        kind = event.get("event")
+        if kind == "operation_start":
+            with self._lock:
+                self.total = event.get("total", self.total)
+        elif kind == "component_start":
+            self.update(self.current, f"{event.get('action', 'Processing').capitalize()} {event['component']}")
+        elif kind == "component_end":
+            status = event.get("status", "done")
+            # Components may finish on worker threads, so advance under the lock
+            with self._lock:
+                self.update(self.current + 1, f"{status.capitalize()} {event['component']}",
+                            force=status == "failed")
+    
+    def update(self, current: int, message: str = '', force: bool = False) -> None:
         """
         Update progress bar
         
         Args:
             current: Current progress value
             message: Optional message to display
+            force: Redraw even if the last frame was drawn less than min_interval ago
         """
-        self.current = current
+        with self._lock:
+            self.current = current
+            now = time.time()
+            if not force and current < self.total and now - self._last_draw < self.min_interval:
+                return
+            self._last_draw = now
+            self._draw(current, message)
+    
+    def _draw(self, current: int, message: str) -> None:
+        """Render one frame"""
         percent = min(100, (current / self.total) * 100) if self.total > 0 else 100
         
         # Calculate filled and empty portions
@@ -135,7 +174,7 @@ class ProgressBar:
         Args:
             message: Completion message
         """
-        self.update(self.total, message)
+        self.update(self.total, message, force=True)
         print()  # New line after completion
     
     def _format_time(self, seconds: float) -> str:
@@ -0,0 +1,190 @@
+"""
+Single-pass filesystem walker for SuperClaude installation system
+Built on os.scandir so type checks and stat results come from the directory
+entries instead of extra is_file()/stat() calls per path
+"""
+
+import os
+import stat
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+
+# (absolute path, posix path relative to the walk root, stat result)
+WalkFile = Tuple[Path, str, os.stat_result]
+
+
+class WalkResult:
+    """Files, directories and totals collected by walk()"""
+
+    def __init__(self):
+        self.files: List[WalkFile] = []
+        self.directories: List[Path] = []
+        self.total_size = 0
+        self.file_count = 0
+        self.errors: List[str] = []
+
+    def paths(self) -> List[Path]:
+        """Get file paths in walk order"""
+        return [path for path, _, _ in self.files]
+
+
+class _DirScan:
+    """Entries of one directory, already split and sorted"""
+
+    __slots__ = ("files", "subdirs", "size", "count", "error")
+
+    def __init__(self):
+        self.files: List[Tuple[str, str, os.stat_result]] = []
+        self.subdirs: List[Tuple[str, str]] = []
+        self.size = 0
+        self.count = 0
+        self.error: Optional[str] = None
+
+
+def walk(root: Path,
+         exclude: Iterable[str] = (),
+         ignore: Optional[Callable[[str, bool], bool]] = None,
+         workers: int = 1,
+         collect: bool = True,
+         follow_symlinks: bool = False) -> WalkResult:
+    """
+    Walk a directory tree in one pass
+
+    Symlinks are listed as files; a symlink to a directory is listed with
+    its lstat() result (S_ISLNK) so callers can copy or record the link
+    itself. With follow_symlinks, symlinked directories are walked like
+    real ones instead (each directory at most once, so link cycles end).
+    Results are in the same order for any number of workers: each
+    directory's files sorted by name, then its subdirectories depth-first.
+
+    Args:
+        root: Directory to walk
+        exclude: Paths relative to root (posix) whose subtrees are pruned
+        ignore: Called with (relative posix path, is_dir); True skips the
+            entry, and a skipped directory is not descended into
+        workers: Threads to scan subdirectories with (1 scans inline)
+        collect: Whether to collect file and directory lists (False only totals)
+        follow_symlinks: Descend into symlinked directories (like shutil.copytree)
+
+    Returns:
+        WalkResult (empty if root is not a directory)
+    """
+    result = WalkResult()
+    root_str = os.fspath(root)
+    if not os.path.isdir(root_str):
+        return result
+
+    excluded = frozenset(exclude)
+    scans: Dict[str, _DirScan] = {}
+    visited = _Visited(root_str) if follow_symlinks else None
+
+    def scan(item: Tuple[str, str]) -> Tuple[str, _DirScan]:
+        return item[1], _scan_directory(item[0], item[1], excluded, ignore, collect, visited)
+
+    frontier = [(root_str, "")]
+    if workers > 1:
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="walk") as executor:
+            while frontier:
+                next_frontier = []
+                for rel_dir, dir_scan in executor.map(scan, frontier):
+                    scans[rel_dir] = dir_scan
+                    next_frontier.extend(dir_scan.subdirs)
+                frontier = next_frontier
+    else:
+        while frontier:
+            rel_dir, dir_scan = scan(frontier.pop())
+            scans[rel_dir] = dir_scan
+            frontier.extend(dir_scan.subdirs)
+
+    # Assemble depth-first so the order never depends on scheduling
+    stack = [""]
+    while stack:
+        dir_scan = scans[stack.pop()]
+        result.total_size += dir_scan.size
+        result.file_count += dir_scan.count
+        if dir_scan.error:
+            result.errors.append(dir_scan.error)
+
+        if collect:
+            result.files.extend((Path(path), rel_path, st) for path, rel_path, st in dir_scan.files)
+            result.directories.extend(Path(path) for path, _ in dir_scan.subdirs)
+
+        stack.extend(rel_path for _, rel_path in reversed(dir_scan.subdirs))
+
+    return result
+
+
+class _Visited:
+    """Directories (device, inode) already walked when following symlinks"""
+
+    def __init__(self, root: str):
+        st = os.stat(root)
+        self._seen = {(st.st_dev, st.st_ino)}
+        self._lock = threading.Lock()
+
+    def add(self, entry: os.DirEntry) -> bool:
+        """Mark a directory entry's target as walked; False if it already was"""
+        try:
+            st = entry.stat()
+        except OSError:
+            return False
+        with self._lock:
+            key = (st.st_dev, st.st_ino)
+            if key in self._seen:
+                return False
+            self._seen.add(key)
+            return True
+
+
+def _scan_directory(path: str, rel_dir: str, excluded: frozenset,
+                    ignore: Optional[Callable[[str, bool], bool]], collect: bool,
+                    visited: Optional[_Visited] = None) -> _DirScan:
+    """Scan a single directory (no recursion)"""
+    dir_scan = _DirScan()
+    prefix = f"{rel_dir}/" if rel_dir else ""
+
+    try:
+        with os.scandir(path) as entries:
+            entries = sorted(entries, key=lambda entry: entry.name)
+    except OSError as e:
+        dir_scan.error = f"{path}: {e}"
+        return dir_scan
+
+    for entry in entries:
+        rel_path = prefix + entry.name
+        try:
+            is_dir = entry.is_dir()
+        except OSError:
+            is_dir = False
+
+        if is_dir:
+            if rel_path in excluded or (ignore is not None and ignore(rel_path, True)):
+                continue
+            if visited is not None:
+                if visited.add(entry):
+                    dir_scan.subdirs.append((entry.path, rel_path))
+                continue
+            if not entry.is_symlink():
+                dir_scan.subdirs.append((entry.path, rel_path))
+                continue
+        elif ignore is not None and ignore(rel_path, False):
+            continue
+
+        try:
+            st = entry.stat(follow_symlinks=not is_dir)
+        except OSError:
+            try:
+                st = entry.stat(follow_symlinks=False)  # Broken symlink
+            except OSError:
+                continue  # Vanished since scandir
+
+        if stat.S_ISREG(st.st_mode):
+            dir_scan.size += st.st_size
+        dir_scan.count += 1
+        if collect:
+            dir_scan.files.append((entry.path, rel_path, st))
+
+    return dir_scan